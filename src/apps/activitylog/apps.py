@@ -4,3 +4,33 @@ from django.apps import AppConfig
 class ActivitylogConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.activitylog'
+
+    def ready(self) -> None:
+        from celery.signals import worker_process_shutdown, worker_shutdown
+        from core.services.outbox import (
+            register_batch_consumer,
+            register_batch_context,
+            register_consumer,
+            register_dispatch_context,
+        )
+        from apps.activitylog import consumers
+        from apps.activitylog.services import task_events
+        from apps.activitylog.services.log_writer import log_writer
+
+        # Buffered logs are written before a worker process exits
+        worker_process_shutdown.connect(lambda **kwargs: log_writer.flush(), weak=False)
+        worker_shutdown.connect(lambda **kwargs: log_writer.flush(), weak=False)
+
+        register_batch_consumer(task_events.TASK_UPDATED, consumers.consume_task_updated_batch)
+        register_batch_consumer(task_events.TASK_CHANGED, consumers.consume_task_updated_batch)
+        register_consumer(
+            task_events.TASK_ASSIGNEES_CHANGED, consumers.consume_task_assignees_changed
+        )
+        register_consumer(task_events.TASK_TAGS_CHANGED, consumers.consume_task_tags_changed)
+        register_consumer(task_events.TASKS_CREATED, consumers.consume_tasks_created)
+        register_consumer(task_events.TASKS_BULK_UPDATED, consumers.consume_tasks_bulk_updated)
+        # Logs of a failed dispatch are dropped with its savepoint, the logs of a relayed
+        # batch are written in its transaction, with the removal of its events
+        register_dispatch_context(log_writer.deferred)
+        register_batch_context(log_writer.batch)
+        return super().ready()
@@ -1,9 +1,12 @@
 from celery import shared_task
+from django_celery_beat.models import PeriodicTask, IntervalSchedule
 from django.contrib.auth import get_user_model
 from django.core import serializers
+from django.utils import timezone
 
 from apps.activitylog.services.log_creator_m2m import TaskAssigneesLogCreator, TaskTagsLogCreator
-from apps.activitylog.services.task_log_creator import TaskLogCreator
+from apps.activitylog.consumers import consume_task_changed
+from apps.activitylog.services.task_log_creator import TaskLogCreator, TasksCreatedLogCreator
 from apps.projects.models.tasks import Task
 
 User = get_user_model()
@@ -24,6 +27,11 @@ def create_task_log(instance_id, update_fields):
     serializered_logs = serializers.serialize('json', tasks_logs)
     return serializered_logs
 
+@shared_task
+def process_task_changed_event(event):
+    """Task change events sent before the outbox, see `core/services/outbox.py`"""
+    consume_task_changed(event)
+
 @shared_task
 def create_task_tags_log(task_id, objects_ids, action):
     try:
@@ -56,4 +64,49 @@ def create_task_assignees_log(task_id, objects_ids, action):
     )
     task_log = task_log()
     serializered_logs = serializers.serialize('json', task_log)
-    return serializered_logs
\ No newline at end of file
+    return serializered_logs
+
+
+@shared_task
+def create_tasks_created_log(tasks_ids, user_id):
+    task_logs = TasksCreatedLogCreator(tasks_ids=tasks_ids, user_id=user_id)()
+    return len(task_logs)
+
+
+"""Management"""
+def create_task_to_maintain_task_log_partitions():
+    PeriodicTask.objects.get_or_create(
+        name="Maintain_task_log_partitions",
+        defaults={
+            "task": "maintain_task_log_partitions",
+            "interval": IntervalSchedule.objects.get_or_create(every=1, period="days")[0],
+            "start_time": timezone.now(),
+        },
+    )
+
+
+@shared_task(name="maintain_task_log_partitions")
+def maintain_task_log_partitions():
+    """Creating the next monthly log partitions and removing the expired logs"""
+    from apps.activitylog.services.log_partitions import TaskLogPartitionService
+
+    return TaskLogPartitionService()()
+
+
+def create_task_to_compact_task_logs():
+    PeriodicTask.objects.get_or_create(
+        name="Compact_task_logs",
+        defaults={
+            "task": "compact_task_logs",
+            "interval": IntervalSchedule.objects.get_or_create(every=1, period="hours")[0],
+            "start_time": timezone.now(),
+        },
+    )
+
+
+@shared_task(name="compact_task_logs")
+def compact_task_logs():
+    """Merging the repeated changes of one field logged since the previous run"""
+    from apps.activitylog.services.log_compaction import compact_recent_logs
+
+    return compact_recent_logs()
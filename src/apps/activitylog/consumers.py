@@ -0,0 +1,96 @@
+"""Outbox consumers of the task events, registered in `ActivitylogConfig.ready`"""
+from apps.activitylog.services.log_creator_m2m import TaskAssigneesLogCreator, TaskTagsLogCreator
+from apps.activitylog.services.task_events_batch import TaskEventsBatchService
+from apps.activitylog.services.task_log_creator import TaskChangedLogCreator, TasksCreatedLogCreator
+from apps.notification.services.notification_creator import (
+    NotificationCreatorService,
+    TaskAssigneesNotificationService,
+    create_task_logs_notifications,
+)
+from apps.projects.services.tasks_subscribe import (
+    SubscribeUserToTaskService,
+    UnsubscribeUserToTaskService,
+)
+
+
+def consume_task_updated_batch(events: list[dict]) -> None:
+    """Events of one task and unit of work each, see `collect_task_events`"""
+    TaskEventsBatchService(events=events)()
+
+
+def consume_task_changed(event: dict) -> None:
+    logs = TaskChangedLogCreator(event=event)()
+    create_task_logs_notifications(logs, event["recipients"])
+
+
+def consume_task_assignees_changed(event: dict) -> None:
+    if event["action"] == "post_add":
+        # Subscribe users, and send mention notification
+        SubscribeUserToTaskService(users=event["objects"], task=event["task"])()
+        TaskAssigneesNotificationService(
+            users=event["objects"],
+            workspace=event["workspace"],
+            notification_type=1,
+            triggered_by=event["actor"],
+            message="You have been added to the task assignees",
+            entity_type="task",
+            entity_identifier=event["task"],
+        )()
+    else:
+        UnsubscribeUserToTaskService(users=event["objects"], task=event["task"])()
+
+    logs = TaskAssigneesLogCreator(
+        task=event["task"],
+        action=event["action"],
+        detailed_information=None,
+        objects_ids=event["objects"],
+    )()
+    create_task_logs_notifications(logs, event["recipients"])
+
+
+def consume_task_tags_changed(event: dict) -> None:
+    logs = TaskTagsLogCreator(
+        task=event["task"],
+        action=event["action"],
+        detailed_information=None,
+        objects_ids=event["objects"],
+    )()
+    create_task_logs_notifications(logs, event["recipients"])
+
+
+def consume_tasks_created(event: dict) -> None:
+    TasksCreatedLogCreator(tasks_ids=event["tasks"], user_id=event["actor"])()
+    if event["assignees"]:
+        TaskAssigneesNotificationService(
+            users=event["assignees"],
+            workspace=event["workspace"],
+            notification_type=1,
+            triggered_by=event["actor"],
+            message=f"You have been added to the task assignees in the project {event['project_name']}",
+            entity_type="project",
+            entity_identifier=event["project"],
+        )()
+
+
+def consume_tasks_bulk_updated(event: dict) -> None:
+    """The logs of a bulk update are written by the service, only notifications are sent"""
+    if event["changed_fields"] and event["recipients"]:
+        NotificationCreatorService(
+            users=event["recipients"],
+            workspace=event["workspace"],
+            notification_type=1,
+            triggered_by=event["actor"],
+            message=f"{event['changed_tasks']} tasks have been changed: {', '.join(event['changed_fields'])}",
+            entity_type="project",
+            entity_identifier=event["project"],
+        )()
+    if event["assignees"]:
+        TaskAssigneesNotificationService(
+            users=event["assignees"],
+            workspace=event["workspace"],
+            notification_type=1,
+            triggered_by=event["actor"],
+            message=f"You have been added to the task assignees in the project {event['project_name']}",
+            entity_type="project",
+            entity_identifier=event["project"],
+        )()
@@ -0,0 +1,135 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+
+from apps.activitylog.celery_tasks import create_task_log
+from apps.activitylog.services.log_writer import log_writer
+from apps.activitylog.services.task_events import EVENT_VERSION, TASK_UPDATED
+from apps.activitylog.services.task_events_batch import TaskEventsBatchService
+from apps.notification.celery_tasks import send_log_as_notification
+from apps.projects.models.projects import Project
+from apps.projects.models.tasks import Task, TaskSubscriber
+from apps.users.models.users import User
+from apps.workspace.services.workspace_creator import WorkspaceCreator
+from apps.workspace.services.workspace_member import WorkspaceMemberService
+from core.services.outbox import OutboxRelayService, publish
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares the per-message log and notification Celery tasks with the batched outbox "
+        "consumer on seeded task changes. The tasks are run in process, without the broker. "
+        "All seeded data is rolled back at the end."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=2000)
+        parser.add_argument("--subscribers", type=int, default=5)
+        parser.add_argument("--batch-size", type=int, default=200)
+
+    # Coalescing would merge the logs of the compared runs
+    @override_settings(ACTIVITY_LOG_COALESCE_WINDOW=0)
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            user, tasks, subscribers = self.seed(options["events"], options["subscribers"])
+            self.stdout.write(f"Seeded {len(tasks)} tasks with {len(subscribers)} subscribers each")
+
+            per_message = self.measure(
+                "Per-message tasks", len(tasks), lambda: self.run_per_message(tasks, subscribers)
+            )
+            events = [self.get_event(task, user, subscribers) for task in tasks]
+            batched = self.measure(
+                f"Batched consumer, batches of {options['batch_size']}",
+                len(tasks),
+                lambda: self.run_batched(events, options["batch_size"]),
+            )
+            for event in events:
+                publish(TASK_UPDATED, event, aggregate_id=f"task:{event['task']}")
+            relayed = self.measure(
+                f"Outbox relay, batches of {options['batch_size']}",
+                len(tasks),
+                lambda: OutboxRelayService(batch_size=options["batch_size"], max_batches=10**6)(),
+            )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Speedup: x{per_message / batched:.2f} batched, x{per_message / relayed:.2f} relayed"
+                )
+            )
+
+            transaction.set_rollback(True)
+
+    def run_per_message(self, tasks: list[Task], subscribers: list[int]) -> None:
+        for task in tasks:
+            # The chain of the task signal before the outbox, one message per save
+            logs = create_task_log(task.id, ["title"])
+            log_writer.flush()
+            send_log_as_notification(logs, subscribers)
+
+    def run_batched(self, events: list[dict], batch_size: int) -> None:
+        for start in range(0, len(events), batch_size):
+            TaskEventsBatchService(events=events[start : start + batch_size])()
+            log_writer.flush()
+
+    def get_event(self, task: Task, user: User, subscribers: list[int]) -> dict:
+        return {
+            "version": EVENT_VERSION,
+            "task": task.id,
+            "project": task.project_id,
+            "workspace": task.workspace_id,
+            "actor": {"id": user.id, "username": user.username},
+            "timestamp": task.updated_at.isoformat(),
+            "changes": [{"field": "title", "value": task.title}],
+            "assignees": {"added": [], "removed": []},
+            "tags": {"added": [], "removed": []},
+            "recipients": subscribers,
+        }
+
+    def measure(self, name, count, func) -> float:
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+        self.stdout.write(
+            f"{name}: {elapsed * 1000:.1f} ms, {count / elapsed:.0f} events/s, {len(queries)} queries"
+        )
+        return elapsed
+
+    def seed(self, tasks_count, subscribers_count) -> tuple[User, list[Task], list[int]]:
+        suffix = int(time.time())
+        users = [
+            User.objects.create_user(username=f"bench_{suffix}_{i}", email=f"bench_{suffix}_{i}@bench.local")
+            for i in range(subscribers_count + 1)
+        ]
+        owner = users[0]
+        workspace = WorkspaceCreator(owner=owner, name=f"Benchmark {suffix}")()
+        WorkspaceMemberService(workspace, [{"user": user} for user in users[1:]])()
+        project = Project.objects.create(workspace=workspace, name="Benchmark", manager=owner)
+
+        now = timezone.now()
+        tasks = Task.objects.bulk_create(
+            [
+                Task(
+                    workspace=workspace,
+                    project=project,
+                    title=f"Task {i}",
+                    created_by=owner,
+                    updated_by=owner,
+                    created_at=now,
+                    updated_at=now,
+                )
+                for i in range(tasks_count)
+            ],
+            batch_size=1000,
+        )
+        TaskSubscriber.objects.bulk_create(
+            [
+                TaskSubscriber(task=task, workspace=workspace, subscriber=user)
+                for task in tasks
+                for user in users[1:]
+            ],
+            batch_size=1000,
+        )
+        return owner, tasks, [user.id for user in users[1:]]
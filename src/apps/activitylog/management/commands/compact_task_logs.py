@@ -0,0 +1,51 @@
+"""Management"""
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.activitylog.models import TaskActivityLog
+from apps.activitylog.services.log_compaction import (
+    POSITION_KEY,
+    TaskLogCompactor,
+    get_coalesce_window,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Merges the existing runs of changes of one task field by one user within "
+        "`ACTIVITY_LOG_COALESCE_WINDOW` seconds, only the last entry of a run is kept."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=None, help="Compact only the last days")
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        window = get_coalesce_window()
+        if not window:
+            self.stdout.write("Coalescing is disabled, ACTIVITY_LOG_COALESCE_WINDOW is 0")
+            return
+
+        end = timezone.now() - window
+        if options["days"] is not None:
+            start = end - timedelta(days=options["days"])
+        else:
+            start = (
+                TaskActivityLog.objects.order_by("timestamp")
+                .values_list("timestamp", flat=True)
+                .first()
+            )
+            if start is None:
+                self.stdout.write("There are no task logs")
+                return
+
+        deleted = TaskLogCompactor(
+            start=start, end=end, window=window, batch_size=options["batch_size"]
+        )()
+        # The periodic compaction continues from here
+        if not cache.get(POSITION_KEY) or cache.get(POSITION_KEY) < end:
+            cache.set(POSITION_KEY, end, None)
+        self.stdout.write(self.style.SUCCESS(f"{deleted} superseded task logs were deleted"))
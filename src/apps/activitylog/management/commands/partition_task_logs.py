@@ -0,0 +1,112 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.activitylog.services.log_partitions import (
+    TaskLogPartitionService,
+    get_table,
+    is_partitioned,
+    month_bound,
+    next_month,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Converts the task activity log table into a table partitioned by month of `timestamp`. "
+        "The existing rows are not copied, the old table becomes the legacy partition. "
+        "Its bound is checked before the table is locked, writes go on meanwhile."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--months-ahead", type=int, default=3)
+
+    def handle(self, *args, **options):
+        if is_partitioned():
+            self.stdout.write("The task activity log table is already partitioned")
+            return
+
+        table = get_table()
+        legacy = f"{table}_legacy"
+        check = f"{table[:50]}_legacy_bound"
+        unique = f"{table[:50]}_id_ts_uniq"
+        quote = connection.ops.quote_name
+        # Tomorrow's month, the bound must stay ahead of the writes until the conversion ends
+        bound = month_bound(next_month(timezone.now().date() + timedelta(days=1)))
+
+        # A validated check lets the attach skip the scan of the legacy rows under the
+        # exclusive lock. NOT VALID takes a short lock, the validation does not block writes
+        with connection.cursor() as cursor:
+            cursor.execute(f"ALTER TABLE {quote(table)} DROP CONSTRAINT IF EXISTS {quote(check)}")
+            cursor.execute(
+                f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(check)} "
+                f'CHECK ("timestamp" < %s) NOT VALID',
+                [bound],
+            )
+            cursor.execute(f"ALTER TABLE {quote(table)} VALIDATE CONSTRAINT {quote(check)}")
+            # The legacy partition needs a unique index equal to the new primary key, the
+            # attach reuses it instead of building one under the exclusive lock. A failed
+            # concurrent build leaves an invalid index behind, so it is rebuilt on a rerun
+            cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {quote(unique)}")
+            cursor.execute(
+                f'CREATE UNIQUE INDEX CONCURRENTLY {quote(unique)} ON {quote(table)} (id, "timestamp")'
+            )
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"LOCK TABLE {quote(table)} IN ACCESS EXCLUSIVE MODE")
+            cursor.execute(
+                "SELECT indexname, indexdef FROM pg_indexes "
+                "WHERE schemaname = current_schema() AND tablename = %s",
+                [table],
+            )
+            indexes = cursor.fetchall()
+            cursor.execute(
+                "SELECT conname, contype, pg_get_constraintdef(oid) FROM pg_constraint "
+                "WHERE conrelid = to_regclass(%s) AND contype IN ('p', 'f')",
+                [table],
+            )
+            constraints = cursor.fetchall()
+            primary_keys = {name for name, kind, _ in constraints if kind == "p"}
+            cursor.execute(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {quote(table)}")
+            next_id = int(cursor.fetchone()[0])
+
+            # The old table keeps its rows, indexes and foreign keys under new names
+            cursor.execute(f"ALTER TABLE {quote(table)} RENAME TO {quote(legacy)}")
+            for name, _ in indexes:
+                cursor.execute(f"ALTER INDEX {quote(name)} RENAME TO {quote(name[:56] + '_legacy')}")
+            cursor.execute(f"ALTER TABLE {quote(legacy)} ALTER COLUMN id DROP IDENTITY IF EXISTS")
+            cursor.execute(f"ALTER TABLE {quote(legacy)} ALTER COLUMN id DROP DEFAULT")
+
+            cursor.execute(
+                f"CREATE TABLE {quote(table)} (LIKE {quote(legacy)} INCLUDING DEFAULTS) "
+                f'PARTITION BY RANGE ("timestamp")'
+            )
+            cursor.execute(
+                f"ALTER TABLE {quote(table)} ALTER COLUMN id "
+                f"ADD GENERATED BY DEFAULT AS IDENTITY (START WITH {next_id})"
+            )
+            cursor.execute(f'ALTER TABLE {quote(table)} ADD PRIMARY KEY (id, "timestamp")')
+            for name, kind, definition in constraints:
+                if kind == "f":
+                    cursor.execute(f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(name)} {definition}")
+            for name, definition in indexes:
+                if name not in primary_keys and name != unique:
+                    cursor.execute(definition)
+
+            # Equal indexes and foreign keys of the legacy table are reused by the attach,
+            # the primary key by the unique (id, timestamp) index
+            cursor.execute(
+                f"ALTER TABLE {quote(table)} ATTACH PARTITION {quote(legacy)} "
+                f"FOR VALUES FROM (MINVALUE) TO (%s)",
+                [bound],
+            )
+            # The partition bound holds from now on
+            cursor.execute(f"ALTER TABLE {quote(legacy)} DROP CONSTRAINT {quote(check)}")
+
+            stats = TaskLogPartitionService(months_ahead=options["months_ahead"])()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Partitioned {table}, created {', '.join(stats['created'])}")
+        )
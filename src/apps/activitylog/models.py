@@ -46,9 +46,13 @@ class TaskActivityLog(models.Model):
         return f"Log {self.pk}"
 
     class Meta:
+        # The table is partitioned by month of `timestamp` with the `partition_task_logs`
+        # command, see `services/log_partitions.py`
         indexes = [
             models.Index(fields=["task"]),
             models.Index(fields=["user"]),
+            models.Index(fields=["task", "-timestamp", "-id"]),
+            models.Index(fields=["workspace", "user", "-timestamp", "-id"]),
         ]
         verbose_name = "Task Log"
         verbose_name_plural = "Tasks Logs"
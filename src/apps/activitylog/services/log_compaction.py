@@ -0,0 +1,145 @@
+"""
+Compaction of the task activity log.
+
+Editing a title or a description produces a change event per save. Consecutive `SET`
+entries of the same field of a task by the same user within `ACTIVITY_LOG_COALESCE_WINDOW`
+seconds are kept as one entry: the open entry gets the new value and timestamp instead
+of a new row being inserted, and no new notification is sent.
+
+- `ActivityLogWriter` coalesces the incoming logs with the buffered ones and with the
+  latest stored entry of the task
+- `TaskLogCompactor` merges the history that already exists, a run of such entries is
+  reduced to its last entry. The periodic run continues from the position kept in the
+  cache under `POSITION_KEY`, the `compact_task_logs` command compacts the whole history
+"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.utils import timezone
+
+from core.services.baseservice import BaseService
+from apps.activitylog import constants as const
+from apps.activitylog.models import TaskActivityLog
+
+POSITION_KEY = "compact_task_logs:position"
+
+
+def get_coalesce_window() -> timedelta:
+    return timedelta(seconds=getattr(settings, "ACTIVITY_LOG_COALESCE_WINDOW", 0))
+
+
+def can_merge(open_entry: TaskActivityLog, log: TaskActivityLog, window: timedelta) -> bool:
+    return (
+        open_entry.action_type == const.SET
+        and log.action_type == const.SET
+        and open_entry.task_id == log.task_id
+        and open_entry.user_id == log.user_id
+        and open_entry.field == log.field
+        and timedelta(0) <= log.timestamp - open_entry.timestamp <= window
+    )
+
+
+def merge(open_entry: TaskActivityLog, log: TaskActivityLog) -> None:
+    open_entry.value = log.value
+    open_entry.detail = log.detail
+    open_entry.timestamp = log.timestamp
+
+
+def get_open_entries(tasks_ids: set[int], since: datetime) -> dict[int, TaskActivityLog]:
+    """The latest stored entry of every task, if it is not older than `since`"""
+    if not tasks_ids:
+        return {}
+    entries = (
+        TaskActivityLog.objects.filter(task_id__in=tasks_ids, timestamp__gte=since)
+        .order_by("task_id", "-timestamp", "-id")
+        .distinct("task_id")
+    )
+    return {entry.task_id: entry for entry in entries}
+
+
+def save_merged(entry: TaskActivityLog, stored_timestamp: datetime) -> None:
+    # The stored timestamp lets PostgreSQL prune the partitions
+    TaskActivityLog.objects.filter(pk=entry.pk, timestamp=stored_timestamp).update(
+        value=entry.value, detail=entry.detail, timestamp=entry.timestamp
+    )
+
+
+@dataclass
+class TaskLogCompactor(BaseService):
+    """Deletes the entries superseded by the next entry of the same run, returns their number"""
+
+    start: datetime
+    end: datetime
+    window: timedelta | None = None
+    time_slice: timedelta = timedelta(days=1)
+    batch_size: int = 5000
+
+    def execute(self) -> int:
+        window = self.window or get_coalesce_window()
+        deleted = 0
+        slice_start = self.start
+        while slice_start < self.end:
+            slice_end = min(slice_start + self.time_slice, self.end)
+            while True:
+                total = self.delete_superseded(slice_start, slice_end, window)
+                deleted += total
+                if total < self.batch_size:
+                    break
+            slice_start = slice_end
+        return deleted
+
+    def delete_superseded(self, start: datetime, end: datetime, window: timedelta) -> int:
+        table = connection.ops.quote_name(TaskActivityLog._meta.db_table)
+        with connection.cursor() as cursor:
+            # The next entries are read up to `end + window`, so runs crossing the end are merged
+            cursor.execute(
+                f"""
+                DELETE FROM {table}
+                WHERE (id, "timestamp") IN (
+                    SELECT id, "timestamp" FROM (
+                        SELECT
+                            id, "timestamp", user_id, field, action_type,
+                            LEAD(user_id) OVER entries AS next_user_id,
+                            LEAD(field) OVER entries AS next_field,
+                            LEAD(action_type) OVER entries AS next_action_type,
+                            LEAD("timestamp") OVER entries AS next_timestamp
+                        FROM {table}
+                        WHERE "timestamp" >= %(start)s AND "timestamp" < %(end)s + %(window)s
+                        WINDOW entries AS (PARTITION BY task_id ORDER BY "timestamp", id)
+                    ) runs
+                    WHERE "timestamp" < %(end)s
+                        AND action_type = %(action)s
+                        AND next_action_type = %(action)s
+                        AND next_user_id IS NOT DISTINCT FROM user_id
+                        AND next_field = field
+                        AND next_timestamp - "timestamp" <= %(window)s
+                    LIMIT %(limit)s
+                )
+                """,
+                {
+                    "start": start,
+                    "end": end,
+                    "window": window,
+                    "action": const.SET,
+                    "limit": self.batch_size,
+                },
+            )
+            return cursor.rowcount
+
+
+def compact_recent_logs() -> int:
+    """Compacts the entries written since the previous run"""
+    window = get_coalesce_window()
+    if not window:
+        return 0
+    # The last `window` is left for the next run, its runs may still grow
+    end = timezone.now() - window
+    start = cache.get(POSITION_KEY) or end - timedelta(days=1)
+    if start >= end:
+        return 0
+    deleted = TaskLogCompactor(start=start, end=end, window=window)()
+    cache.set(POSITION_KEY, end, None)
+    return deleted
@@ -3,6 +3,7 @@ from django.db import models
 
 from apps.activitylog.models import TaskActivityLog
 from apps.activitylog import constants as const
+from apps.activitylog.services.log_writer import log_writer
 from core.services.baseservice import BaseService, GetObjectsByIdService
 from apps.projects.models.tags import TaskTag
 from apps.projects.models.tasks import Task
@@ -42,10 +43,7 @@ class M2MTaskLogCreator(GetObjectsByIdService, BaseService):
         return self.create_log(data)
     
     def create_log(self, data: dict) -> list[models.Model]:
-        instances = [
-            self.log_model.objects.create(**data)
-        ]
-        return list(instances)
+        return log_writer.add([self.log_model(**data)])
 
     def get_names_of_related_objects(self, objects) -> str:
         objects_names = ", ".join(
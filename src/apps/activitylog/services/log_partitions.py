@@ -0,0 +1,206 @@
+"""
+Monthly range partitioning of the task activity log.
+
+The log table is partitioned by `timestamp`, one partition per calendar month
+(`<table>_pYYYY_MM`). Rows written before the conversion stay in the `<table>_legacy`
+partition, which ends where the first monthly partition starts. Rows without a monthly
+partition, e.g. when the maintenance task did not run, go to the `<table>_default`
+partition instead of failing, they are moved out when their month partition is created.
+
+- `partition_task_logs` converts the existing table in place, the rows are not copied
+- `TaskLogPartitionService` creates the partitions of the next months and removes the
+  expired ones. A partition is detached and dropped when it is older than the longest
+  retention of all workspaces, shorter workspace retentions are applied with batched
+  `DELETE`s that touch only the expired partitions
+- The primary key is `(id, timestamp)`, as PostgreSQL requires the partition key in it.
+  `id` stays unique, it is generated by a single sequence of the parent table
+"""
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from core.services.baseservice import BaseService
+from apps.activitylog.models import TaskActivityLog
+from apps.workspace.models.workspace_config import WorkspaceConfiguration
+
+PARTITION_BOUND = re.compile(r"TO \('([^']+)'\)")
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def next_month(day: date) -> date:
+    return (day.replace(day=1) + timedelta(days=32)).replace(day=1)
+
+
+def month_bound(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=dt_timezone.utc)
+
+
+def get_table() -> str:
+    return TaskActivityLog._meta.db_table
+
+
+def partition_name(month: date) -> str:
+    return f"{get_table()}_p{month:%Y_%m}"
+
+
+def default_partition_name() -> str:
+    return f"{get_table()}_default"
+
+
+def is_partitioned() -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)", [get_table()]
+        )
+        return cursor.fetchone() is not None
+
+
+def get_partitions() -> dict[str, datetime | None]:
+    """Partitions and their exclusive upper bounds"""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+            FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = to_regclass(%s)
+            """,
+            [get_table()],
+        )
+        rows = cursor.fetchall()
+
+    partitions = {}
+    for name, bound in rows:
+        match = PARTITION_BOUND.search(bound or "")
+        partitions[name] = datetime.fromisoformat(match.group(1)) if match else None
+    return partitions
+
+
+def create_default_partition() -> None:
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {quote(default_partition_name())} "
+            f"PARTITION OF {quote(get_table())} DEFAULT"
+        )
+
+
+def create_month_partition(month: date) -> None:
+    quote = connection.ops.quote_name
+    table, name, default = get_table(), partition_name(month), default_partition_name()
+    bounds = [month_bound(month), month_bound(next_month(month))]
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [default])
+        has_default = cursor.fetchone()[0]
+        if has_default:
+            # No rows of the month may get into the default partition until it is attached
+            cursor.execute(f"LOCK TABLE {quote(default)} IN EXCLUSIVE MODE")
+            cursor.execute(
+                f'SELECT 1 FROM {quote(default)} WHERE "timestamp" >= %s AND "timestamp" < %s LIMIT 1',
+                bounds,
+            )
+            has_default = cursor.fetchone() is not None
+
+        if not has_default:
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {quote(name)} "
+                f"PARTITION OF {quote(table)} FOR VALUES FROM (%s) TO (%s)",
+                bounds,
+            )
+            return
+
+        # The rows of the month are moved out of the default partition, PostgreSQL refuses
+        # to create a partition while the default one holds rows of its range
+        cursor.execute(f"CREATE TABLE {quote(name)} (LIKE {quote(table)} INCLUDING DEFAULTS)")
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {quote(default)} "
+            f'WHERE "timestamp" >= %s AND "timestamp" < %s RETURNING *) '
+            f"INSERT INTO {quote(name)} SELECT * FROM moved",
+            bounds,
+        )
+        cursor.execute(
+            f"ALTER TABLE {quote(table)} ATTACH PARTITION {quote(name)} FOR VALUES FROM (%s) TO (%s)",
+            bounds,
+        )
+
+
+@dataclass
+class TaskLogPartitionService(BaseService):
+    months_ahead: int = 3
+    delete_batch_size: int = 5000
+
+    def execute(self) -> dict:
+        stats = {"created": [], "dropped": [], "deleted": 0}
+        if not is_partitioned():
+            return stats
+
+        now = timezone.now()
+        create_default_partition()
+        stats["created"] = self.create_partitions(now.date())
+        stats["dropped"] = self.drop_expired_partitions(now)
+        stats["deleted"] = self.delete_expired_rows(now)
+        return stats
+
+    def create_partitions(self, today: date) -> list[str]:
+        last = month_start(today)
+        for _ in range(self.months_ahead):
+            last = next_month(last)
+
+        # Months covered by the existing partitions, e.g. by the legacy one, are skipped.
+        # Months missed since the last partition are created too, their rows wait in the
+        # default partition
+        bounds = [bound.date() for bound in get_partitions().values() if bound]
+        month = max(bounds) if bounds else month_start(today)
+
+        created = []
+        while month <= last:
+            create_month_partition(month)
+            created.append(partition_name(month))
+            month = next_month(month)
+        return created
+
+    def drop_expired_partitions(self, now: datetime) -> list[str]:
+        retentions = list(WorkspaceConfiguration.objects.values_list("logs_retention", flat=True))
+        if not retentions or None in retentions:
+            return []
+
+        cutoff = now - max(retentions)
+        quote = connection.ops.quote_name
+        dropped = []
+        for name, upper_bound in sorted(get_partitions().items(), key=lambda item: item[0]):
+            if upper_bound is None or upper_bound > cutoff:
+                continue
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(f"ALTER TABLE {quote(get_table())} DETACH PARTITION {quote(name)}")
+                cursor.execute(f"DROP TABLE {quote(name)}")
+            dropped.append(name)
+        return dropped
+
+    def delete_expired_rows(self, now: datetime) -> int:
+        """Applies the workspace retentions that are shorter than the partitions lifetime"""
+        deleted = 0
+        configurations = WorkspaceConfiguration.objects.filter(
+            logs_retention__isnull=False
+        ).values_list("workspace_id", "logs_retention")
+
+        for workspace_id, retention in configurations:
+            # `timestamp` in the filters lets PostgreSQL prune the live partitions
+            expired = TaskActivityLog.objects.filter(
+                workspace_id=workspace_id, timestamp__lt=now - retention
+            ).order_by()
+            while True:
+                ids = list(expired.values_list("id", flat=True)[: self.delete_batch_size])
+                if not ids:
+                    break
+                total, _ = TaskActivityLog.objects.filter(
+                    id__in=ids, timestamp__lt=now - retention
+                ).delete()
+                deleted += total
+        return deleted
@@ -0,0 +1,260 @@
+"""
+Buffered writer of task activity logs.
+
+Log creators hand their rows to the per-process `log_writer` instead of inserting
+them one by one. The buffer is written with one multi-row `INSERT` when it holds
+`max_size` rows or `max_delay` seconds after its first row, whichever comes first.
+
+- The buffer is flushed on Celery worker shutdown and at interpreter exit. It lives only
+  in the memory of the process: the message or request that produced the rows is already
+  acknowledged, so a SIGKILL or an OOM kill loses up to `max_delay` seconds of rows. Logs
+  of the outbox relay do not go through the buffer, see `batch()`, they are written in
+  the transaction that deletes their events
+- A failed flush puts the rows back and is retried with a growing delay, rows of tasks
+  deleted in the meantime are dropped. After `max_attempts` failed flushes the rows are
+  written one by one, the ones that still fail are logged with their values and dropped,
+  so one bad row cannot hold the buffer back forever
+- Repeated changes of one field are coalesced into the open entry, see `log_compaction.py`.
+  Merged logs are not returned, so no notification is sent for them
+- Inside `deferred()` the added logs are staged apart from the buffer and handed over
+  only when the block ends without an error, so the logs of a rolled back savepoint
+  never reach the buffer. `batch()` writes its staged logs itself at the end of the
+  block, in the transaction of the caller, e.g. of an outbox relay batch
+"""
+import atexit
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from django.db import IntegrityError, connection, transaction
+
+from apps.activitylog.models import TaskActivityLog
+from apps.activitylog.services.log_compaction import (
+    can_merge,
+    get_coalesce_window,
+    get_open_entries,
+    merge,
+    save_merged,
+)
+from apps.projects.models.tasks import Task
+
+logger = logging.getLogger(__name__)
+
+BUFFER_SIZE = 500
+FLUSH_DELAY = 2.0
+MAX_FLUSH_ATTEMPTS = 5
+MAX_RETRY_DELAY = 60.0
+
+
+@dataclass
+class StagedLogs:
+    logs: list[TaskActivityLog] = field(default_factory=list)
+    # The latest staged or stored log of every task seen by the block
+    open_entries: dict[int, TaskActivityLog] = field(default_factory=dict)
+
+    def extend(self, logs: list[TaskActivityLog]) -> None:
+        self.logs.extend(logs)
+        for log in logs:
+            self.open_entries[log.task_id] = log
+
+
+class ActivityLogWriter:
+
+    def __init__(
+        self,
+        max_size: int = BUFFER_SIZE,
+        max_delay: float = FLUSH_DELAY,
+        max_attempts: int = MAX_FLUSH_ATTEMPTS,
+    ):
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self.max_attempts = max_attempts
+        # Failed flushes in a row
+        self.failures = 0
+        self.buffer: list[TaskActivityLog] = []
+        self.lock = threading.RLock()
+        self.timer: threading.Timer | None = None
+        self.first_added_at: float | None = None
+        # The latest log of every task since the last flush, buffered or stored
+        self.open_entries: dict[int, TaskActivityLog] = {}
+        self.local = threading.local()
+
+    def get_staging(self) -> list[StagedLogs]:
+        if not hasattr(self.local, "staging"):
+            self.local.staging = []
+        return self.local.staging
+
+    def add(self, logs: list[TaskActivityLog]) -> list[TaskActivityLog]:
+        """Buffers the logs, returns the ones that were not merged into an open entry"""
+        if not logs:
+            return logs
+
+        staging = self.get_staging()
+        if staging:
+            logs = self.coalesce(logs, staging[-1].open_entries)
+            staging[-1].extend(logs)
+            return logs
+
+        with self.lock:
+            logs = self.coalesce(logs, self.open_entries)
+            self.extend(logs)
+        return logs
+
+    def extend(self, logs: list[TaskActivityLog]) -> None:
+        """Buffers the logs without coalescing them"""
+        if not logs:
+            return
+
+        with self.lock:
+            if not self.buffer:
+                self.first_added_at = time.monotonic()
+                self.start_timer()
+            self.buffer.extend(logs)
+            for log in logs:
+                self.open_entries[log.task_id] = log
+            # After a failed flush only the retry timer flushes
+            is_due = not self.failures and (
+                len(self.buffer) >= self.max_size
+                or time.monotonic() - self.first_added_at >= self.max_delay
+            )
+
+        if is_due:
+            self.flush()
+
+    @contextmanager
+    def deferred(self):
+        """Stages the logs added in the block, they are handed over if the block succeeds"""
+        staging = self.get_staging()
+        staged = StagedLogs()
+        staging.append(staged)
+        try:
+            yield staged.logs
+        finally:
+            staging.pop()
+        # Not reached if the block raised
+        if staging:
+            staging[-1].extend(staged.logs)
+        else:
+            self.extend(staged.logs)
+
+    @contextmanager
+    def batch(self):
+        """Stages the logs added in the block and writes them at its end, bypassing the buffer"""
+        staging = self.get_staging()
+        staged = StagedLogs()
+        staging.append(staged)
+        try:
+            yield staged.logs
+        finally:
+            staging.pop()
+        if staged.logs:
+            self.write(staged.logs)
+
+    def coalesce(
+        self, logs: list[TaskActivityLog], open_entries: dict[int, TaskActivityLog]
+    ) -> list[TaskActivityLog]:
+        window = get_coalesce_window()
+        if not window:
+            return logs
+
+        # Stored entries are looked up with one query, only for tasks without a known log
+        unknown = {log.task_id for log in logs if log.task_id not in open_entries}
+        if unknown:
+            since = min(log.timestamp for log in logs) - window
+            open_entries.update(get_open_entries(unknown, since))
+
+        new_logs = []
+        for log in logs:
+            open_entry = open_entries.get(log.task_id)
+            if open_entry is not None and can_merge(open_entry, log, window):
+                stored_timestamp = open_entry.timestamp
+                merge(open_entry, log)
+                if open_entry.pk is not None:
+                    save_merged(open_entry, stored_timestamp)
+                continue
+            new_logs.append(log)
+            open_entries[log.task_id] = log
+        return new_logs
+
+    def flush(self) -> int:
+        with self.lock:
+            logs, self.buffer = self.buffer, []
+            self.first_added_at = None
+            self.open_entries = {}
+            self.cancel_timer()
+            if not logs:
+                return 0
+
+            if self.failures >= self.max_attempts:
+                self.failures = 0
+                return self.write_one_by_one(logs)
+
+            try:
+                self.write(logs)
+            except Exception:
+                # Keep the rows for the next flush
+                self.failures += 1
+                self.buffer = logs + self.buffer
+                self.first_added_at = time.monotonic()
+                self.start_timer(min(self.max_delay * 2**self.failures, MAX_RETRY_DELAY))
+                raise
+            self.failures = 0
+        return len(logs)
+
+    def write(self, logs: list[TaskActivityLog]) -> None:
+        try:
+            with transaction.atomic():
+                TaskActivityLog.objects.bulk_create(logs, batch_size=self.max_size)
+        except IntegrityError:
+            existing = set(
+                Task._base_manager.filter(id__in={log.task_id for log in logs}).values_list(
+                    "id", flat=True
+                )
+            )
+            TaskActivityLog.objects.bulk_create(
+                [log for log in logs if log.task_id in existing], batch_size=self.max_size
+            )
+
+    def write_one_by_one(self, logs: list[TaskActivityLog]) -> int:
+        """Writes every row in a savepoint of its own, the failing rows are logged and dropped"""
+        written = 0
+        for log in logs:
+            try:
+                with transaction.atomic():
+                    log.save(force_insert=True)
+            except Exception:
+                logger.exception(
+                    "Dropped the activity log of the task %s: %s %s=%r by %s at %s",
+                    log.task_id,
+                    log.action_type,
+                    log.field,
+                    log.value,
+                    log.user_id,
+                    log.timestamp.isoformat(),
+                )
+            else:
+                written += 1
+        return written
+
+    def start_timer(self, delay: float | None = None) -> None:
+        self.timer = threading.Timer(delay or self.max_delay, self.flush_on_timer)
+        self.timer.daemon = True
+        self.timer.start()
+
+    def cancel_timer(self) -> None:
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+    def flush_on_timer(self) -> None:
+        try:
+            self.flush()
+        finally:
+            # Database connections are per thread, the timer thread must not leak its one
+            connection.close()
+
+
+log_writer = ActivityLogWriter()
+atexit.register(log_writer.flush)
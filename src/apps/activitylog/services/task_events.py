@@ -0,0 +1,172 @@
+"""
+Self-contained events of the task change pipeline.
+
+Task signals capture the changed values, the actor and the users to notify in one JSON
+envelope and write it to the outbox in the transaction of the change, see
+`core/services/outbox.py`. The consumers in `apps/activitylog/consumers.py` write the logs
+and the notifications without reading the task again.
+
+Changes are gathered per unit of work: inside `collect_task_events` the signals only
+record what changed, and when the outermost unit ends one `TASK_UPDATED` event per task
+is published with all its changed fields, added and removed assignees and tags. A signal
+raised outside a unit is a unit of its own. Units run inside the transaction of the
+change, e.g. `TaskUpdaterService` opens one in its `atomic` block.
+
+`TaskBulkCreatorService` and `TaskBulkUpdaterService` skip the signals and publish one
+`TASKS_CREATED` or `TASKS_BULK_UPDATED` event per batch in their transaction instead.
+
+Values are kept as the strings the log stores, up to the length of the log detail.
+"""
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from django.utils import timezone
+
+from core.services.outbox import publish
+from apps.activitylog.services.task_log_creator import EXCLUDED_FIELDS
+from apps.projects.models.tags import TaskTag
+from apps.projects.models.tasks import Task, TaskSubscriber
+from apps.users.models.users import User
+
+EVENT_VERSION = 2
+VALUE_LENGTH = 255
+
+TASK_UPDATED = "task.updated"
+# Events of the bulk services, one per batch of tasks
+TASKS_CREATED = "tasks.created"
+TASKS_BULK_UPDATED = "tasks.bulk_updated"
+# Topics of the events published one per signal, kept for the events already in the outbox
+TASK_CHANGED = "task.changed"
+TASK_ASSIGNEES_CHANGED = "task.assignees_changed"
+TASK_TAGS_CHANGED = "task.tags_changed"
+
+M2M_FIELDS = {"assignees": User, "tags": TaskTag}
+
+_local = threading.local()
+
+
+def snapshot_value(value) -> str | None:
+    return None if value is None else str(value)[:VALUE_LENGTH]
+
+
+def get_logged_fields(update_fields) -> list[str]:
+    return [field for field in update_fields if field not in EXCLUDED_FIELDS]
+
+
+@dataclass
+class PendingTaskEvent:
+    """Changes of one task in the unit, M2M changes are kept relative to its start"""
+
+    task: Task
+    changes: dict[str, str | None] = field(default_factory=dict)
+    added: dict[str, set[int]] = field(default_factory=lambda: defaultdict(set))
+    removed: dict[str, set[int]] = field(default_factory=lambda: defaultdict(set))
+
+    def change_fields(self, task: Task, fields: list[str]) -> None:
+        self.task = task
+        for name in fields:
+            self.changes[name] = snapshot_value(getattr(task, name, None))
+
+    def change_m2m(self, task: Task, name: str, objects_ids, action: str) -> None:
+        self.task = task
+        added, removed = self.added[name], self.removed[name]
+        if action == "post_add":
+            added |= set(objects_ids) - removed
+            removed -= set(objects_ids)
+        else:
+            removed |= set(objects_ids) - added
+            added -= set(objects_ids)
+
+    def is_empty(self) -> bool:
+        return not self.changes and not any(self.added.values()) and not any(self.removed.values())
+
+
+class TaskEventCollector:
+
+    def __init__(self):
+        self.events: dict[int, PendingTaskEvent] = {}
+
+    def get_event(self, task: Task) -> PendingTaskEvent:
+        if task.pk not in self.events:
+            self.events[task.pk] = PendingTaskEvent(task=task)
+        return self.events[task.pk]
+
+    def task_changed(self, task: Task, fields: list[str]) -> None:
+        self.get_event(task).change_fields(task, fields)
+
+    def m2m_changed(self, task: Task, name: str, objects_ids, action: str) -> None:
+        self.get_event(task).change_m2m(task, name, objects_ids, action)
+
+    def publish(self) -> None:
+        events = [event for event in self.events.values() if not event.is_empty()]
+        if not events:
+            return
+
+        # One query for the subscribers of all tasks and one per changed M2M field
+        recipients = defaultdict(list)
+        subscribers = TaskSubscriber.objects.filter(
+            task_id__in=[event.task.pk for event in events]
+        ).values_list("task_id", "subscriber_id")
+        for task_id, subscriber_id in subscribers:
+            recipients[task_id].append(subscriber_id)
+        names = self.get_names(events)
+
+        for event in events:
+            publish(
+                TASK_UPDATED,
+                self.build_event(event, recipients[event.task.pk], names),
+                aggregate_id=f"task:{event.task.pk}",
+            )
+
+    def get_names(self, events: list[PendingTaskEvent]) -> dict[str, dict[int, str]]:
+        names = {}
+        for name, model in M2M_FIELDS.items():
+            ids = set()
+            for event in events:
+                ids |= event.added[name] | event.removed[name]
+            label = "username" if model is User else "name"
+            names[name] = dict(model.objects.filter(id__in=ids).values_list("id", label)) if ids else {}
+        return names
+
+    def build_event(self, event: PendingTaskEvent, users_ids: list[int], names: dict) -> dict:
+        task = event.task
+        actor = task.updated_by
+        return {
+            "version": EVENT_VERSION,
+            "task": task.id,
+            "project": task.project_id,
+            "workspace": task.workspace_id,
+            "actor": {"id": actor.id, "username": actor.username} if actor else None,
+            # M2M changes do not save the task, its `updated_at` may be older than the change
+            "timestamp": timezone.now().isoformat(),
+            "changes": [{"field": name, "value": value} for name, value in event.changes.items()],
+            **{
+                name: {
+                    "added": self.get_objects(event.added[name], names[name]),
+                    "removed": self.get_objects(event.removed[name], names[name]),
+                }
+                for name in M2M_FIELDS
+            },
+            "recipients": users_ids,
+        }
+
+    def get_objects(self, ids: set[int], names: dict[int, str]) -> list[dict]:
+        return [{"id": pk, "name": names[pk]} for pk in sorted(ids) if pk in names]
+
+
+@contextmanager
+def collect_task_events():
+    """Unit of work of the task events, a nested unit joins the outer one"""
+    collector = getattr(_local, "collector", None)
+    if collector is not None:
+        yield collector
+        return
+
+    collector = _local.collector = TaskEventCollector()
+    try:
+        yield collector
+    finally:
+        _local.collector = None
+    collector.publish()
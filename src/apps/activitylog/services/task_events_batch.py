@@ -0,0 +1,156 @@
+"""
+Batched handling of task events.
+
+The outbox relay passes all `TASK_UPDATED` events of a batch to `TaskEventsBatchService`,
+which handles them with a fixed number of queries whatever the batch size:
+
+- the settings of the added assignees, their workspace memberships and the creators of
+  the tasks losing assignees are read with one query each
+- subscriptions are created with one `bulk_create` and removed with one `DELETE`
+- the logs of all events are coalesced at once, so open entries are looked up with one
+  query and the rows are written with one insert when the relay batch ends
+- mention and change notifications are written with one `bulk_create`
+
+The notifications are written first, the logs are handed to the log writer only after
+the savepoint of the service is released, so a failed batch leaves no logs behind when
+the relay passes its events again one by one.
+"""
+from dataclasses import dataclass
+from functools import reduce
+from operator import or_
+
+from django.db import transaction
+from django.db.models import Q
+
+from core.services.baseservice import BaseService
+from apps.activitylog.services.log_writer import log_writer
+from apps.activitylog.services.task_log_creator import TaskChangedLogCreator
+from apps.notification.models.notification import Notification
+from apps.notification.services.notification_creator import (
+    get_notifications,
+    get_task_logs_notifications,
+)
+from apps.projects.models.tasks import Task, TaskSubscriber
+from apps.users.models.users import User
+from apps.workspace.models.workspace import WorkspaceMember
+
+MENTION_MESSAGE = "You have been added to the task assignees"
+
+
+@dataclass
+class TaskEventsBatchService(BaseService):
+    events: list[dict]
+
+    batch_size = 500
+
+    def execute(self) -> dict:
+        assignees = self.get_assignees_changes()
+        added = [(event, user_id) for (_, user_id), (action, event) in assignees.items() if action]
+        removed = [(event, user_id) for (_, user_id), (action, event) in assignees.items() if not action]
+
+        # The staged logs are handed over when the savepoint is released
+        with log_writer.deferred(), transaction.atomic():
+            settings = self.get_users_settings({user_id for _, user_id in added})
+
+            self.subscribe(added, settings)
+            self.unsubscribe(removed)
+
+            notifications = self.get_mention_notifications(added, settings)
+            logs_total = 0
+            for event, logs in self.stage_logs():
+                notifications += get_task_logs_notifications(logs, event["recipients"])
+                logs_total += len(logs)
+            Notification.objects.bulk_create(notifications, batch_size=self.batch_size)
+        return {"events": len(self.events), "logs": logs_total, "notifications": len(notifications)}
+
+    def get_assignees_changes(self) -> dict[tuple[int, int], tuple[bool, dict]]:
+        """The last change of every assignee of a task in the batch, True if added"""
+        changes = {}
+        for event in self.events:
+            assignees = event.get("assignees") or {}
+            for item in assignees.get("added", []):
+                changes[(event["task"], item["id"])] = (True, event)
+            for item in assignees.get("removed", []):
+                changes[(event["task"], item["id"])] = (False, event)
+        return changes
+
+    def get_users_settings(self, users_ids: set[int]) -> dict[int, tuple[bool, bool]]:
+        """Auto subscription and mention preferences of the users"""
+        if not users_ids:
+            return {}
+        rows = User.objects.filter(id__in=users_ids).values_list(
+            "id", "settings__auto_subsсribe_to_task", "settings__mention"
+        )
+        return {user_id: (bool(subscribe), bool(mention)) for user_id, subscribe, mention in rows}
+
+    def subscribe(self, added: list[tuple[dict, int]], settings: dict) -> None:
+        candidates = [
+            (event["task"], event["workspace"], user_id)
+            for event, user_id in added
+            if settings.get(user_id, (False, False))[0]
+        ]
+        if not candidates:
+            return
+
+        members = set(
+            WorkspaceMember.objects.filter(
+                workspace_id__in={workspace_id for _, workspace_id, _ in candidates},
+                user_id__in={user_id for *_, user_id in candidates},
+            ).values_list("workspace_id", "user_id")
+        )
+        # Existing subscriptions are skipped by the unique constraint
+        TaskSubscriber.objects.bulk_create(
+            [
+                TaskSubscriber(task_id=task_id, workspace_id=workspace_id, subscriber_id=user_id)
+                for task_id, workspace_id, user_id in candidates
+                if (workspace_id, user_id) in members
+            ],
+            batch_size=self.batch_size,
+            ignore_conflicts=True,
+        )
+
+    def unsubscribe(self, removed: list[tuple[dict, int]]) -> None:
+        if not removed:
+            return
+
+        creators = dict(
+            Task._base_manager.filter(id__in={event["task"] for event, _ in removed}).values_list(
+                "id", "created_by_id"
+            )
+        )
+        users_by_task = {}
+        for event, user_id in removed:
+            if user_id != creators.get(event["task"]):
+                users_by_task.setdefault(event["task"], set()).add(user_id)
+        if users_by_task:
+            TaskSubscriber.objects.filter(
+                reduce(
+                    or_,
+                    (
+                        Q(task_id=task_id, subscriber_id__in=users_ids)
+                        for task_id, users_ids in users_by_task.items()
+                    ),
+                )
+            ).delete()
+
+    def get_mention_notifications(self, added: list[tuple[dict, int]], settings: dict) -> list:
+        notifications = []
+        for event, user_id in added:
+            if not settings.get(user_id, (False, False))[1]:
+                continue
+            notifications += get_notifications(
+                [user_id],
+                workspace_id=event["workspace"],
+                type=Notification.NotificationTypeChoices.INFORMATIVE,
+                triggered_by_id=event["actor"]["id"] if event["actor"] else None,
+                message=MENTION_MESSAGE,
+                entity_type="task",
+                entity_identifier=event["task"],
+            )
+        return notifications
+
+    def stage_logs(self) -> list[tuple[dict, list]]:
+        """Logs of every event, without the ones merged into an open entry"""
+        logs_by_event = [(event, TaskChangedLogCreator(event=event).get_logs()) for event in self.events]
+        added = {id(log) for log in log_writer.add([log for _, logs in logs_by_event for log in logs])}
+        return [(event, [log for log in logs if id(log) in added]) for event, logs in logs_by_event]
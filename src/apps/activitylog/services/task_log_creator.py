@@ -1,11 +1,33 @@
 from dataclasses import dataclass
+from datetime import datetime
 from typing import List
 from django.db import models
 
 from apps.activitylog import constants as const
 from apps.activitylog.models import TaskActivityLog
+from apps.activitylog.services.log_writer import log_writer
 from core.services.baseservice import BaseService, GetObjectsByIdService
 from apps.projects.models.tasks import Task
+from apps.users.models.users import User
+
+# Fields changed along with every edit, they are not logged
+EXCLUDED_FIELDS = {"updated_at", "updated_by", "archive_at"}
+
+
+def get_action(field: str, value: str | None) -> str:
+    actions = {
+        "module": const.ADD if value else const.REMOVE,
+    }
+    return actions.get(field, const.SET)
+
+
+def get_detail(action: str, field: str, value: str | None, username: str) -> str:
+    base_detail = f"{username} {action} {field}"
+    specifics = {
+        const.ADD: f" added this task to module {value}",
+        const.REMOVE: " removed the task from the module",
+    }
+    return specifics.get(action, f"{base_detail} {value}")
 
 
 @dataclass
@@ -49,22 +71,94 @@ class TaskLogCreator(GetObjectsByIdService, BaseService):
         }
 
     def create_log(self, logs_list: List[dict]) -> list[TaskActivityLog]:
-        return [TaskActivityLog.objects.create(**log) for log in logs_list]
+        return log_writer.add([TaskActivityLog(**log) for log in logs_list])
 
     def get_update_fields(self) -> List[str]:
-        excluded_fields = {"updated_at", "updated_by", "archive_at"}
-        return [field for field in self.update_fields if field not in excluded_fields]
+        return [field for field in self.update_fields if field not in EXCLUDED_FIELDS]
 
     def get_action(self, field: str, value: str) -> str:
-        actions = {
-            "module": const.ADD if value else const.REMOVE,
-        }
-        return actions.get(field, const.SET)
+        return get_action(field, value)
 
     def get_detail(self, action: str, field: str, value: str, user: str) -> str:
-        base_detail = f"{user.username} {action} {field}"
-        specifics = {
-            const.ADD: f" added this task to module {value}",
-            const.REMOVE: " removed the task from the module",
-        }
-        return specifics.get(action, f"{base_detail} {value}")
+        return get_detail(action, field, value, user.username)
+
+
+@dataclass
+class TaskChangedLogCreator(BaseService):
+    """Creates the logs of a task event, see `task_events.py`, without reading the task"""
+    event: dict
+
+    m2m_fields = ("assignees", "tags")
+
+    def __post_init__(self):
+        self.actor = self.event["actor"] or {"id": None, "username": ""}
+        self.timestamp = datetime.fromisoformat(self.event["timestamp"])
+
+    def execute(self) -> list[TaskActivityLog]:
+        return log_writer.add(self.get_logs())
+
+    def get_logs(self) -> list[TaskActivityLog]:
+        logs = []
+        for change in self.event["changes"]:
+            field, value = change["field"], change["value"]
+            action_type = get_action(field, value)
+            detail = get_detail(action_type, field, value, self.actor["username"])
+            logs.append(self.get_log(action_type, field, value, detail))
+
+        for field in self.m2m_fields:
+            objects = self.event.get(field) or {}
+            if objects.get("added"):
+                names = ", ".join(item["name"] for item in objects["added"])
+                detail = f"{self.actor['username']} added a new {field}: {names}"
+                logs.append(self.get_log(const.ADD, field, names, detail))
+            if objects.get("removed"):
+                names = ", ".join(item["name"] for item in objects["removed"])
+                detail = f"{self.actor['username']} removed the {field}: {names}"
+                logs.append(self.get_log(const.REMOVE, field, names, detail))
+        return logs
+
+    def get_log(self, action_type: str, field: str, value: str | None, detail: str) -> TaskActivityLog:
+        return TaskActivityLog(
+            project_id=self.event["project"],
+            workspace_id=self.event["workspace"],
+            task_id=self.event["task"],
+            user_id=self.actor["id"],
+            action_type=action_type,
+            field=field,
+            value=None if value is None else value[:100],
+            detail=detail[:255],
+            timestamp=self.timestamp,
+        )
+
+
+@dataclass
+class TasksCreatedLogCreator(BaseService):
+    """Creates one CREATE log per task with a single insert"""
+    tasks_ids: list[int]
+    user_id: int | None
+
+    def execute(self) -> list[TaskActivityLog]:
+        username = self.get_username()
+        tasks = Task.objects.filter(id__in=self.tasks_ids).values_list(
+            "id", "project_id", "workspace_id", "title", "created_at"
+        )
+        logs = [
+            TaskActivityLog(
+                project_id=project_id,
+                workspace_id=workspace_id,
+                task_id=task_id,
+                user_id=self.user_id,
+                action_type=const.CREATE,
+                field="task",
+                value=title[:100],
+                detail=f"{username} created the task",
+                timestamp=created_at,
+            )
+            for task_id, project_id, workspace_id, title, created_at in tasks
+        ]
+        return TaskActivityLog.objects.bulk_create(logs)
+
+    def get_username(self) -> str:
+        if self.user_id is None:
+            return ""
+        return User.objects.filter(id=self.user_id).values_list("username", flat=True).first() or ""
@@ -0,0 +1,53 @@
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.tests.factories import create_project, create_task, create_workspace
+from apps.activitylog import constants as const
+from apps.activitylog.models import TaskActivityLog
+from apps.activitylog.services.log_writer import ActivityLogWriter
+
+
+@override_settings(ACTIVITY_LOG_COALESCE_WINDOW=0)
+class ActivityLogWriterTests(TestCase):
+
+    def setUp(self):
+        self.task = create_task(create_project(create_workspace()))
+        TaskActivityLog.objects.all().delete()
+        self.writer = ActivityLogWriter(max_delay=60, max_attempts=2)
+        self.addCleanup(self.writer.cancel_timer)
+
+    def get_log(self, value: str) -> TaskActivityLog:
+        return TaskActivityLog(
+            project_id=self.task.project_id,
+            workspace_id=self.task.workspace_id,
+            task=self.task,
+            action_type=const.SET,
+            field="title",
+            value=value,
+            detail=f"set title {value}"[:255],
+            timestamp=timezone.now(),
+        )
+
+    def test_failed_flush_keeps_rows(self):
+        # Longer than the column, the multi-row insert fails
+        self.writer.add([self.get_log("ok"), self.get_log("x" * 200)])
+
+        with self.assertRaises(DatabaseError):
+            self.writer.flush()
+
+        self.assertEqual(len(self.writer.buffer), 2)
+        self.assertFalse(TaskActivityLog.objects.exists())
+
+    def test_failing_rows_are_dropped_after_max_attempts(self):
+        self.writer.add([self.get_log("ok"), self.get_log("x" * 200)])
+        for _ in range(self.writer.max_attempts):
+            with self.assertRaises(DatabaseError):
+                self.writer.flush()
+
+        with self.assertLogs("apps.activitylog.services.log_writer", "ERROR"):
+            written = self.writer.flush()
+
+        self.assertEqual(written, 1)
+        self.assertEqual(self.writer.buffer, [])
+        self.assertEqual(list(TaskActivityLog.objects.values_list("value", flat=True)), ["ok"])
@@ -0,0 +1,30 @@
+from datetime import datetime, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from core.models.outbox import OutboxEvent
+from core.tests.factories import create_project, create_task, create_workspace
+from apps.activitylog.services.task_events import TASK_UPDATED, collect_task_events
+from apps.projects.models.tags import TaskTag
+
+
+class TaskEventTests(TestCase):
+
+    def setUp(self):
+        self.task = create_task(create_project(create_workspace()))
+        OutboxEvent.objects.all().delete()
+
+    def test_m2m_change_has_time_of_change(self):
+        # The instance of a task loaded long before its tags change
+        self.task.updated_at = timezone.now() - timedelta(hours=1)
+        tag = TaskTag.objects.create(name="backend")
+        before = timezone.now()
+
+        with collect_task_events() as collector:
+            collector.m2m_changed(self.task, "tags", [tag.id], "post_add")
+
+        event = OutboxEvent.objects.get(topic=TASK_UPDATED)
+        self.assertGreaterEqual(datetime.fromisoformat(event.payload["timestamp"]), before)
+        self.assertEqual(event.aggregate_id, f"task:{self.task.id}")
+        self.assertEqual(event.payload["tags"]["added"], [{"id": tag.id, "name": "backend"}])
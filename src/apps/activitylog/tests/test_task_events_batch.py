@@ -0,0 +1,73 @@
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.models.outbox import OutboxEvent
+from core.services.outbox import OutboxRelayService, publish
+from core.tests.factories import create_project, create_task, create_workspace
+from apps.activitylog.models import TaskActivityLog
+from apps.activitylog.services import task_events_batch
+from apps.activitylog.services.task_events import EVENT_VERSION, TASK_UPDATED
+
+
+@override_settings(ACTIVITY_LOG_COALESCE_WINDOW=0)
+class TaskEventsRelayTests(TestCase):
+
+    def setUp(self):
+        self.workspace = create_workspace()
+        self.user = self.workspace.owner
+        self.project = create_project(self.workspace)
+        self.task = create_task(self.project)
+        self.broken_task = create_task(self.project)
+        TaskActivityLog.objects.all().delete()
+        OutboxEvent.objects.all().delete()
+
+    def publish_title_change(self, task, title: str) -> None:
+        event = {
+            "version": EVENT_VERSION,
+            "task": task.id,
+            "project": task.project_id,
+            "workspace": task.workspace_id,
+            "actor": {"id": self.user.id, "username": self.user.username},
+            "timestamp": timezone.now().isoformat(),
+            "changes": [{"field": "title", "value": title}],
+            "assignees": {"added": [], "removed": []},
+            "tags": {"added": [], "removed": []},
+            "recipients": [],
+        }
+        publish(TASK_UPDATED, event, aggregate_id=f"task:{task.id}")
+
+    def fail_for_broken_task(self):
+        get_notifications = task_events_batch.get_task_logs_notifications
+
+        def failing(logs, recipients):
+            if any(log.task_id == self.broken_task.id for log in logs):
+                raise ValueError("Broken task")
+            return get_notifications(logs, recipients)
+
+        return mock.patch.object(task_events_batch, "get_task_logs_notifications", failing)
+
+    def test_relayed_batch_writes_logs(self):
+        self.publish_title_change(self.task, "First")
+        self.publish_title_change(self.task, "Second")
+
+        OutboxRelayService()()
+
+        self.assertEqual(
+            list(TaskActivityLog.objects.order_by("id").values_list("value", flat=True)),
+            ["First", "Second"],
+        )
+        self.assertFalse(OutboxEvent.objects.exists())
+
+    def test_fallback_does_not_duplicate_logs(self):
+        self.publish_title_change(self.task, "Edited")
+        self.publish_title_change(self.broken_task, "Broken")
+
+        with self.fail_for_broken_task():
+            stats = OutboxRelayService()()
+
+        self.assertEqual(stats, {"dispatched": 1, "failed": 1, "batches": 1})
+        self.assertEqual(TaskActivityLog.objects.filter(task=self.task).count(), 1)
+        self.assertFalse(TaskActivityLog.objects.filter(task=self.broken_task).exists())
+        self.assertEqual(OutboxEvent.objects.get().aggregate_id, f"task:{self.broken_task.id}")
@@ -12,6 +12,7 @@ from apps.activitylog.schema import (
     user_tasks_logs_activities,
     user_recent_tasks_logs_activities,
 )
+from core.pagination import KeysetPagination
 
 
 @task_log_activity
@@ -20,6 +21,8 @@ class ListTaskLogsView(GenericViewSet):
 
     permission_classes = [IsWorkspaceMember]
     serializer_class = serializers.ListTaskLogsSerializer
+    pagination_class = KeysetPagination
+    pagination_ordering = "-timestamp"
 
     http_method_names = ("get",)
     lookup_url_kwarg = "task_id"
@@ -40,8 +43,9 @@ class ListTaskLogsView(GenericViewSet):
                 {"detail": "Task logs not found"}, status=status.HTTP_404_NOT_FOUND
             )
 
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
 
 @user_tasks_logs_activities
@@ -50,6 +54,8 @@ class UserAllTaskActvity(APIView):
 
     permission_classes = [IsAuthenticated]
     http_method_names = ("get",)
+    pagination_class = KeysetPagination
+    pagination_ordering = "-timestamp"
 
     def get_queryset(self, workspace_id):
         user = self.request.user
@@ -68,13 +74,21 @@ class UserAllTaskActvity(APIView):
                 {"detail": "Task logs not found"}, status=status.HTTP_404_NOT_FOUND
             )
 
-        serializer = serializers.ListTaskLogsSerializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        if self.pagination_class is None:
+            serializer = serializers.ListTaskLogsSerializer(queryset, many=True)
+            return Response(serializer.data, status=status.HTTP_200_OK)
+
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = serializers.ListTaskLogsSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
 
 @user_recent_tasks_logs_activities
 class UserRecentTaskActvity(UserAllTaskActvity):
     """Gets the most recent 10 task logs triggered by the current user in the specified workspace."""
 
+    pagination_class = None
+
     def get_queryset(self, workspace_id):
         return super().get_queryset(workspace_id)[:10]
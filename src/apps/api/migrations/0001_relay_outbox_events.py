@@ -0,0 +1,29 @@
+from django.db import migrations
+from django.utils import timezone
+
+
+def schedule_relay(apps, schema_editor):
+    IntervalSchedule = apps.get_model("django_celery_beat", "IntervalSchedule")
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+
+    interval, _ = IntervalSchedule.objects.get_or_create(every=2, period="seconds")
+    PeriodicTask.objects.get_or_create(
+        name="Relay_outbox_events",
+        defaults={"task": "relay_outbox_events", "interval": interval, "start_time": timezone.now()},
+    )
+
+
+def unschedule_relay(apps, schema_editor):
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    PeriodicTask.objects.filter(name="Relay_outbox_events").delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_celery_beat", "0018_improve_crontab_helptext"),
+    ]
+
+    operations = [
+        migrations.RunPython(schedule_relay, unschedule_relay),
+    ]
@@ -0,0 +1,29 @@
+from django.db import migrations
+from django.utils import timezone
+
+
+def schedule_sweep(apps, schema_editor):
+    IntervalSchedule = apps.get_model("django_celery_beat", "IntervalSchedule")
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+
+    interval, _ = IntervalSchedule.objects.get_or_create(every=1, period="hours")
+    PeriodicTask.objects.get_or_create(
+        name="Sweep_completed_tasks",
+        defaults={"task": "sweep_completed_tasks", "interval": interval, "start_time": timezone.now()},
+    )
+
+
+def unschedule_sweep(apps, schema_editor):
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    PeriodicTask.objects.filter(name="Sweep_completed_tasks").delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0001_relay_outbox_events"),
+    ]
+
+    operations = [
+        migrations.RunPython(schedule_sweep, unschedule_sweep),
+    ]
@@ -0,0 +1,33 @@
+from django.db import migrations
+from django.utils import timezone
+
+
+def schedule_maintenance(apps, schema_editor):
+    IntervalSchedule = apps.get_model("django_celery_beat", "IntervalSchedule")
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+
+    interval, _ = IntervalSchedule.objects.get_or_create(every=1, period="days")
+    PeriodicTask.objects.get_or_create(
+        name="Maintain_task_log_partitions",
+        defaults={
+            "task": "maintain_task_log_partitions",
+            "interval": interval,
+            "start_time": timezone.now(),
+        },
+    )
+
+
+def unschedule_maintenance(apps, schema_editor):
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    PeriodicTask.objects.filter(name="Maintain_task_log_partitions").delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0002_sweep_completed_tasks"),
+    ]
+
+    operations = [
+        migrations.RunPython(schedule_maintenance, unschedule_maintenance),
+    ]
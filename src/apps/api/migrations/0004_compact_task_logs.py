@@ -0,0 +1,33 @@
+from django.db import migrations
+from django.utils import timezone
+
+
+def schedule_compaction(apps, schema_editor):
+    IntervalSchedule = apps.get_model("django_celery_beat", "IntervalSchedule")
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+
+    interval, _ = IntervalSchedule.objects.get_or_create(every=1, period="hours")
+    PeriodicTask.objects.get_or_create(
+        name="Compact_task_logs",
+        defaults={
+            "task": "compact_task_logs",
+            "interval": interval,
+            "start_time": timezone.now(),
+        },
+    )
+
+
+def unschedule_compaction(apps, schema_editor):
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    PeriodicTask.objects.filter(name="Compact_task_logs").delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0003_maintain_task_log_partitions"),
+    ]
+
+    operations = [
+        migrations.RunPython(schedule_compaction, unschedule_compaction),
+    ]
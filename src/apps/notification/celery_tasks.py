@@ -6,7 +6,11 @@ from django.utils import timezone
 from datetime import timedelta
 
 from apps.notification.models.notification import Notification
-from apps.notification.services.notification_creator import NotificationCreatorService, TaskAssigneesNotificationService
+from apps.notification.services.notification_creator import (
+    NotificationCreatorService,
+    TaskAssigneesNotificationService,
+    get_logs_message,
+)
 
 User = get_user_model()
 
@@ -16,14 +20,7 @@ def send_log_as_notification(json_log, users_ids):
     
     if logs and users_ids:
         first_log = logs[0]
-        first_field = first_log["fields"]["field"]
-        num_fields_changed = len(logs)
-
-
-        if num_fields_changed == 1:
-            message = first_log["fields"]["detail"]
-        else:
-            message = f"{first_field} and {num_fields_changed - 1} other fields have been changed"
+        message = get_logs_message([(log["fields"]["field"], log["fields"]["detail"]) for log in logs])
 
         NotificationCreatorService(
             users=users_ids,
@@ -31,8 +28,8 @@ def send_log_as_notification(json_log, users_ids):
             notification_type=1,
             message=message,
             triggered_by=first_log["fields"]["user"],
-            entity_type=first_log["model"],
-            entity_identifier=first_log["pk"],
+            entity_type="task",
+            entity_identifier=first_log["fields"]["task"],
         )()
     
 
@@ -76,6 +76,7 @@ class Notification(models.Model):
         indexes = [
             models.Index(fields=["workspace", "user"]),
             models.Index(fields=["user"]),
+            models.Index(fields=["user", "-created_at", "-id"]),
         ]
         verbose_name = "Notification"
         verbose_name_plural = "Notifications"
@@ -69,3 +69,37 @@ class TaskAssigneesNotificationService(NotificationCreatorService):
 
     def validate_user_mention_preferences(self) -> None:
         self.users = [user for user in self.users if user.settings.mention]
+
+
+def get_logs_message(changes: list[tuple[str, str]]) -> str:
+    """Message about the changed fields of a task, `changes` are pairs of field and log detail"""
+    first_field, first_detail = changes[0]
+    if len(changes) == 1:
+        return first_detail
+    return f"{first_field} and {len(changes) - 1} other fields have been changed"
+
+
+def get_notifications(users_ids, **data) -> list[Notification]:
+    """Unsaved notifications by ids, the users, workspace and entity are not loaded"""
+    return [Notification(user_id=user_id, created_at=timezone.now(), **data) for user_id in users_ids]
+
+
+def get_task_logs_notifications(logs: list, users_ids: list[int]) -> list[Notification]:
+    if not logs or not users_ids:
+        return []
+
+    first_log = logs[0]
+    return get_notifications(
+        users_ids,
+        workspace_id=first_log.workspace_id,
+        type=Notification.NotificationTypeChoices.INFORMATIVE,
+        triggered_by_id=first_log.user_id,
+        message=get_logs_message([(log.field, log.detail) for log in logs]),
+        entity_type="task",
+        entity_identifier=first_log.task_id,
+    )
+
+
+def create_task_logs_notifications(logs: list, users_ids: list[int]) -> list[Notification]:
+    """Notifies about the task logs by ids, the users, workspace and task are not loaded"""
+    return Notification.objects.bulk_create(get_task_logs_notifications(logs, users_ids))
@@ -11,6 +11,7 @@ from apps.notification.schema import notification_schema, send_notification_sche
 from apps.notification.serializers.notification import SendNotificationToUserSerializer, NotificationSerializer
 from apps.notification.celery_tasks import send_notification
 from apps.workspace.permissions import IsWorkspaceAdmin
+from core.pagination import KeysetPagination
 
 
 @notification_schema
@@ -22,6 +23,7 @@ class NotificationView(ModelViewSet):
 
     permission_classes = [IsAuthenticated]
     serializer_class = NotificationSerializer
+    pagination_class = KeysetPagination
 
     http_method_names = ["get", "delete"]
 
@@ -6,5 +6,11 @@ class ProjectsConfig(AppConfig):
     name = "apps.projects"
 
     def ready(self) -> None:
-        from apps.projects.signals import tasks_signals
+        from apps.projects.signals import (
+            counters_signals,
+            display_filters_signals,
+            sync_signals,
+            tags_signals,
+            tasks_signals,
+        )
         return super().ready()
@@ -2,26 +2,40 @@ from celery import shared_task
 from django_celery_beat.models import PeriodicTask, IntervalSchedule
 from django.utils import timezone
 
-from apps.projects.models.tasks import Task
-
 """Management"""
 def create_task_to_archive_completed_tasks():
-    PeriodicTask.objects.create(
+    PeriodicTask.objects.get_or_create(
         name="Archive_completed_tasks",
-        task="archive_completed_tasks",
-        interval=IntervalSchedule.objects.get(every=10, period="seconds"),
-        start_time=timezone.now(),
+        defaults={
+            "task": "archive_completed_tasks",
+            "interval": IntervalSchedule.objects.get_or_create(every=10, period="seconds")[0],
+            "start_time": timezone.now(),
+        },
+    )
+    PeriodicTask.objects.get_or_create(
+        name="Sweep_completed_tasks",
+        defaults={
+            "task": "sweep_completed_tasks",
+            "interval": IntervalSchedule.objects.get_or_create(every=1, period="hours")[0],
+            "start_time": timezone.now(),
+        },
     )
 
 
 @shared_task(name="archive_completed_tasks")
 def archive_completed_tasks():
-    """Archiving completed tasks"""
-    current_time = timezone.now()
-    Task.objects.filter(
-        archive_at__gte=current_time,
-        workspace__configuration__archive_completed_task=True,
-    ).update(is_archive=True)
+    """Archiving the completed tasks that are due in the archive schedule"""
+    from apps.projects.services.task_archiver import ArchiveDispatcherService
+
+    return ArchiveDispatcherService()()
+
+
+@shared_task(name="sweep_completed_tasks")
+def sweep_completed_tasks():
+    """Archiving the due completed tasks missing from the archive schedule"""
+    from apps.projects.services.task_archiver import TaskArchiverService
+
+    return TaskArchiverService()()
 """Management"""
 
 
@@ -14,3 +14,19 @@ class ModuleChoice:
         (COMPLETED, "Completed"),
         (CANCELLED, "Cancelled"),
     ]
+
+
+# Text search configuration of the task `search_vector` column
+TASK_SEARCH_CONFIG = "english"
+
+
+class SyncEntityChoice:
+    PROJECT = 0
+    MODULE = 1
+    TASK = 2
+
+    CHOICES = [
+        (PROJECT, "project"),
+        (MODULE, "module"),
+        (TASK, "task"),
+    ]
@@ -1,6 +1,8 @@
 import django_filters
+from rest_framework.filters import BaseFilterBackend
 
 from apps.projects.models import projects, tasks
+from apps.projects.services.task_search import search_tasks
 
 
 class ProjectFilter(django_filters.FilterSet):
@@ -60,3 +62,34 @@ class TaskFilter(BaseTaskFilter):
             if value
             else queryset.exclude(assignees=user)
         )
+
+
+class TaskFullTextSearchFilter(BaseFilterBackend):
+    """Replacement of `SearchFilter` for tasks, uses the GIN-indexed `search_vector`
+
+    Results are ordered by rank unless the request has an explicit `ordering`
+    """
+
+    search_param = "search"
+    ordering_param = "ordering"
+
+    def filter_queryset(self, request, queryset, view):
+        text = request.query_params.get(self.search_param, "").strip()
+        if not text:
+            return queryset
+
+        queryset = search_tasks(queryset, text)
+        if self.ordering_param not in request.query_params:
+            queryset = queryset.order_by("-rank", "-id")
+        return queryset
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.search_param,
+                "required": False,
+                "in": "query",
+                "description": "Full-text search over the title and the description",
+                "schema": {"type": "string"},
+            },
+        ]
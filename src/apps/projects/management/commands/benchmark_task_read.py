@@ -0,0 +1,126 @@
+import time
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.projects.models.modules import Module
+from apps.projects.models.projects import Project
+from apps.projects.models.tags import TaskTag
+from apps.projects.models.tasks import Task
+from apps.projects.serializers.tasks import TaskReadOnlySerializer
+from apps.projects.serializers.tasks_lean import LeanTaskReadOnlySerializer
+from apps.projects.views.tasks import TaskViewSet
+from apps.users.models.users import User
+from apps.workspace.models.workspace_config import TaskState
+from apps.workspace.services.workspace_creator import WorkspaceCreator
+from apps.workspace.services.workspace_member import WorkspaceMemberService
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares TaskReadOnlySerializer with LeanTaskReadOnlySerializer on a seeded project. "
+        "All seeded data is rolled back at the end."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tasks", type=int, default=5000)
+        parser.add_argument("--members", type=int, default=20)
+        parser.add_argument("--tags", type=int, default=50)
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            user, project = self.seed(options["tasks"], options["members"], options["tags"])
+
+            view = TaskViewSet()
+            view.kwargs = {"workspace_id": project.workspace_id, "project_id": project.id}
+            view.request = SimpleNamespace(user=user)
+
+            self.stdout.write(f"Seeded project with {options['tasks']} tasks")
+            serializer_time = self.measure(
+                "TaskReadOnlySerializer",
+                lambda: TaskReadOnlySerializer(view.get_queryset(), many=True).data,
+                options["repeat"],
+            )
+            lean_time = self.measure(
+                "LeanTaskReadOnlySerializer",
+                lambda: LeanTaskReadOnlySerializer(
+                    LeanTaskReadOnlySerializer.values(view.get_queryset()), many=True
+                ).data,
+                options["repeat"],
+            )
+            self.stdout.write(self.style.SUCCESS(f"Speedup: x{serializer_time / lean_time:.2f}"))
+
+            transaction.set_rollback(True)
+
+    def measure(self, name, func, repeat) -> float:
+        best = None
+        for _ in range(repeat):
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                func()
+                elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        self.stdout.write(f"{name}: {best * 1000:.1f} ms, {len(queries)} queries")
+        return best
+
+    def seed(self, tasks_count, members_count, tags_count) -> tuple[User, Project]:
+        suffix = int(time.time())
+        users = [
+            User.objects.create_user(username=f"bench_{suffix}_{i}", email=f"bench_{suffix}_{i}@bench.local")
+            for i in range(members_count)
+        ]
+        owner = users[0]
+        workspace = WorkspaceCreator(owner=owner, name=f"Benchmark {suffix}")()
+        WorkspaceMemberService(workspace, [{"user": user} for user in users[1:]])()
+
+        project = Project.objects.create(workspace=workspace, name="Benchmark", manager=owner)
+        modules = [
+            Module.objects.create(workspace=workspace, project=project, name=f"Module {i}")
+            for i in range(5)
+        ]
+        states = list(TaskState.objects.filter(workspace=workspace))
+        tags = TaskTag.objects.bulk_create(
+            [TaskTag(name=f"bench-{suffix}-{i}") for i in range(tags_count)]
+        )
+
+        now = timezone.now()
+        tasks = Task.objects.bulk_create(
+            [
+                Task(
+                    workspace=workspace,
+                    project=project,
+                    module=modules[i % len(modules)],
+                    state=states[i % len(states)],
+                    title=f"Task {i}",
+                    description="Benchmark task",
+                    priority=i % 3 + 1,
+                    created_by=owner,
+                    updated_by=owner,
+                    created_at=now,
+                    updated_at=now,
+                )
+                for i in range(tasks_count)
+            ],
+            batch_size=1000,
+        )
+        Task.assignees.through.objects.bulk_create(
+            [
+                Task.assignees.through(task_id=task.id, user_id=users[(i + j) % members_count].id)
+                for i, task in enumerate(tasks)
+                for j in range(2)
+            ],
+            batch_size=1000,
+        )
+        Task.tags.through.objects.bulk_create(
+            [
+                Task.tags.through(task_id=task.id, tasktag_id=tags[(i + j) % tags_count].id)
+                for i, task in enumerate(tasks)
+                for j in range(3)
+            ],
+            batch_size=1000,
+        )
+        return owner, project
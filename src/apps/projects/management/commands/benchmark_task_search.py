@@ -0,0 +1,101 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.projects.models.projects import Project
+from apps.projects.models.tasks import Task
+from apps.projects.services.task_search import search_tasks
+from apps.users.models.users import User
+from apps.workspace.services.workspace_creator import WorkspaceCreator
+
+WORDS = (
+    "api backend frontend deploy release migration database index query cache redis "
+    "celery worker queue notification email invite workspace project module task state "
+    "priority deadline assignee comment review refactor bug crash timeout memory leak "
+    "login signup password token permission role owner manager member report export "
+    "import search filter sort board calendar timeline dashboard chart metric alert"
+).split()
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares the ILIKE search of SearchFilter with the full-text search on a seeded "
+        "task table. All seeded data is rolled back at the end."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tasks", type=int, default=1_000_000)
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--term", default="redis timeout")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            project = self.seed(options["tasks"], options["batch_size"])
+            with connection.cursor() as cursor:
+                cursor.execute(f"ANALYZE {Task._meta.db_table}")
+            self.stdout.write(f"Seeded project with {options['tasks']} tasks")
+
+            tasks = Task.objects.filter(project=project)
+            term = options["term"]
+
+            ilike = Q()
+            for word in term.split():
+                ilike &= Q(title__icontains=word) | Q(description__icontains=word)
+
+            ilike_time = self.measure(
+                "SearchFilter (ILIKE)",
+                lambda: list(tasks.filter(ilike).order_by("-created_at")[:50]),
+                options["repeat"],
+            )
+            fts_time = self.measure(
+                "Full-text search",
+                lambda: list(search_tasks(tasks, term).order_by("-rank", "-id")[:50]),
+                options["repeat"],
+            )
+            self.stdout.write(self.style.SUCCESS(f"Speedup: x{ilike_time / fts_time:.2f}"))
+
+            transaction.set_rollback(True)
+
+    def measure(self, name, func, repeat) -> float:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            results = func()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        self.stdout.write(f"{name}: {best * 1000:.1f} ms, {len(results)} results")
+        return best
+
+    def seed(self, tasks_count, batch_size) -> Project:
+        suffix = int(time.time())
+        owner = User.objects.create_user(
+            username=f"bench_{suffix}", email=f"bench_{suffix}@bench.local"
+        )
+        workspace = WorkspaceCreator(owner=owner, name=f"Benchmark {suffix}")()
+        project = Project.objects.create(workspace=workspace, name="Benchmark", manager=owner)
+
+        rnd = random.Random(suffix)
+        now = timezone.now()
+        for start in range(0, tasks_count, batch_size):
+            Task.objects.bulk_create(
+                [
+                    Task(
+                        workspace=workspace,
+                        project=project,
+                        title=" ".join(rnd.choices(WORDS, k=5)),
+                        description=" ".join(rnd.choices(WORDS, k=40)),
+                        created_by=owner,
+                        updated_by=owner,
+                        created_at=now,
+                        updated_at=now,
+                    )
+                    for _ in range(min(batch_size, tasks_count - start))
+                ],
+                batch_size=batch_size,
+            )
+        return project
@@ -0,0 +1,161 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from apps.projects.models.modules import Module, ModuleStateCounter
+from apps.projects.models.projects import Project
+from apps.projects.models.tasks import Task
+from apps.projects.services.module_progress import NO_STATE
+from apps.workspace.models.workspace import Workspace, WorkspaceMember
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the task counters of projects, the task and member counters "
+        "of workspaces and the progress of modules, and repairs the drifted ones in batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        self.batch_size = options["batch_size"]
+        self.dry_run = options["dry_run"]
+
+        projects = self.repair(
+            Project, "project_id", ("active_tasks_count", "archived_tasks_count")
+        )
+        workspaces = self.repair(
+            Workspace,
+            "workspace_id",
+            ("active_tasks_count", "archived_tasks_count", "members_count"),
+        )
+
+        modules = self.repair_modules()
+
+        action = "Found" if self.dry_run else "Repaired"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{action} {projects} drifted projects, {workspaces} drifted workspaces "
+                f"and {modules} drifted modules"
+            )
+        )
+
+    def repair(self, model, key: str, fields: tuple[str, ...]) -> int:
+        drifted_total = 0
+        last_id = 0
+        while True:
+            with transaction.atomic():
+                # Locking the counter rows makes concurrent increments wait for the repair
+                objects = list(
+                    model._base_manager.select_for_update()
+                    .filter(id__gt=last_id)
+                    .order_by("id")
+                    .only("id", *fields)[: self.batch_size]
+                )
+                if not objects:
+                    return drifted_total
+
+                ids = [obj.id for obj in objects]
+                counters = self.count(key, ids, "members_count" in fields)
+                drifted = []
+                for obj in objects:
+                    expected = counters.get(obj.id, {})
+                    if any(getattr(obj, field) != expected.get(field, 0) for field in fields):
+                        for field in fields:
+                            setattr(obj, field, expected.get(field, 0))
+                        drifted.append(obj)
+
+                if drifted and not self.dry_run:
+                    model._base_manager.bulk_update(drifted, fields)
+                    if model is Project:
+                        # The delta sync sends the repaired counters
+                        Project._base_manager.filter(id__in=[obj.id for obj in drifted]).update(
+                            updated_at=timezone.now()
+                        )
+
+            drifted_total += len(drifted)
+            last_id = ids[-1]
+
+    def repair_modules(self) -> int:
+        drifted_total = 0
+        last_id = 0
+        while True:
+            ids = list(
+                Module._base_manager.filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", flat=True)[: self.batch_size]
+            )
+            if not ids:
+                return drifted_total
+
+            with transaction.atomic():
+                stored = {
+                    (counter.module_id, counter.state_type): counter
+                    for counter in ModuleStateCounter.objects.select_for_update().filter(
+                        module_id__in=ids
+                    )
+                }
+                rows = (
+                    Task._base_manager.filter(module_id__in=ids)
+                    .values("module_id", "state__type")
+                    .annotate(total=Count("id"))
+                    .order_by()
+                )
+                expected = {
+                    (row["module_id"], row["state__type"] or NO_STATE): row["total"] for row in rows
+                }
+
+                drifted = [
+                    ModuleStateCounter(module_id=module_id, state_type=state_type, tasks_count=total)
+                    for (module_id, state_type), total in expected.items()
+                    if getattr(stored.get((module_id, state_type)), "tasks_count", 0) != total
+                ]
+                drifted += [
+                    ModuleStateCounter(module_id=module_id, state_type=state_type, tasks_count=0)
+                    for (module_id, state_type), counter in stored.items()
+                    if counter.tasks_count and (module_id, state_type) not in expected
+                ]
+
+                if drifted and not self.dry_run:
+                    ModuleStateCounter.objects.bulk_create(
+                        drifted,
+                        update_conflicts=True,
+                        unique_fields=["module", "state_type"],
+                        update_fields=["tasks_count"],
+                    )
+                    Module._base_manager.filter(
+                        id__in={counter.module_id for counter in drifted}
+                    ).update(updated_at=timezone.now())
+
+            drifted_total += len({counter.module_id for counter in drifted})
+            last_id = ids[-1]
+
+    @staticmethod
+    def count(key: str, ids: list[int], with_members: bool) -> dict[int, dict[str, int]]:
+        counters = {}
+        rows = (
+            Task._base_manager.filter(**{f"{key}__in": ids})
+            .values(key)
+            .annotate(
+                active_tasks_count=Count("id", filter=Q(is_archive=False)),
+                archived_tasks_count=Count("id", filter=Q(is_archive=True)),
+            )
+            .order_by()
+        )
+        for row in rows:
+            counters[row.pop(key)] = row
+
+        if with_members:
+            members = (
+                WorkspaceMember.objects.filter(workspace_id__in=ids)
+                .values("workspace_id")
+                .annotate(total=Count("id"))
+                .order_by()
+            )
+            for row in members:
+                counters.setdefault(row["workspace_id"], {})["members_count"] = row["total"]
+
+        return counters
@@ -1,6 +1,8 @@
+from django.contrib.postgres.indexes import GistIndex
 from django.db import models
 from django.urls import reverse
 
+from core.models.functions import TsTzRange
 from core.models.mixins import StartEndMixin
 from apps.projects.constants import ModuleChoice
 from apps.projects.models import projects
@@ -44,6 +46,22 @@ class Module(StartEndMixin):
     class Meta:
         indexes = [
             models.Index(fields=["project"]),
+            models.Index(fields=["workspace", "updated_at", "id"]),
+            GistIndex(
+                "project",
+                TsTzRange("date_start", "date_end"),
+                name="module_dates_gist",
+            ),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                check=(
+                    models.Q(date_start__isnull=True)
+                    | models.Q(date_end__isnull=True)
+                    | models.Q(date_start__lte=models.F("date_end"))
+                ),
+                name="module_dates_order",
+            ),
         ]
         verbose_name = "Module"
         verbose_name_plural = "Modules"
@@ -68,3 +86,23 @@ class Module(StartEndMixin):
                 "module_id": self.id,
             }
         )
+
+
+class ModuleStateCounter(models.Model):
+    """Number of tasks of a module with a state type, `state_type=0` counts tasks without a state"""
+
+    module = models.ForeignKey(
+        to=Module,
+        on_delete=models.CASCADE,
+        related_name="state_counters",
+    )
+    state_type = models.SmallIntegerField(default=0)
+    tasks_count = models.IntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Module state counter"
+        verbose_name_plural = "Module state counters"
+        unique_together = ("module", "state_type")
+
+    def __str__(self):
+        return f"Module ID:{self.module_id} type:{self.state_type} - {self.tasks_count}"
@@ -39,6 +39,8 @@ class Project(StartEndMixin):
         null=True,
         blank=True,
     )
+    active_tasks_count = models.IntegerField(default=0, editable=False)
+    archived_tasks_count = models.IntegerField(default=0, editable=False)
     
     def get_absolute_url(self):
         return reverse(
@@ -52,6 +54,8 @@ class Project(StartEndMixin):
     class Meta:
         indexes = [
             models.Index(fields=["workspace"]),
+            models.Index(fields=["workspace", "-created_at", "-id"]),
+            models.Index(fields=["workspace", "updated_at", "id"]),
         ]
         verbose_name = "Project"
         verbose_name_plural = "Projects"
@@ -0,0 +1,27 @@
+from django.db import models
+from django.utils import timezone
+
+from apps.projects.constants import SyncEntityChoice
+
+
+class Tombstone(models.Model):
+    """A deleted project, module or task, kept for the delta sync of the clients"""
+
+    workspace = models.ForeignKey(
+        to="workspace.Workspace",
+        on_delete=models.CASCADE,
+        related_name="tombstones",
+    )
+    entity_type = models.SmallIntegerField(choices=SyncEntityChoice.CHOICES)
+    entity_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["workspace", "deleted_at", "id"]),
+        ]
+        verbose_name = "Tombstone"
+        verbose_name_plural = "Tombstones"
+
+    def __str__(self):
+        return f"Tombstone of {self.get_entity_type_display()} (ID:{self.entity_id})"
@@ -1,4 +1,6 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 
 class TaskTag(models.Model):
@@ -10,6 +12,9 @@ class TaskTag(models.Model):
     )
 
     class Meta:
+        indexes = [
+            GinIndex(OpClass(Upper("name"), name="gin_trgm_ops"), name="tasktag_name_trgm"),
+        ]
         verbose_name = "Tag"
         verbose_name_plural = "Tags"
 
@@ -2,10 +2,13 @@ from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.urls import reverse
 from django.utils import timezone
 
 from core.models.mixins import InfoManager, InfoMixin
+from apps.projects.constants import TASK_SEARCH_CONFIG
 from apps.projects.models import modules, projects, tags
 from apps.workspace.models import workspace, workspace_config
 from apps.workspace.validators import all_user_in_workspace, tasks_states_in_workspace
@@ -105,6 +108,16 @@ class Task(InfoMixin):
     )
     is_archive = models.BooleanField(default=False)
 
+    # Weighted full-text document, the title ranks above the description
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector("title", weight="A", config=TASK_SEARCH_CONFIG)
+            + SearchVector("description", weight="B", config=TASK_SEARCH_CONFIG)
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
     # Default manager | To work with active tasks
     objects = ActiveTaskManager()
 
@@ -115,6 +128,16 @@ class Task(InfoMixin):
         indexes = [
             models.Index(fields=["workspace", "project"]),
             models.Index(fields=["project"]),
+            models.Index(fields=["project", "-created_at", "-id"]),
+            models.Index(fields=["project", "updated_at"]),
+            models.Index(fields=["project", "deadline"]),
+            models.Index(fields=["workspace", "updated_at", "id"]),
+            models.Index(
+                fields=["archive_at"],
+                condition=models.Q(is_archive=False, archive_at__isnull=False),
+                name="task_archive_due",
+            ),
+            GinIndex(fields=["search_vector"]),
         ]
         verbose_name = "Task"
         verbose_name_plural = "Tasks"
@@ -1,5 +1,6 @@
-from drf_spectacular.utils import extend_schema, extend_schema_view
-from apps.projects.serializers import projects
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
+from apps.projects.serializers import projects, tasks
 
 
 project_schema = extend_schema_view(
@@ -65,6 +66,20 @@ module_schema = extend_schema_view(
         summary="Delete Module", 
         tags=["Workspace -> Projects -> Modules"]
     ),
+
+    timeline=extend_schema(
+        tags=["Workspace -> Projects -> Modules"],
+        summary="Modules Timeline",
+        description=(
+            "Modules whose `date_start`-`date_end` period overlaps the `[from, to)` window, "
+            "ordered by `date_start`. A module without one of the dates is open on that side, "
+            "modules without both dates are not returned. The window is at most 93 days long."
+        ),
+        parameters=[
+            OpenApiParameter("from", OpenApiTypes.DATETIME, OpenApiParameter.QUERY, required=True),
+            OpenApiParameter("to", OpenApiTypes.DATETIME, OpenApiParameter.QUERY, required=True),
+        ],
+    ),
 )
 
 
@@ -73,7 +88,11 @@ task_schema = extend_schema_view(
         tags=["Workspace -> Projects -> Tasks"],
         summary="Retrieve Task(s)",
         description=(
-            "Retrieve a list of tasks within a project or a specific task if task_id is provided."
+            "Retrieve a list of tasks within a project or a specific task if task_id is provided. "
+            "Pass `?stream=1` or `Accept: application/x-ndjson` to stream all tasks "
+            "as newline-delimited JSON instead of paginated pages. "
+            "The saved display filters of the user are applied, pass `?display_filters=0` "
+            "to get all tasks."
         ),
     ),
     create=extend_schema(
@@ -81,6 +100,61 @@ task_schema = extend_schema_view(
         summary="Create Task",
         description="Create a new task within a specific project.",
     ),
+    bulk_create=extend_schema(
+        tags=["Workspace -> Projects -> Tasks"],
+        summary="Create Tasks in bulk",
+        description=(
+            "Create up to 2000 tasks within a specific project in one request. "
+            "Activity logs and assignee notifications are sent once per request."
+        ),
+        request=tasks.TaskCreateSerializer(many=True),
+    ),
+    board=extend_schema(
+        tags=["Workspace -> Projects -> Tasks"],
+        summary="Task Board",
+        description=(
+            "Tasks of a project grouped by the `group_by` of the user's workspace config "
+            "and ordered by its `order_by`. Every group contains its total `count` and at most "
+            "`?limit=` tasks (20 by default, 100 at most). Empty groups are returned when "
+            "`show_empty_groups` is enabled."
+        ),
+        parameters=[OpenApiParameter("limit", int, OpenApiParameter.QUERY, required=False)],
+    ),
+    search=extend_schema(
+        tags=["Workspace -> Projects -> Tasks"],
+        summary="Search Tasks",
+        description=(
+            "Ranked full-text search over the title and the description of active and archived "
+            "tasks of a project. `q` accepts web search syntax: quoted phrases, `or` and `-word`. "
+            "Matched words are wrapped in `<mark>` tags. At most `?limit=` results are returned."
+        ),
+        parameters=[
+            OpenApiParameter("q", str, OpenApiParameter.QUERY, required=True),
+            OpenApiParameter("limit", int, OpenApiParameter.QUERY, required=False),
+        ],
+    ),
+    calendar=extend_schema(
+        tags=["Workspace -> Projects -> Tasks"],
+        summary="Tasks Calendar",
+        description=(
+            "Tasks of a project with a `deadline` in the `[from, to)` window, ordered by "
+            "the deadline. The saved display filters of the user are applied. "
+            "The window is at most 93 days long."
+        ),
+        parameters=[
+            OpenApiParameter("from", OpenApiTypes.DATETIME, OpenApiParameter.QUERY, required=True),
+            OpenApiParameter("to", OpenApiTypes.DATETIME, OpenApiParameter.QUERY, required=True),
+        ],
+    ),
+    bulk_update=extend_schema(
+        tags=["Workspace -> Projects -> Tasks"],
+        summary="Update Tasks in bulk",
+        description=(
+            "Apply one set of changes to up to 2000 tasks of a specific project. "
+            "Assignees and tags replace the current ones. Every subscriber receives "
+            "one notification for the whole request."
+        ),
+    ),
     retrieve=extend_schema(
         tags=["Workspace -> Projects -> Tasks"],
         summary="Retrieve Task",
@@ -143,7 +217,12 @@ archive_task = extend_schema(
 
 
 transfer_task_between_module_schema = extend_schema(
-    summary="Transfer tasks between modules", tags=["Workspace -> Projects -> Tasks Utils"]
+    summary="Transfer tasks between modules",
+    description=(
+        "Moves active tasks to a module. Tasks from other projects of the workspace "
+        "are moved to the project of the module."
+    ),
+    tags=["Workspace -> Projects -> Tasks Utils"],
 )
 
 
@@ -160,3 +239,23 @@ unsubscribe_user_to_task_schema = extend_schema(
 dashboard_task = extend_schema_view(
     list=extend_schema(summary="User Task List", tags=["Dashboard"]),
 )
+
+
+delta_sync_schema = extend_schema_view(
+    get=extend_schema(
+        tags=["Workspace -> Sync"],
+        summary="Changes of the workspace since a cursor",
+        description="""
+- Returns projects, modules and tasks created or updated after the `since` cursor
+- `tombstones` lists the deleted projects, modules and tasks and the archived tasks.
+  A deleted project also removes its modules and tasks, a deleted module unlinks its tasks
+- Apply the rows first and the tombstones after them
+- Pass the returned `cursor` as `since` in the next call, repeat while `has_more` is true
+- Without `since` the whole workspace is returned page by page
+""",
+        parameters=[
+            OpenApiParameter("since", str, OpenApiParameter.QUERY),
+            OpenApiParameter("limit", int, OpenApiParameter.QUERY),
+        ],
+    ),
+)
@@ -5,6 +5,7 @@ from apps.projects.models import modules
 from core.serializers.mixins import InfoSerializerMixin
 from apps.projects.serializers.projects import ProjectShortReadOnlySerializer
 from apps.projects.validators import validate_start_end_dates
+from apps.workspace.constant import TaskStateChoices
 from apps.workspace.serializers.workspace import WorkspaceShortSerializer
 
 User = get_user_model()
@@ -20,13 +21,32 @@ class ModuleReadOnlySerializer(InfoSerializerMixin):
     project = ProjectShortReadOnlySerializer(read_only=True)
     workspace = WorkspaceShortSerializer(read_only=True)
 
-    tasks_count = serializers.IntegerField(read_only=True)
-    completed_tasks_count = serializers.IntegerField(read_only=True)
+    tasks_count = serializers.SerializerMethodField(read_only=True)
+    completed_tasks_count = serializers.SerializerMethodField(read_only=True)
+    state_types_count = serializers.SerializerMethodField(read_only=True)
     absolute_url = serializers.SerializerMethodField(read_only=True)
 
 
     def get_status(self, obj):
         return obj.get_status_display()
+
+    def get_tasks_count(self, obj) -> int:
+        return sum(counter.tasks_count for counter in obj.state_counters.all())
+
+    def get_completed_tasks_count(self, obj) -> int:
+        return sum(
+            counter.tasks_count
+            for counter in obj.state_counters.all()
+            if counter.state_type == TaskStateChoices.COMPLETED
+        )
+
+    def get_state_types_count(self, obj) -> dict[int, int]:
+        """Tasks count per state type, `0` is used for tasks without a state"""
+        return {
+            counter.state_type: counter.tasks_count
+            for counter in obj.state_counters.all()
+            if counter.tasks_count
+        }
     
     def get_absolute_url(self, obj):
         return obj.get_absolute_url()
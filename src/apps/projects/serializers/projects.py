@@ -21,8 +21,8 @@ class ProjectReadOnlySerializer(InfoSerializerMixin):
 
     user_is_author = serializers.BooleanField(read_only=True)
     user_is_manager = serializers.BooleanField(read_only=True)
-    total_active_tasks = serializers.IntegerField(read_only=True)
-    total_archived_tasks = serializers.IntegerField(read_only=True)
+    total_active_tasks = serializers.IntegerField(source="active_tasks_count", read_only=True)
+    total_archived_tasks = serializers.IntegerField(source="archived_tasks_count", read_only=True)
     absolute_url = serializers.SerializerMethodField()
 
     def get_absolute_url(self, obj):
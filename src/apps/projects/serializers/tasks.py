@@ -9,6 +9,9 @@ from apps.users.serializers import users
 from apps.workspace.serializers.workspace import WorkspaceShortSerializer
 from apps.workspace.serializers.workspace_config import TaskStatesSerializer, TaskStatesSerializerLite
 
+TASK_BULK_CREATE_LIMIT = 2000
+TASK_BULK_UPDATE_LIMIT = 2000
+
 
 class TaskReadOnlySerializer(InfoSerializerMixin):
     id = serializers.IntegerField(read_only=True)
@@ -73,6 +76,13 @@ class TaskUpdateSerializer(serializers.Serializer):
         )
 
 
+class TaskBulkUpdateSerializer(serializers.Serializer):
+    tasks = serializers.ListField(
+        child=serializers.IntegerField(), allow_empty=False, max_length=TASK_BULK_UPDATE_LIMIT
+    )
+    changes = TaskUpdateSerializer()
+
+
 class DashboardTaskSerializer(TagSerializerMixin,serializers.ModelSerializer):
     project = ProjectShortReadOnlySerializer()
     module = ModuleShortReadOnlySerializer()
@@ -0,0 +1,365 @@
+"""
+Lean read path for task lists.
+
+These serializers produce the same JSON as `TaskReadOnlySerializer` and
+`DashboardTaskSerializer`, but work on flat `values()` rows instead of model instances:
+
+- Related rows (users, states, projects, modules, workspaces, tags) are loaded
+  with one `values_list()` query per relation into dictionaries
+- Every nested object is built by a row-to-dict function compiled once per batch
+- `absolute_url` fields are formatted from URL templates reversed once per process
+"""
+from functools import lru_cache
+from collections import defaultdict
+
+from django.core.files.storage import default_storage
+from django.db.models import QuerySet
+from django.urls import reverse
+from rest_framework import serializers
+
+from apps.projects.constants import ModuleChoice
+from apps.projects.models.modules import Module
+from apps.projects.models.projects import Project
+from apps.projects.models.tasks import Task
+from apps.users.models.users import User
+from apps.workspace.models.workspace import Workspace, WorkspaceMember
+from apps.workspace.models.workspace_config import ProjectState, TaskState
+
+URL_SENTINEL = 9_000_000_000
+MODULE_STATUS_DISPLAY = dict(ModuleChoice.CHOICES)
+
+datetime_representation = serializers.DateTimeField().to_representation
+
+
+@lru_cache
+def url_template(viewname: str, *kwargs_names: str) -> str:
+    """Reverses the URL once and turns it into a `str.format` template"""
+    sentinels = {name: URL_SENTINEL + i for i, name in enumerate(kwargs_names)}
+    url = reverse(viewname, kwargs=sentinels)
+    for name, sentinel in sentinels.items():
+        url = url.replace(str(sentinel), "{%s}" % name)
+    return url
+
+
+def to_datetime(value):
+    return None if value is None else datetime_representation(value)
+
+
+class LeanTaskSerializerBase:
+    """Base class of the lean serializers, supports only `many=True`"""
+
+    values_fields: tuple[str, ...] = ()
+
+    def __init__(self, instance, many=True, context=None):
+        self.rows = list(instance)
+        self.context = context or {}
+
+    @classmethod
+    def values(cls, queryset: QuerySet, *extra_fields: str) -> QuerySet:
+        """Turns a Task queryset into a queryset of flat rows for this serializer"""
+        return queryset.prefetch_related(None).values(*cls.values_fields, *extra_fields)
+
+    @property
+    def data(self) -> list[dict]:
+        if not self.rows:
+            return []
+        to_representation = self.compile()
+        return [to_representation(row) for row in self.rows]
+
+    def compile(self):
+        raise NotImplementedError("Please implement in the serializer class")
+
+    # Batched loaders
+
+    @staticmethod
+    def load_related_ids(through, task_ids: list[int], related_field: str) -> dict[int, list[int]]:
+        related = defaultdict(list)
+        rows = through.objects.filter(task_id__in=task_ids).order_by("id").values_list(
+            "task_id", related_field
+        )
+        for task_id, related_id in rows:
+            related[task_id].append(related_id)
+        return related
+
+    @staticmethod
+    def load_users(users_ids: set[int]) -> dict[int, tuple]:
+        rows = User.objects.filter(id__in=users_ids).values_list(
+            "id", "username", "user_avatar__image"
+        )
+        return {row[0]: row for row in rows}
+
+    @staticmethod
+    def load_roles(workspaces_ids: set[int], users_ids: set[int]) -> dict[tuple[int, int], int]:
+        rows = WorkspaceMember.objects.filter(
+            workspace_id__in=workspaces_ids, user_id__in=users_ids
+        ).values_list("workspace_id", "user_id", "role")
+        return {(workspace_id, user_id): role for workspace_id, user_id, role in rows}
+
+    @staticmethod
+    def load_tags(task_ids: list[int]) -> dict[int, list[tuple]]:
+        tags = defaultdict(list)
+        rows = Task.tags.through.objects.filter(task_id__in=task_ids).order_by("id").values_list(
+            "task_id", "tasktag_id", "tasktag__name"
+        )
+        for task_id, tag_id, name in rows:
+            tags[task_id].append((tag_id, name))
+        return tags
+
+    @staticmethod
+    def load_task_states(states_ids: set[int]) -> dict[int, tuple]:
+        rows = TaskState.objects.filter(id__in=states_ids).values_list(
+            "id", "name", "type", "workspace_id"
+        )
+        return {row[0]: row for row in rows}
+
+    @staticmethod
+    def load_projects(projects_ids: set[int]) -> dict[int, tuple]:
+        rows = Project.objects.filter(id__in=projects_ids).values_list(
+            "id", "name", "state_id", "workspace_id"
+        )
+        return {row[0]: row for row in rows}
+
+    @staticmethod
+    def load_project_states(states_ids: set[int]) -> dict[int, tuple]:
+        rows = ProjectState.objects.filter(id__in=states_ids).values_list(
+            "id", "name", "type", "workspace_id"
+        )
+        return {row[0]: row for row in rows}
+
+    @staticmethod
+    def load_modules(modules_ids: set[int]) -> dict[int, tuple]:
+        rows = Module._base_manager.filter(id__in=modules_ids).values_list(
+            "id", "name", "status", "project_id", "workspace_id"
+        )
+        return {row[0]: row for row in rows}
+
+    @staticmethod
+    def load_workspaces(workspaces_ids: set[int]) -> dict[int, tuple]:
+        rows = Workspace._base_manager.filter(id__in=workspaces_ids).values_list(
+            "id", "name", "owner_id"
+        )
+        return {row[0]: row for row in rows}
+
+    # Row-to-dict builders
+
+    def compile_user(self, users: dict[int, tuple]):
+        """UserShortSerializer"""
+        user_url = url_template("api:users-profile", "user_id")
+        request = self.context.get("request")
+
+        def avatar_url(image):
+            if not image:
+                return None
+            url = default_storage.url(image)
+            return request.build_absolute_uri(url) if request else url
+
+        def to_user(user_id):
+            user = users.get(user_id)
+            if user is None:
+                return None
+            return {
+                "id": user[0],
+                "username": user[1],
+                "absolute_url": user_url.format(user_id=user[0]),
+                "user_avatar": avatar_url(user[2]),
+            }
+
+        return to_user
+
+    def compile_project(self, projects: dict[int, tuple], project_states: dict[int, tuple]):
+        """ProjectShortReadOnlySerializer"""
+        project_url = url_template("api:projects-detail", "workspace_id", "project_id")
+
+        def to_project(project_id):
+            project = projects.get(project_id)
+            if project is None:
+                return None
+            state = project_states.get(project[2])
+            return {
+                "id": project[0],
+                "name": project[1],
+                "state": None if state is None else {
+                    "id": state[0],
+                    "name": state[1],
+                    "type": state[2],
+                    "workspace": state[3],
+                },
+                "absolute_url": project_url.format(workspace_id=project[3], project_id=project[0]),
+            }
+
+        return to_project
+
+    def compile_module(self, modules: dict[int, tuple]):
+        """ModuleShortReadOnlySerializer"""
+        module_url = url_template(
+            "api:project-modules-detail", "workspace_id", "project_id", "module_id"
+        )
+
+        def to_module(module_id):
+            module = modules.get(module_id)
+            if module is None:
+                return None
+            return {
+                "id": module[0],
+                "name": module[1],
+                "status": MODULE_STATUS_DISPLAY.get(module[2], module[2]),
+                "absolute_url": module_url.format(
+                    workspace_id=module[4], project_id=module[3], module_id=module[0]
+                ),
+            }
+
+        return to_module
+
+
+class LeanTaskReadOnlySerializer(LeanTaskSerializerBase):
+    """Same output as `TaskReadOnlySerializer`. Rows must be annotated with `is_subscriber`"""
+
+    values_fields = (
+        "id",
+        "title",
+        "description",
+        "priority",
+        "deadline",
+        "resolution_text",
+        "created_at",
+        "updated_at",
+        "created_by_id",
+        "updated_by_id",
+        "state_id",
+        "workspace_id",
+        "project_id",
+        "module_id",
+        "is_subscriber",
+    )
+
+    def compile(self):
+        rows = self.rows
+        task_ids = [row["id"] for row in rows]
+
+        assignees = self.load_related_ids(Task.assignees.through, task_ids, "user_id")
+        tags = self.load_tags(task_ids)
+        workspaces = self.load_workspaces({row["workspace_id"] for row in rows})
+        projects = self.load_projects({row["project_id"] for row in rows})
+
+        users_ids = {user_id for ids in assignees.values() for user_id in ids}
+        users_ids |= {row["created_by_id"] for row in rows} | {row["updated_by_id"] for row in rows}
+        users_ids |= {workspace[2] for workspace in workspaces.values()}
+        users_ids.discard(None)
+
+        users = self.load_users(users_ids)
+        roles = self.load_roles(set(workspaces), users_ids)
+        states = self.load_task_states({row["state_id"] for row in rows} - {None})
+        project_states = self.load_project_states(
+            {project[2] for project in projects.values()} - {None}
+        )
+        modules = self.load_modules({row["module_id"] for row in rows} - {None})
+
+        to_user = self.compile_user(users)
+        to_project = self.compile_project(projects, project_states)
+        to_module = self.compile_module(modules)
+        workspace_url = url_template("api:workspace-detail", "workspace_id")
+
+        def to_assignee(workspace_id, user_id):
+            assignee = to_user(user_id)
+            if assignee is not None:
+                assignee["role"] = roles.get((workspace_id, user_id))
+            return assignee
+
+        def to_workspace(workspace_id):
+            workspace = workspaces.get(workspace_id)
+            if workspace is None:
+                return None
+            return {
+                "id": workspace[0],
+                "owner": to_user(workspace[2]),
+                "name": workspace[1],
+                "absolute_url": workspace_url.format(workspace_id=workspace[0]),
+            }
+
+        def to_state(state_id):
+            state = states.get(state_id)
+            if state is None:
+                return None
+            return {"id": state[0], "name": state[1], "type": state[2]}
+
+        def to_task(row):
+            task_id = row["id"]
+            workspace_id = row["workspace_id"]
+            return {
+                "created_at": to_datetime(row["created_at"]),
+                "updated_at": to_datetime(row["updated_at"]),
+                "created_by": to_user(row["created_by_id"]),
+                "updated_by": to_user(row["updated_by_id"]),
+                "id": task_id,
+                "title": row["title"],
+                "description": row["description"],
+                "assignees": [
+                    to_assignee(workspace_id, user_id) for user_id in assignees.get(task_id, ())
+                ],
+                "tags": [{"id": tag_id, "name": name} for tag_id, name in tags.get(task_id, ())],
+                "state": to_state(row["state_id"]),
+                "priority": row["priority"],
+                "deadline": to_datetime(row["deadline"]),
+                "resolution_text": row["resolution_text"],
+                "workspace": to_workspace(workspace_id),
+                "project": to_project(row["project_id"]),
+                "module": to_module(row["module_id"]),
+                "is_subscriber": bool(row["is_subscriber"]),
+            }
+
+        return to_task
+
+
+class LeanDashboardTaskSerializer(LeanTaskSerializerBase):
+    """Same output as `DashboardTaskSerializer`"""
+
+    values_fields = (
+        "id",
+        "title",
+        "deadline",
+        "priority",
+        "state_id",
+        "module_id",
+        "project_id",
+    )
+
+    def compile(self):
+        rows = self.rows
+        task_ids = [row["id"] for row in rows]
+
+        assignees = self.load_related_ids(Task.assignees.through, task_ids, "user_id")
+        tags = self.load_tags(task_ids)
+        projects = self.load_projects({row["project_id"] for row in rows})
+
+        users = self.load_users({user_id for ids in assignees.values() for user_id in ids})
+        states = self.load_task_states({row["state_id"] for row in rows} - {None})
+        project_states = self.load_project_states(
+            {project[2] for project in projects.values()} - {None}
+        )
+        modules = self.load_modules({row["module_id"] for row in rows} - {None})
+
+        to_user = self.compile_user(users)
+        to_project = self.compile_project(projects, project_states)
+        to_module = self.compile_module(modules)
+
+        def to_state(state_id):
+            state = states.get(state_id)
+            if state is None:
+                return None
+            return {"id": state[0], "name": state[1], "type": state[2], "workspace": state[3]}
+
+        def to_task(row):
+            task_id = row["id"]
+            return {
+                "id": task_id,
+                "title": row["title"],
+                "deadline": to_datetime(row["deadline"]),
+                "priority": row["priority"],
+                "assignees": [to_user(user_id) for user_id in assignees.get(task_id, ())],
+                "state": to_state(row["state_id"]),
+                "module": to_module(row["module_id"]),
+                "tags_names": [name for _, name in tags.get(task_id, ())],
+                "project": to_project(row["project_id"]),
+            }
+
+        return to_task
@@ -0,0 +1,97 @@
+"""
+Archive schedule of completed tasks.
+
+The due archiving time of every completed task is kept in a Redis sorted set:
+the member is the task id and the score is the `archive_at` timestamp.
+
+- A task is scheduled or rescheduled when it gets an `archive_at` date and cancelled
+  when it leaves the COMPLETED state or is archived. The schedule is written after the
+  commit, a rolled back change never gets into it
+- The dispatcher pops only the due tasks, atomically, so concurrent dispatchers never
+  process the same task twice
+- The schedule is an optimization: an entry lost with Redis is picked up by the
+  periodic sweep of `TaskArchiverService`
+- `backfill_schedule` fills the schedule from the `task_archive_due` index once, when
+  the marker under `BACKFILL_KEY` is missing: on the first run after an upgrade and after
+  Redis lost its data
+"""
+from collections.abc import Mapping
+from datetime import datetime
+
+from django.db import transaction
+from redis.exceptions import RedisError
+
+from core.cache import get_redis_client
+from apps.projects.models.tasks import Task
+
+SCHEDULE_KEY = "archive_schedule"
+BACKFILL_KEY = "archive_schedule:backfilled"
+BACKFILL_BATCH_SIZE = 5000
+
+POP_DUE_SCRIPT = """
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+if #ids > 0 then
+    redis.call('ZREM', KEYS[1], unpack(ids))
+end
+return ids
+"""
+
+
+def schedule_archive(archive_dates: Mapping[int, datetime | None]) -> None:
+    """Registers the archiving dates of tasks after the commit, `None` cancels the archiving"""
+    archive_dates = dict(archive_dates)
+    if archive_dates:
+        transaction.on_commit(lambda: write_schedule(archive_dates), robust=True)
+
+
+def write_schedule(archive_dates: Mapping[int, datetime | None]) -> None:
+    due = {task_id: date.timestamp() for task_id, date in archive_dates.items() if date}
+    cancelled = [task_id for task_id, date in archive_dates.items() if not date]
+
+    pipeline = get_redis_client().pipeline(transaction=False)
+    if due:
+        pipeline.zadd(SCHEDULE_KEY, due)
+    if cancelled:
+        pipeline.zrem(SCHEDULE_KEY, *cancelled)
+    pipeline.execute()
+
+
+def pop_due(now: datetime, limit: int) -> list[int]:
+    """Removes and returns up to `limit` tasks that are due at `now`"""
+    try:
+        pop = get_redis_client().register_script(POP_DUE_SCRIPT)
+        ids = pop(keys=[SCHEDULE_KEY], args=[now.timestamp(), limit])
+    except RedisError:
+        return []
+    return [int(task_id) for task_id in ids]
+
+
+def backfill_schedule() -> int:
+    """Schedules all tasks with an archiving date, once per Redis dataset"""
+    client = get_redis_client()
+    try:
+        if not client.set(BACKFILL_KEY, 1, nx=True):
+            return 0
+    except RedisError:
+        return 0
+
+    total = 0
+    batch = {}
+    try:
+        tasks = Task._base_manager.filter(is_archive=False, archive_at__isnull=False)
+        for task_id, archive_at in tasks.values_list("id", "archive_at").iterator(
+            chunk_size=BACKFILL_BATCH_SIZE
+        ):
+            batch[task_id] = archive_at
+            if len(batch) >= BACKFILL_BATCH_SIZE:
+                write_schedule(batch)
+                total += len(batch)
+                batch = {}
+        if batch:
+            write_schedule(batch)
+            total += len(batch)
+    except Exception:
+        # The next run starts over
+        client.delete(BACKFILL_KEY)
+        raise
+    return total
@@ -0,0 +1,196 @@
+"""
+Delta sync of a workspace.
+
+A client keeps an opaque cursor and asks for everything that changed after it. The cursor
+holds the `(updated_at, id)` key of the last row returned from every stream, so each stream
+is read with a range scan of its `(workspace, updated_at, id)` index and the cost depends
+on the number of changes, not on the size of the workspace.
+
+- `projects`, `modules` and `tasks` contain the created and updated rows
+- `tombstones` contains the deleted rows (from the `Tombstone` table) and the archived tasks.
+  A restored task has a newer `updated_at`, so it comes back in `tasks` after its tombstone
+- `updated_at` is taken before the commit, so a row may become visible after the cursor
+  passed its key. Every call reads only up to the sync horizon, see `get_sync_horizon`:
+  the start of the oldest writing transaction that is still open, minus `SYNC_LAG` for the
+  time between taking `updated_at` and the first write. Rows of transactions open for
+  longer than `SYNC_MAX_LAG` can still be skipped, a client recovers from that, or from an
+  invalid cursor, with a full resync: a call without `since`
+- Task counters change `updated_at` of their project and module, so the counts of synced
+  projects and modules follow the tasks
+"""
+import base64
+import json
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from django.db import connection
+from django.db.models import Case, Exists, OuterRef, Q, QuerySet, When
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ValidationError
+
+from core.services.baseservice import BaseService
+from apps.projects.constants import SyncEntityChoice
+from apps.projects.models.modules import Module
+from apps.projects.models.projects import Project
+from apps.projects.models.sync import Tombstone
+from apps.projects.models.tasks import Task, TaskSubscriber
+from apps.projects.serializers.modules import ModuleReadOnlySerializer
+from apps.projects.serializers.projects import ProjectReadOnlySerializer
+from apps.projects.serializers.tasks_lean import LeanTaskReadOnlySerializer, to_datetime
+from apps.users.models.users import User
+
+SYNC_LAG = timedelta(seconds=5)
+# A long transaction holds the sync back at most this long
+SYNC_MAX_LAG = timedelta(minutes=10)
+ENTITY_NAMES = dict(SyncEntityChoice.CHOICES)
+
+
+def encode_cursor(positions: dict[str, tuple]) -> str:
+    payload = {name: [value.isoformat(), pk] for name, (value, pk) in positions.items()}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str | None) -> dict[str, tuple]:
+    if not cursor:
+        return {}
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        positions = {}
+        for name in DeltaSyncService.STREAMS:
+            if name in payload:
+                value, pk = payload[name]
+                value = parse_datetime(value)
+                if value is None:
+                    raise ValueError(value)
+                positions[name] = (value, int(pk))
+    except Exception:
+        raise ValidationError({"since": "Invalid cursor"})
+    return positions
+
+
+def get_sync_horizon():
+    """Time before which the rows of every committed and open transaction are visible.
+
+    Only the transactions that wrote something count, read-only ones never hold the sync
+    back. The transactions of other database roles are visible with `pg_read_all_stats`.
+    """
+    now = timezone.now()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT MIN(xact_start) FROM pg_stat_activity
+            WHERE datname = current_database()
+                AND pid <> pg_backend_pid()
+                AND backend_xid IS NOT NULL
+            """
+        )
+        oldest = cursor.fetchone()[0]
+    start = max(min(now, oldest or now), now - SYNC_MAX_LAG)
+    return start - SYNC_LAG
+
+
+@dataclass
+class DeltaSyncService(BaseService):
+    workspace_id: int
+    user: User
+    since: str | None = None
+    limit: int = 500
+    context: dict = field(default_factory=dict)
+
+    STREAMS = ("projects", "modules", "tasks", "tombstones")
+
+    def execute(self) -> dict:
+        positions = decode_cursor(self.since)
+        until = get_sync_horizon()
+
+        streams = {
+            "projects": (self.get_projects(), "updated_at"),
+            "modules": (self.get_modules(), "updated_at"),
+            "tasks": (self.get_tasks(), "updated_at"),
+            "tombstones": (
+                Tombstone.objects.filter(workspace_id=self.workspace_id),
+                "deleted_at",
+            ),
+        }
+
+        pages = {}
+        has_more = False
+        for name, (queryset, key) in streams.items():
+            rows, more = self.fetch(queryset, key, positions.get(name), until)
+            if rows:
+                positions[name] = self.get_position(rows[-1], key)
+            pages[name] = rows
+            has_more = has_more or more
+
+        tasks, archived = [], []
+        for row in pages["tasks"]:
+            (archived if row["is_archive"] else tasks).append(row)
+
+        return {
+            "projects": ProjectReadOnlySerializer(pages["projects"], many=True).data,
+            "modules": ModuleReadOnlySerializer(pages["modules"], many=True).data,
+            "tasks": LeanTaskReadOnlySerializer(tasks, many=True, context=self.context).data,
+            "tombstones": [self.to_tombstone(tombstone) for tombstone in pages["tombstones"]]
+            + [self.to_archived(row) for row in archived],
+            "cursor": encode_cursor(positions),
+            "has_more": has_more,
+        }
+
+    def fetch(self, queryset: QuerySet, key: str, position: tuple | None, until) -> tuple[list, bool]:
+        queryset = queryset.filter(**{f"{key}__lte": until})
+        if position is not None:
+            value, pk = position
+            queryset = queryset.filter(Q(**{f"{key}__gt": value}) | Q(**{key: value, "id__gt": pk}))
+
+        rows = list(queryset.order_by(key, "id")[: self.limit + 1])
+        return rows[: self.limit], len(rows) > self.limit
+
+    @staticmethod
+    def get_position(row, key: str) -> tuple:
+        if isinstance(row, dict):
+            return row[key], row["id"]
+        return getattr(row, key), row.pk
+
+    def get_projects(self) -> QuerySet:
+        return (
+            Project.objects.filter(workspace_id=self.workspace_id)
+            .select_related("workspace__owner__user_avatar", "manager__user_avatar", "state")
+            .annotate(
+                user_is_author=Case(When(created_by=self.user, then=True), default=False),
+                user_is_manager=Case(When(manager=self.user, then=True), default=False),
+            )
+        )
+
+    def get_modules(self) -> QuerySet:
+        return (
+            Module.objects.filter(workspace_id=self.workspace_id)
+            .select_related("project__state", "project__workspace", "workspace__owner__user_avatar")
+            .prefetch_related("state_counters")
+        )
+
+    def get_tasks(self) -> QuerySet:
+        tasks = Task._base_manager.filter(workspace_id=self.workspace_id).annotate(
+            is_subscriber=Exists(
+                TaskSubscriber.objects.filter(task=OuterRef("pk"), subscriber=self.user)
+            )
+        )
+        return LeanTaskReadOnlySerializer.values(tasks, "is_archive")
+
+    @staticmethod
+    def to_tombstone(tombstone: Tombstone) -> dict:
+        return {
+            "type": ENTITY_NAMES[tombstone.entity_type],
+            "id": tombstone.entity_id,
+            "reason": "deleted",
+            "at": to_datetime(tombstone.deleted_at),
+        }
+
+    @staticmethod
+    def to_archived(row: dict) -> dict:
+        return {
+            "type": ENTITY_NAMES[SyncEntityChoice.TASK],
+            "id": row["id"],
+            "reason": "archived",
+            "at": to_datetime(row["updated_at"]),
+        }
@@ -0,0 +1,62 @@
+"""
+Materialized progress of modules.
+
+Every module keeps the number of its tasks per state type in `ModuleStateCounter`.
+Changes are applied as `(module_id, state_type, delta)` events whenever a task is
+created, deleted, or changes its module or state, so module lists read precomputed
+numbers instead of aggregating over all tasks. `updated_at` of a module moves with its
+counters, so the delta sync sends the new progress.
+"""
+from collections import Counter
+from collections.abc import Iterable
+
+from django.db.models import F
+from django.utils import timezone
+
+from apps.projects.models.modules import Module, ModuleStateCounter
+from apps.workspace.models.workspace_config import TaskState
+
+NO_STATE = 0
+
+
+def change_module_progress(changes: Iterable[tuple[int | None, int | None, int]]) -> None:
+    """Applies `(module_id, state_type, delta)` events, events of tasks without a module are skipped"""
+    totals = Counter()
+    for module_id, state_type, delta in changes:
+        if module_id is not None:
+            totals[(module_id, state_type or NO_STATE)] += delta
+
+    totals = {key: delta for key, delta in totals.items() if delta}
+    if not totals:
+        return
+
+    # Counter rows are created only for incoming tasks, a module that is being
+    # deleted never gets new rows from the deletion of its tasks
+    ModuleStateCounter.objects.bulk_create(
+        [
+            ModuleStateCounter(module_id=module_id, state_type=state_type)
+            for (module_id, state_type), delta in totals.items()
+            if delta > 0
+        ],
+        ignore_conflicts=True,
+    )
+    for (module_id, state_type), delta in sorted(totals.items()):
+        ModuleStateCounter.objects.filter(module_id=module_id, state_type=state_type).update(
+            tasks_count=F("tasks_count") + delta
+        )
+    Module._base_manager.filter(pk__in={module_id for module_id, _ in totals}).update(
+        updated_at=timezone.now()
+    )
+
+
+def move_task(before: tuple[int | None, int | None], after: tuple[int | None, int | None]) -> None:
+    """Moves one task between `(module_id, state_type)` pairs"""
+    if before != after:
+        change_module_progress([(*before, -1), (*after, 1)])
+
+
+def get_states_types(states_ids: Iterable[int | None]) -> dict[int, int]:
+    states_ids = set(states_ids) - {None}
+    if not states_ids:
+        return {}
+    return dict(TaskState.objects.filter(id__in=states_ids).values_list("id", "type"))
@@ -1,22 +1,110 @@
+from collections import OrderedDict
 from dataclasses import dataclass
+from threading import Lock
+
+from django.core.cache import cache
+from django.db import connection, transaction
 
 from core.services.baseservice import BaseService
 from apps.projects.models.tags import TaskTag
 
 
+VERSION_KEY = "tag_ids:version"
+
+
+class TagIdCache:
+    """Per-process LRU of tag names to ids.
+
+    Deleting a tag bumps the shared version under `VERSION_KEY`, see `tags_signals.py`.
+    Every process compares it with the version of its entries and drops them when it
+    changed, so no process hands out the id of a deleted tag.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.items = OrderedDict()
+        self.lock = Lock()
+        self.version = None
+
+    def get_many(self, names: list[str]) -> dict[str, int]:
+        found = {}
+        version = cache.get(VERSION_KEY, 0)
+        with self.lock:
+            if version != self.version:
+                self.items.clear()
+                self.version = version
+            for name in names:
+                if name in self.items:
+                    self.items.move_to_end(name)
+                    found[name] = self.items[name]
+        return found
+
+    def set_many(self, mapping: dict[str, int]) -> None:
+        with self.lock:
+            for name, tag_id in mapping.items():
+                self.items[name] = tag_id
+                self.items.move_to_end(name)
+            while len(self.items) > self.maxsize:
+                self.items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.items.clear()
+
+    def evict(self, tags_ids: set[int]) -> None:
+        """Drops the deleted tags here and makes the other processes drop their entries"""
+        with self.lock:
+            for name in [name for name, tag_id in self.items.items() if tag_id in tags_ids]:
+                del self.items[name]
+        cache.add(VERSION_KEY, 0, None)
+        cache.incr(VERSION_KEY)
+
+
 @dataclass
 class TagService(BaseService):
     raw_tags: list[str]
 
+    ids_cache = TagIdCache(maxsize=10_000)
+
     @staticmethod
     def get_tags_entity_by_string(raw_tags: list[str]) -> list[TaskTag]:
         """
         Retrieve or create tags from raw tag names.
+
+        All names are resolved with at most two queries: one
+        `INSERT ... ON CONFLICT DO NOTHING RETURNING` for the new names and one
+        `SELECT` for the existing ones. Known names are taken from the per-process cache.
         """
-        tags = []
-        for raw_tag in raw_tags:
-            tag_name = raw_tag.strip().lower()
-            tag, _ = TaskTag.objects.get_or_create(name=tag_name)
-            tags.append(tag)
+        names = list(dict.fromkeys(filter(None, map(TagService.normalize, raw_tags))))
+        ids = TagService.resolve_ids(names)
+        return [TaskTag.from_db(connection.alias, ["id", "name"], [ids[name], name]) for name in names]
+
+    @staticmethod
+    def resolve_ids(names: list[str]) -> dict[str, int]:
+        ids = TagService.ids_cache.get_many(names)
+        missing = sorted(name for name in names if name not in ids)
+        if not missing:
+            return ids
 
-        return tags
+        table = connection.ops.quote_name(TaskTag._meta.db_table)
+        with connection.cursor() as cursor:
+            # Sorted names keep the lock order stable between concurrent writers
+            cursor.execute(
+                f"INSERT INTO {table} (name) SELECT unnest(%s::varchar[]) "
+                f"ON CONFLICT (name) DO NOTHING RETURNING name, id",
+                [missing],
+            )
+            resolved = dict(cursor.fetchall())
+
+        existing = [name for name in missing if name not in resolved]
+        if existing:
+            resolved.update(TaskTag.objects.filter(name__in=existing).values_list("name", "id"))
+
+        # Ids of a rolled back transaction must never get into the cache
+        transaction.on_commit(lambda: TagService.ids_cache.set_many(resolved))
+        ids.update(resolved)
+        return ids
+
+    @staticmethod
+    def normalize(raw_tag: str) -> str:
+        return raw_tag.strip().lower()
@@ -0,0 +1,135 @@
+"""
+Archiving of completed tasks.
+
+- Due tasks are found with the partial `task_archive_due` index, which holds only
+  unarchived tasks with an `archive_at` date, so a run with nothing to do is one index probe
+- Tasks are archived in short transactions of `batch_size` rows. Rows locked by a user
+  request are skipped with `SKIP LOCKED` and picked up by the next run
+- Only one run at a time: a run takes a cache lock, overlapping runs of other beat
+  instances or workers return at once
+- The result of the last run is kept in the cache under `LAST_RUN_KEY`
+
+`ArchiveDispatcherService` archives the tasks popped from the archive schedule, so its
+work depends only on the number of due tasks. Its first run fills the schedule with the
+tasks scheduled before it existed, see `backfill_schedule`. The sweep of `TaskArchiverService` is
+kept as a rare fallback for the tasks missing from the schedule.
+"""
+import time
+import uuid
+from dataclasses import dataclass
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from core.services.baseservice import BaseService
+from apps.projects.models.tasks import Task
+from apps.projects.services.archive_schedule import backfill_schedule, pop_due, write_schedule
+from apps.projects.services.task_counters import move_tasks_to_archive
+
+LOCK_KEY = "archive_completed_tasks:lock"
+LOCK_TIMEOUT = 5 * 60
+LAST_RUN_KEY = "archive_completed_tasks:last_run"
+
+
+def archive_tasks(tasks: QuerySet, now, limit: int) -> list[int]:
+    """Archives up to `limit` due tasks of the queryset skipping the locked ones.
+
+    Must be called in a transaction, returns the ids of the archived tasks.
+    """
+    due = list(
+        tasks.select_for_update(of=("self",), skip_locked=True)
+        .filter(
+            is_archive=False,
+            archive_at__lte=now,
+            workspace__configuration__archive_completed_task=True,
+        )
+        .order_by("archive_at")
+        .values_list("id", "project_id", "workspace_id")[:limit]
+    )
+    if not due:
+        return []
+
+    ids = [task[0] for task in due]
+    Task._base_manager.filter(id__in=ids).update(is_archive=True, updated_at=now)
+    move_tasks_to_archive((project_id, workspace_id) for _, project_id, workspace_id in due)
+    return ids
+
+
+@dataclass
+class TaskArchiverService(BaseService):
+    batch_size: int = 500
+    max_batches: int = 100
+
+    def execute(self) -> dict:
+        token = uuid.uuid4().hex
+        if not cache.add(LOCK_KEY, token, LOCK_TIMEOUT):
+            return {"skipped": True}
+
+        try:
+            stats = self.archive_due_tasks()
+        finally:
+            if cache.get(LOCK_KEY) == token:
+                cache.delete(LOCK_KEY)
+
+        cache.set(LAST_RUN_KEY, stats, None)
+        return stats
+
+    def archive_due_tasks(self) -> dict:
+        started_at = timezone.now()
+        start = time.monotonic()
+        archived = 0
+        batches = 0
+
+        while batches < self.max_batches:
+            total = self.archive_batch(timezone.now())
+            if not total:
+                break
+            archived += total
+            batches += 1
+            if total < self.batch_size:
+                break
+
+        return {
+            "started_at": started_at.isoformat(),
+            "duration": round(time.monotonic() - start, 3),
+            "archived": archived,
+            "batches": batches,
+        }
+
+    def archive_batch(self, now) -> int:
+        with transaction.atomic():
+            return len(archive_tasks(Task._base_manager.all(), now, self.batch_size))
+
+
+@dataclass
+class ArchiveDispatcherService(BaseService):
+    limit: int = 500
+
+    def execute(self) -> dict:
+        backfill_schedule()
+        now = timezone.now()
+        ids = pop_due(now, self.limit)
+        if not ids:
+            return {"archived": 0}
+
+        try:
+            with transaction.atomic():
+                archived = archive_tasks(Task._base_manager.filter(id__in=ids), now, len(ids))
+        except Exception:
+            write_schedule(dict.fromkeys(ids, now))
+            raise
+
+        # Locked tasks go back to the schedule, rescheduled ones get their new date
+        rest = (
+            Task._base_manager.filter(id__in=set(ids) - set(archived))
+            .filter(
+                is_archive=False,
+                archive_at__isnull=False,
+                workspace__configuration__archive_completed_task=True,
+            )
+            .values_list("id", "archive_at")
+        )
+        write_schedule(dict(rest))
+        return {"archived": len(archived), "popped": len(ids)}
@@ -0,0 +1,136 @@
+from dataclasses import dataclass
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Count, F, QuerySet, Window
+from django.db.models.functions import RowNumber
+
+from apps.projects.models.modules import Module
+from apps.projects.models.tags import TaskTag
+from apps.projects.models.tasks import Task
+from apps.projects.serializers.tasks_lean import LeanTaskReadOnlySerializer
+from apps.users.models.users import User
+from apps.workspace.constant import GroupChoices, OrderChoices
+from apps.workspace.models.workspace_config import TaskState
+from apps.workspace.models.workspace_user_config import UserWorkspaceConfig
+from core.services.baseservice import BaseService
+
+GROUP_FIELDS = {
+    GroupChoices.STATE: "state_id",
+    GroupChoices.PRIORITY: "priority",
+    GroupChoices.MODULE: "module_id",
+    GroupChoices.TAG: "tags",
+    GroupChoices.ASSIGNEE: "assignees",
+    GroupChoices.CREATED_BY: "created_by_id",
+}
+PRIORITIES = (1, 2, 3)
+DEFAULT_ORDERING = "-created_at"
+
+
+@dataclass
+class TaskBoardService(BaseService):
+    """
+    Service for building a board of tasks grouped by the user's workspace config.
+
+    - Tasks are numbered inside every group with `ROW_NUMBER() OVER (PARTITION BY <group>)`
+      and counted with `COUNT(*) OVER (PARTITION BY <group>)`, so all columns of the board
+      are fetched with one query
+    - Every group contains at most `limit` tasks ordered by the config `order_by`
+    - Empty groups are added when the config has `show_empty_groups`
+
+    Returns `{"group_by", "order_by", "groups": [{"key", "name", "count", "tasks"}]}`
+    """
+    queryset: QuerySet
+    config: UserWorkspaceConfig
+    limit: int
+    context: dict
+
+    def __post_init__(self):
+        self.group_by = self.config.group_by
+        self.group_field = GROUP_FIELDS.get(self.group_by, GROUP_FIELDS[GroupChoices.STATE])
+
+    def execute(self) -> dict:
+        rows = list(self.get_rows())
+        if rows:
+            to_task = LeanTaskReadOnlySerializer(rows, many=True, context=self.context).compile()
+
+        groups = {}
+        for row in rows:
+            group = groups.setdefault(
+                row["group_key"], {"key": row["group_key"], "count": row["group_total"], "tasks": []}
+            )
+            group["tasks"].append(to_task(row))
+
+        keys = list(groups)
+        if self.config.show_empty_groups:
+            keys += [key for key in self.get_all_keys() if key not in groups]
+
+        names = self.get_names(keys)
+        board = []
+        for key in keys:
+            group = groups.get(key) or {"key": key, "count": 0, "tasks": []}
+            board.append({"key": key, "name": names.get(key), **group})
+
+        return {
+            "group_by": self.group_by,
+            "order_by": self.config.order_by,
+            "groups": sorted(board, key=lambda group: (group["key"] is None, group["key"] or 0)),
+        }
+
+    def get_rows(self) -> QuerySet:
+        group = F(self.group_field)
+        ordering = self.get_ordering()
+        tasks = self.queryset.annotate(
+            group_key=group,
+            group_row=Window(RowNumber(), partition_by=[group], order_by=ordering),
+            group_total=Window(Count("id"), partition_by=[group]),
+        ).filter(group_row__lte=self.limit)
+
+        return LeanTaskReadOnlySerializer.values(
+            tasks, "group_key", "group_total"
+        ).order_by("group_key", "group_row")
+
+    def get_ordering(self) -> list:
+        ordering = dict(OrderChoices.CHOICES).get(self.config.order_by, DEFAULT_ORDERING)
+        try:
+            Task._meta.get_field(ordering.lstrip("-"))
+        except FieldDoesNotExist:
+            ordering = DEFAULT_ORDERING
+
+        field = F(ordering.lstrip("-"))
+        if ordering.startswith("-"):
+            return [field.desc(nulls_last=True), F("id").desc()]
+        return [field.asc(nulls_last=True), F("id").desc()]
+
+    def get_all_keys(self) -> list:
+        workspace = self.config.workspace_id
+        project = self.context["project_id"]
+
+        if self.group_by == GroupChoices.PRIORITY:
+            return list(PRIORITIES)
+        if self.group_by == GroupChoices.MODULE:
+            return list(Module.objects.filter(project_id=project).values_list("id", flat=True))
+        if self.group_by in (GroupChoices.ASSIGNEE, GroupChoices.CREATED_BY):
+            return list(
+                User.objects.filter(workspace_memberships__workspace_id=workspace).values_list(
+                    "id", flat=True
+                )
+            )
+        if self.group_by == GroupChoices.TAG:
+            # Tags are shared between workspaces, only the used ones are shown
+            return []
+        return list(TaskState.objects.filter(workspace_id=workspace).values_list("id", flat=True))
+
+    def get_names(self, keys: list) -> dict:
+        keys = [key for key in keys if key is not None]
+        models = {
+            GroupChoices.STATE: (TaskState, "name"),
+            GroupChoices.MODULE: (Module, "name"),
+            GroupChoices.TAG: (TaskTag, "name"),
+            GroupChoices.ASSIGNEE: (User, "username"),
+            GroupChoices.CREATED_BY: (User, "username"),
+        }
+        if self.group_by not in models:
+            return {key: str(key) for key in keys}
+
+        model, field = models[self.group_by]
+        return dict(model.objects.filter(id__in=keys).values_list("id", field))
@@ -0,0 +1,56 @@
+"""
+Denormalized task counters of projects and workspaces.
+
+The counters are changed with `UPDATE ... SET count = count + n` in the transaction
+that changes the tasks, so concurrent writers never lose an increment.
+`updated_at` of the project moves with its counters, so the delta sync and the
+conditional GETs of the projects see the new counts.
+Drifted counters are repaired by the `repair_task_counters` management command.
+"""
+from collections import Counter
+from collections.abc import Iterable
+
+from django.db.models import F
+from django.utils import timezone
+
+from apps.projects.models.projects import Project
+from apps.workspace.models.workspace import Workspace
+
+
+def change_task_counters(project_id: int, workspace_id: int, active: int = 0, archived: int = 0) -> None:
+    if not active and not archived:
+        return
+    values = {
+        "active_tasks_count": F("active_tasks_count") + active,
+        "archived_tasks_count": F("archived_tasks_count") + archived,
+    }
+    Project._base_manager.filter(pk=project_id).update(**values, updated_at=timezone.now())
+    Workspace._base_manager.filter(pk=workspace_id).update(**values)
+
+
+def move_tasks_to_archive(tasks: Iterable[tuple[int, int]], restore: bool = False) -> None:
+    """Moves counted tasks between active and archived, `tasks` are (project_id, workspace_id) pairs"""
+    delta = -1 if restore else 1
+    for (project_id, workspace_id), total in sorted(Counter(tasks).items()):
+        change_task_counters(project_id, workspace_id, active=-delta * total, archived=delta * total)
+
+
+def change_members_counter(workspace_id: int, delta: int) -> None:
+    Workspace._base_manager.filter(pk=workspace_id).update(
+        members_count=F("members_count") + delta
+    )
+
+
+def move_tasks_to_project(projects_ids: Iterable[int], project_id: int) -> None:
+    """Moves counted active tasks to another project of the same workspace, `projects_ids` are their current projects"""
+    moved = Counter(current for current in projects_ids if current != project_id)
+    if not moved:
+        return
+    now = timezone.now()
+    for from_project_id, total in sorted(moved.items()):
+        Project._base_manager.filter(pk=from_project_id).update(
+            active_tasks_count=F("active_tasks_count") - total, updated_at=now
+        )
+    Project._base_manager.filter(pk=project_id).update(
+        active_tasks_count=F("active_tasks_count") + sum(moved.values()), updated_at=now
+    )
@@ -0,0 +1,87 @@
+from dataclasses import dataclass
+
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
+from django.db.models import F, QuerySet
+
+from apps.projects.constants import TASK_SEARCH_CONFIG
+from apps.projects.serializers.tasks_lean import url_template
+from core.services.baseservice import BaseService
+
+HIGHLIGHT = {"start_sel": "<mark>", "stop_sel": "</mark>"}
+
+
+def get_search_query(text: str) -> SearchQuery:
+    """Parses user input the way web search engines do: `"exact phrase" -excluded or`"""
+    return SearchQuery(text, search_type="websearch", config=TASK_SEARCH_CONFIG)
+
+
+def search_tasks(queryset: QuerySet, text: str) -> QuerySet:
+    """Filters tasks by the GIN-indexed `search_vector` and annotates them with `rank`"""
+    query = get_search_query(text)
+    return queryset.filter(search_vector=query).annotate(
+        rank=SearchRank(F("search_vector"), query)
+    )
+
+
+@dataclass
+class TaskSearchService(BaseService):
+    """
+    Ranked full-text search over tasks.
+
+    Returns at most `limit` tasks ordered by rank, with the matched words of the title
+    and the description highlighted by `<mark>` tags
+    """
+    queryset: QuerySet
+    text: str
+    limit: int
+
+    def execute(self) -> list[dict]:
+        query = get_search_query(self.text)
+        rows = (
+            search_tasks(self.queryset, self.text)
+            .annotate(
+                title_highlight=SearchHeadline(
+                    "title", query, config=TASK_SEARCH_CONFIG, highlight_all=True, **HIGHLIGHT
+                ),
+                description_highlight=SearchHeadline(
+                    "description",
+                    query,
+                    config=TASK_SEARCH_CONFIG,
+                    max_words=35,
+                    min_words=15,
+                    max_fragments=2,
+                    **HIGHLIGHT,
+                ),
+            )
+            .order_by("-rank", "-id")
+            .values(
+                "id",
+                "title",
+                "workspace_id",
+                "project_id",
+                "is_archive",
+                "rank",
+                "title_highlight",
+                "description_highlight",
+            )[: self.limit]
+        )
+
+        task_url = url_template("api:project-task-detail", "workspace_id", "project_id", "task_id")
+        archived_task_url = url_template(
+            "api:project-archived-task-detail", "workspace_id", "project_id", "task_id"
+        )
+        return [
+            {
+                "id": row["id"],
+                "title": row["title"],
+                "rank": row["rank"],
+                "title_highlight": row["title_highlight"],
+                "description_highlight": row["description_highlight"],
+                "absolute_url": (archived_task_url if row["is_archive"] else task_url).format(
+                    workspace_id=row["workspace_id"],
+                    project_id=row["project_id"],
+                    task_id=row["id"],
+                ),
+            }
+            for row in rows
+        ]
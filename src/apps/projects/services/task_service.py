@@ -1,12 +1,27 @@
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
+from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone
 from django.core.exceptions import ValidationError
-
+from crum import get_current_user
+
+from apps.activitylog import constants as const
+from apps.activitylog.models import TaskActivityLog
+from apps.activitylog.services.task_events import (
+    TASKS_BULK_UPDATED,
+    TASKS_CREATED,
+    collect_task_events,
+)
 from apps.projects.models.modules import Module
 from apps.projects.models.projects import Project
-from apps.projects.models.tasks import Task
+from apps.projects.models.tags import TaskTag
+from apps.projects.models.tasks import Task, TaskSubscriber
+from apps.projects.services.archive_schedule import schedule_archive
+from apps.projects.services.module_progress import change_module_progress, get_states_types
 from apps.projects.services.tag_service import TagService
+from apps.projects.services.task_counters import change_task_counters
 from apps.projects.typing import TaskData
 from apps.workspace.constant import TaskStateChoices
 from apps.workspace.models.workspace import Workspace
@@ -18,6 +33,7 @@ from core.services.baseservice import (
     BaseUpdateService,
     GetObjectsByIdService,
 )
+from core.services.outbox import publish
 
 
 @dataclass
@@ -34,15 +50,16 @@ class TaskCreatorService(GetObjectsByIdService, BaseService):
         self.load_objects()
 
     def execute(self) -> str:
-        task = self.create_task()
-        if self.state:
-            self.task = SetTaskState(task, self.state)()
-        if self.assignees:
-            self.task = SetTaskAssignees(task, self.assignees)()
-        if self.raw_tags:
-            self.task = SetTaskTag(task, self.raw_tags)()
-        if self.module:
-            self.task = SetTaskModule(task, self.module)()
+        with transaction.atomic(), collect_task_events():
+            task = self.create_task()
+            if self.state:
+                self.task = SetTaskState(task, self.state)()
+            if self.assignees:
+                self.task = SetTaskAssignees(task, self.assignees)()
+            if self.raw_tags:
+                self.task = SetTaskTag(task, self.raw_tags)()
+            if self.module:
+                self.task = SetTaskModule(task, self.module)()
         return task.get_absolute_url()
 
     def create_task(self) -> Task:
@@ -74,16 +91,20 @@ class TaskUpdaterService(GetObjectsByIdService, BaseUpdateService):
 
 
     def execute(self) -> str:
-        if self.state:
-            self.task = SetTaskState(self.task, self.state)()
-        if self.assignees:
-            self.task = SetTaskAssignees(self.task, self.assignees)()
-        if self.raw_tags:
-            self.task = SetTaskTag(self.task, self.raw_tags)()
-        if self.module:
-            self.task = SetTaskModule(self.task, self.module)()
-
-        return super().update(self.task, self.data).get_absolute_url()
+        with transaction.atomic(), collect_task_events():
+            if self.state:
+                self.task = SetTaskState(self.task, self.state)()
+            if self.assignees:
+                self.task = SetTaskAssignees(self.task, self.assignees)()
+            if self.raw_tags:
+                self.task = SetTaskTag(self.task, self.raw_tags)()
+            if self.module:
+                self.task = SetTaskModule(self.task, self.module)()
+
+            task = super().update(self.task, self.data)
+            if "archive_at" in self.data or "is_archive" in self.data:
+                schedule_archive({task.id: None if task.is_archive else task.archive_at})
+        return task.get_absolute_url()
 
 
 @dataclass        
@@ -96,8 +117,9 @@ class SetTaskState(GetObjectsByIdService, BaseUpdateService):
         self.workspace = self.task.workspace
 
     def execute(self) -> Any:
-        self.set_archive_date()
-        return super().update(self.task, {"state":self.state})
+        if self.set_archive_date():
+            schedule_archive({self.task.id: self.task.archive_at})
+        return super().update(self.task, {"state":self.state, "archive_at":self.task.archive_at})
     
     def set_archive_date(self) -> bool:
         """Returns True if the archiving date has changed, False otherwise"""
@@ -170,4 +192,426 @@ class SetTaskModule(GetObjectsByIdService, BaseUpdateService):
     def validate(self) -> None:
         if self.task.project != self.module.project:
             raise ValidationError("The module does not belong to this project")
-        return super().validate()
\ No newline at end of file
+        return super().validate()
+
+@dataclass
+class TaskBulkCreatorService(GetObjectsByIdService, BaseService):
+    """
+    Service for creating many tasks of one project at once.
+
+    - Tasks are inserted with one `bulk_create`, assignees and tags with one insert per through table
+    - Assignees are subscribed to their tasks with one insert
+    - One outbox event per batch carries the created logs and the mention notification
+
+    Returns the list of created tasks
+    """
+    project: Project | int
+    workspace: Workspace | int
+    data: list[TaskData]
+    batch_size = 500
+
+    def __post_init__(self):
+        self.load_objects()
+        user = get_current_user()
+        self.user = user if user and user.pk else None
+
+    def execute(self) -> list[Task]:
+        with transaction.atomic():
+            tags = self.get_tags()
+            tasks = self.create_tasks()
+            change_task_counters(self.project.id, self.workspace.id, active=len(tasks))
+            self.count_module_progress(tasks)
+            schedule_archive({task.id: task.archive_at for task in tasks if task.archive_at})
+            self.set_assignees(tasks)
+            self.set_tags(tasks, tags)
+            self.subscribe_assignees(tasks)
+            self.publish_event(tasks)
+        return tasks
+
+    def create_tasks(self) -> list[Task]:
+        now = timezone.now()
+        archive_at = now + self.workspace.configuration.archive_after
+        completed_states = set(
+            TaskState.objects.filter(
+                workspace=self.workspace, type=TaskStateChoices.COMPLETED
+            ).values_list("id", flat=True)
+        )
+        tasks = [
+            Task(
+                workspace=self.workspace,
+                project=self.project,
+                title=task_data.get("title", "Task"),
+                description=task_data.get("description"),
+                priority=task_data.get("priority", 1),
+                deadline=task_data.get("deadline"),
+                state_id=task_data.get("state_id"),
+                module_id=task_data.get("module_id"),
+                archive_at=archive_at if task_data.get("state_id") in completed_states else None,
+                created_at=now,
+                updated_at=now,
+                created_by=self.user,
+                updated_by=self.user,
+            )
+            for task_data in self.data
+        ]
+        return Task.objects.bulk_create(tasks, batch_size=self.batch_size)
+
+    def count_module_progress(self, tasks: list[Task]) -> None:
+        states_types = get_states_types(task.state_id for task in tasks)
+        change_module_progress(
+            (task.module_id, states_types.get(task.state_id), 1) for task in tasks
+        )
+
+    def set_assignees(self, tasks: list[Task]) -> None:
+        Through = Task.assignees.through
+        Through.objects.bulk_create(
+            [
+                Through(task_id=task.id, user_id=user_id)
+                for task, task_data in zip(tasks, self.data)
+                for user_id in set(task_data.get("assignees") or [])
+            ],
+            batch_size=self.batch_size,
+        )
+
+    def set_tags(self, tasks: list[Task], tags: dict[str, TaskTag]) -> None:
+        Through = Task.tags.through
+        Through.objects.bulk_create(
+            [
+                Through(task_id=task.id, tasktag_id=tags[name].id)
+                for task, task_data in zip(tasks, self.data)
+                for name in {TagService.normalize(raw_tag) for raw_tag in task_data.get("tags") or []}
+            ],
+            batch_size=self.batch_size,
+        )
+
+    def subscribe_assignees(self, tasks: list[Task]) -> None:
+        auto_subscribers = set(
+            User.objects.filter(
+                id__in=self.get_assignees_ids(), settings__auto_subsсribe_to_task=True
+            ).values_list("id", flat=True)
+        )
+        TaskSubscriber.objects.bulk_create(
+            [
+                TaskSubscriber(task_id=task.id, subscriber_id=user_id, workspace=self.workspace)
+                for task, task_data in zip(tasks, self.data)
+                for user_id in set(task_data.get("assignees") or []) & auto_subscribers
+            ],
+            batch_size=self.batch_size,
+            ignore_conflicts=True,
+        )
+
+    def publish_event(self, tasks: list[Task]) -> None:
+        """The created log and the mention notification are sent through the outbox"""
+        publish(
+            TASKS_CREATED,
+            {
+                "tasks": [task.id for task in tasks],
+                "project": self.project.id,
+                "project_name": self.project.name,
+                "workspace": self.workspace.id,
+                "actor": self.user.id if self.user else None,
+                "assignees": sorted(self.get_assignees_ids()),
+            },
+            aggregate_id=f"project:{self.project.id}",
+        )
+
+    def get_tags(self) -> dict[str, TaskTag]:
+        raw_tags = {raw_tag for task_data in self.data for raw_tag in task_data.get("tags") or []}
+        return {tag.name: tag for tag in TagService.get_tags_entity_by_string(list(raw_tags))}
+
+    def get_assignees_ids(self) -> set[int]:
+        return {user_id for task_data in self.data for user_id in task_data.get("assignees") or []}
+
+    def get_validators(self) -> list[Callable[..., Any]]:
+        return [
+            self.validate_project,
+            self.validate_states,
+            self.validate_modules,
+            self.validate_assignees,
+        ]
+
+    def validate_project(self) -> None:
+        if self.project.workspace != self.workspace:
+            raise ValidationError("The project does not belong to this workspace")
+
+    def validate_states(self) -> None:
+        states_ids = {task_data["state_id"] for task_data in self.data if task_data.get("state_id")}
+        found = TaskState.objects.filter(id__in=states_ids, workspace=self.workspace).count()
+        if found != len(states_ids):
+            raise ValidationError("The state does not belong to this workspace")
+
+    def validate_modules(self) -> None:
+        modules_ids = {task_data["module_id"] for task_data in self.data if task_data.get("module_id")}
+        found = Module.objects.filter(id__in=modules_ids, project=self.project).count()
+        if found != len(modules_ids):
+            raise ValidationError("The module does not belong to this project")
+
+    def validate_assignees(self) -> None:
+        if not all_user_in_workspace(list(self.get_assignees_ids()), self.workspace):
+            raise ValidationError("Not all users were found in this workspace")
+
+
+@dataclass
+class TaskBulkUpdaterService(GetObjectsByIdService, BaseService):
+    """
+    Service for applying one change set to many tasks of a project.
+
+    - Scalar fields are changed with one UPDATE, assignees and tags with through-table diffs
+    - Activity logs are written with one `bulk_create`
+    - Every subscriber gets one notification for the whole change, sent through one outbox event
+
+    Returns the number of updated tasks
+    """
+    project: Project | int
+    tasks_ids: list[int]
+    data: TaskData
+    workspace_id: int | None = None
+    batch_size = 500
+
+    def __post_init__(self):
+        self.load_objects()
+        self.tasks_ids = list(set(self.tasks_ids))
+        self.assignees = self.data.pop("assignees", None)
+        self.raw_tags = self.data.pop("tags", None)
+        self.workspace = self.project.workspace if self.project else None
+        user = get_current_user()
+        self.user = user if user and user.pk else None
+        self.now = timezone.now()
+        self.logs = []
+        self.added_assignees = set()
+
+    def execute(self) -> int:
+        with transaction.atomic():
+            self.update_fields()
+            if self.assignees is not None:
+                self.update_assignees()
+            if self.raw_tags is not None:
+                self.update_tags()
+            TaskActivityLog.objects.bulk_create(self.logs, batch_size=self.batch_size)
+            self.publish_event()
+        return len(self.tasks_ids)
+
+    def update_fields(self) -> None:
+        fields = dict(self.data)
+        if not fields:
+            # Only M2M changes, `updated_at` still has to move for the conditional GET probes
+            Task.objects.filter(id__in=self.tasks_ids).update(updated_at=self.now, updated_by=self.user)
+            return
+        if "state_id" in fields:
+            fields["archive_at"] = self.get_archive_date(fields["state_id"])
+            schedule_archive(dict.fromkeys(self.tasks_ids, fields["archive_at"]))
+
+        tasks = Task.objects.filter(id__in=self.tasks_ids)
+        # The rows stay locked until the commit, so the old values of the logs and of the
+        # module progress cannot be changed by a concurrent update
+        old_rows = list(
+            tasks.select_for_update(of=("self",))
+            .order_by("id")
+            .values("id", "state__type", *({"module_id"} | set(fields)))
+        )
+        tasks.update(**fields, updated_at=self.now, updated_by=self.user)
+        self.count_module_progress(old_rows, fields)
+
+        display_values = self.get_display_values(fields)
+        for row in old_rows:
+            for field, value in fields.items():
+                if field != "archive_at" and row[field] != value:
+                    self.logs.append(
+                        self.get_field_log(row["id"], field.removesuffix("_id"), display_values[field])
+                    )
+
+    def count_module_progress(self, old_rows: list[dict], fields: dict) -> None:
+        if "module_id" not in fields and "state_id" not in fields:
+            return
+        new_state_type = get_states_types([fields.get("state_id")]).get(fields.get("state_id"))
+
+        changes = []
+        for row in old_rows:
+            module_id = fields.get("module_id", row["module_id"])
+            state_type = new_state_type if "state_id" in fields else row["state__type"]
+            changes.append((row["module_id"], row["state__type"], -1))
+            changes.append((module_id, state_type, 1))
+        change_module_progress(changes)
+
+    def update_assignees(self) -> None:
+        desired = set(self.assignees)
+        added, removed = self.apply_m2m_diff(Task.assignees.through, "user_id", desired)
+
+        changed_ids = set().union(*added.values(), *removed.values())
+        usernames = dict(User.objects.filter(id__in=changed_ids).values_list("id", "username"))
+        self.add_m2m_logs("assignees", added, removed, usernames)
+        self.update_subscriptions(added, removed)
+        self.added_assignees = set().union(*added.values())
+
+    def update_tags(self) -> None:
+        tags = {tag.id: tag.name for tag in TagService.get_tags_entity_by_string(self.raw_tags)}
+        added, removed = self.apply_m2m_diff(Task.tags.through, "tasktag_id", set(tags))
+
+        removed_ids = set().union(*removed.values()) - set(tags)
+        tags.update(TaskTag.objects.filter(id__in=removed_ids).values_list("id", "name"))
+        self.add_m2m_logs("tags", added, removed, tags)
+
+    def apply_m2m_diff(self, through, related_field: str, desired: set[int]) -> tuple[dict, dict]:
+        """Replaces the related objects of all tasks with `desired`, returns added and removed ids per task"""
+        current = {task_id: set() for task_id in self.tasks_ids}
+        rows = through.objects.filter(task_id__in=self.tasks_ids).values_list("task_id", related_field)
+        for task_id, related_id in rows:
+            current[task_id].add(related_id)
+
+        added = {task_id: desired - related for task_id, related in current.items()}
+        removed = {task_id: related - desired for task_id, related in current.items()}
+
+        through.objects.filter(task_id__in=self.tasks_ids).exclude(
+            **{f"{related_field}__in": desired}
+        ).delete()
+        through.objects.bulk_create(
+            [
+                through(task_id=task_id, **{related_field: related_id})
+                for task_id, related in added.items()
+                for related_id in related
+            ],
+            batch_size=self.batch_size,
+        )
+        return added, removed
+
+    def update_subscriptions(self, added: dict[int, set], removed: dict[int, set]) -> None:
+        added_ids = set().union(*added.values())
+        auto_subscribers = set(
+            User.objects.filter(
+                id__in=added_ids, settings__auto_subsсribe_to_task=True
+            ).values_list("id", flat=True)
+        )
+        TaskSubscriber.objects.bulk_create(
+            [
+                TaskSubscriber(task_id=task_id, subscriber_id=user_id, workspace=self.workspace)
+                for task_id, users_ids in added.items()
+                for user_id in users_ids & auto_subscribers
+            ],
+            batch_size=self.batch_size,
+            ignore_conflicts=True,
+        )
+
+        # The author of the task stays subscribed
+        creators = dict(
+            Task.objects.filter(id__in=self.tasks_ids).values_list("id", "created_by_id")
+        )
+        condition = Q()
+        for task_id, users_ids in removed.items():
+            users_ids = users_ids - {creators.get(task_id)}
+            if users_ids:
+                condition |= Q(task_id=task_id, subscriber_id__in=users_ids)
+        if condition:
+            TaskSubscriber.objects.filter(condition).delete()
+
+    def add_m2m_logs(self, field: str, added: dict, removed: dict, names: dict[int, str]) -> None:
+        username = self.user.username if self.user else ""
+        for action, changes, detail in (
+            (const.ADD, added, "{username} added a new {field}: {names}"),
+            (const.REMOVE, removed, "{username} removed the {field}: {names}"),
+        ):
+            for task_id, related_ids in changes.items():
+                if not related_ids:
+                    continue
+                objects_names = ", ".join(str(names.get(related_id)) for related_id in related_ids)
+                self.logs.append(
+                    self.get_log(
+                        task_id,
+                        action,
+                        field,
+                        objects_names,
+                        detail.format(username=username, field=field, names=objects_names),
+                    )
+                )
+
+    def get_field_log(self, task_id: int, field: str, value) -> TaskActivityLog:
+        username = self.user.username if self.user else ""
+        if field == "module":
+            action = const.ADD if value else const.REMOVE
+            detail = f"{username} added this task to module {value}"
+        else:
+            action = const.SET
+            detail = f"{username} {action} {field} {value}"
+        return self.get_log(task_id, action, field, value, detail)
+
+    def get_log(self, task_id: int, action: str, field: str, value, detail: str) -> TaskActivityLog:
+        return TaskActivityLog(
+            project_id=self.project.id,
+            workspace_id=self.workspace.id,
+            task_id=task_id,
+            user=self.user,
+            action_type=action,
+            field=field,
+            value=None if value is None else str(value)[:100],
+            detail=detail[:255],
+            timestamp=self.now,
+        )
+
+    def get_display_values(self, fields: dict) -> dict:
+        display_values = dict(fields)
+        if "state_id" in fields:
+            display_values["state_id"] = TaskState.objects.get(pk=fields["state_id"]).name
+        if "module_id" in fields:
+            display_values["module_id"] = Module.objects.get(pk=fields["module_id"]).name
+        return display_values
+
+    def get_archive_date(self, state_id: int):
+        state = TaskState.objects.get(pk=state_id)
+        if state.type == TaskStateChoices.COMPLETED:
+            return self.now + self.workspace.configuration.archive_after
+        return None
+
+    def publish_event(self) -> None:
+        """The notifications are sent through the outbox, one event for the whole change"""
+        subscribers = list(
+            TaskSubscriber.objects.filter(task_id__in=self.tasks_ids)
+            .values_list("subscriber_id", flat=True)
+            .distinct()
+        )
+        publish(
+            TASKS_BULK_UPDATED,
+            {
+                "project": self.project.id,
+                "project_name": self.project.name,
+                "workspace": self.workspace.id,
+                "actor": self.user.id if self.user else None,
+                "changed_tasks": len({log.task_id for log in self.logs}),
+                "changed_fields": sorted({log.field for log in self.logs}),
+                "recipients": sorted(subscribers),
+                "assignees": sorted(self.added_assignees),
+            },
+            aggregate_id=f"project:{self.project.id}",
+        )
+
+    def get_validators(self) -> list[Callable[..., Any]]:
+        return [
+            self.validate_project,
+            self.validate_tasks,
+            self.validate_state,
+            self.validate_module,
+            self.validate_assignees,
+        ]
+
+    def validate_project(self) -> None:
+        if self.project is None:
+            raise ValidationError("Project not found")
+        if self.workspace_id is not None and self.project.workspace_id != int(self.workspace_id):
+            raise ValidationError("Project not found")
+
+    def validate_tasks(self) -> None:
+        found = Task.objects.filter(id__in=self.tasks_ids, project=self.project).count()
+        if found != len(self.tasks_ids):
+            raise ValidationError("Not all tasks were found in this project")
+
+    def validate_state(self) -> None:
+        state = self.data.get("state_id")
+        if state and not tasks_states_in_workspace(state, self.workspace):
+            raise ValidationError("The state does not belong to this workspace")
+
+    def validate_module(self) -> None:
+        module = self.data.get("module_id")
+        if module and not Module.objects.filter(id=module, project=self.project).exists():
+            raise ValidationError("The module does not belong to this project")
+
+    def validate_assignees(self) -> None:
+        if self.assignees and not all_user_in_workspace(self.assignees, self.workspace):
+            raise ValidationError("Not all users were found in this workspace")
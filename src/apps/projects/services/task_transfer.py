@@ -1,32 +1,120 @@
 from dataclasses import dataclass
 from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+from crum import get_current_user
 
 from core.services.baseservice import BaseService
+from apps.activitylog import constants as const
+from apps.activitylog.models import TaskActivityLog
 from apps.projects.models.tasks import Task
 from apps.projects.models.modules import Module
+from apps.projects.services.module_progress import change_module_progress
+from apps.projects.services.task_counters import move_tasks_to_project
 
 
 @dataclass
 class TransferTasksService(BaseService):
+    """
+    Moves tasks to a module, also from other projects of the module's workspace.
+
+    - The whole id set is validated with one query and locked with one more
+    - Tasks are moved with one `UPDATE`, activity logs are written with one `bulk_create`
+    - Project task counters and module progress follow the moved tasks
+    """
     tasks_ids: list[int]
     module_id: int
+    workspace_id: int | None = None
+
+    batch_size = 500
+
+    def __post_init__(self):
+        self.tasks_ids = list(dict.fromkeys(self.tasks_ids))
+        self.module = (
+            Module.objects.select_related("project").filter(pk=self.module_id).first()
+        )
+        user = get_current_user()
+        self.user = user if user and user.pk else None
+        self.now = timezone.now()
 
     def execute(self) -> str:
-        total_transfered_tasks = self.transfer_tasks_between_modules()
+        total_transfered_tasks = self.transfer_tasks()
         return f"{total_transfered_tasks} tasks were transfered to module"
 
-    def transfer_tasks_between_modules(self) -> int:
-        return Task.objects.filter(id__in=self.tasks_ids).update(
-            module_id=self.module_id
+    def transfer_tasks(self) -> int:
+        with transaction.atomic():
+            moved = list(
+                Task.objects.select_for_update(of=("self",))
+                .filter(id__in=self.tasks_ids)
+                .exclude(module_id=self.module.id)
+                .order_by("id")
+                .values_list("id", "module_id", "project_id", "state__type")
+            )
+            if not moved:
+                return 0
+
+            Task.objects.filter(id__in=[task[0] for task in moved]).update(
+                module_id=self.module.id,
+                project_id=self.module.project_id,
+                updated_at=self.now,
+                updated_by=self.user,
+            )
+            move_tasks_to_project((task[2] for task in moved), self.module.project_id)
+            change_module_progress(
+                [(module_id, state_type, -1) for _, module_id, _, state_type in moved]
+                + [(self.module.id, state_type, 1) for *_, state_type in moved]
+            )
+            TaskActivityLog.objects.bulk_create(self.get_logs(moved), batch_size=self.batch_size)
+        return len(moved)
+
+    def get_logs(self, moved: list[tuple]) -> list[TaskActivityLog]:
+        username = self.user.username if self.user else ""
+        logs = []
+        for task_id, _, project_id, _ in moved:
+            if project_id != self.module.project_id:
+                logs.append(
+                    self.get_log(
+                        task_id,
+                        const.SET,
+                        "project",
+                        self.module.project.name,
+                        f"{username} moved this task to project {self.module.project.name}",
+                    )
+                )
+            logs.append(
+                self.get_log(
+                    task_id,
+                    const.ADD,
+                    "module",
+                    self.module.name,
+                    f"{username} added this task to module {self.module.name}",
+                )
+            )
+        return logs
+
+    def get_log(self, task_id: int, action: str, field: str, value, detail: str) -> TaskActivityLog:
+        return TaskActivityLog(
+            project_id=self.module.project_id,
+            workspace_id=self.module.workspace_id,
+            task_id=task_id,
+            user=self.user,
+            action_type=action,
+            field=field,
+            value=None if value is None else str(value)[:100],
+            detail=detail[:255],
+            timestamp=self.now,
         )
 
     def validate(self) -> None:
-        module = Module.objects.get(pk=self.module_id)
-        if not module:
+        if self.module is None:
+            raise ValidationError("Module not found")
+        if self.workspace_id is not None and self.module.workspace_id != int(self.workspace_id):
             raise ValidationError("Module not found")
 
-        for task in self.tasks_ids:
-            if not Task.objects.filter(id=task, project=module.project).exists():
-                raise ValidationError("Task not found")
+        found = Task.objects.filter(
+            id__in=self.tasks_ids, workspace_id=self.module.workspace_id
+        ).count()
+        if found != len(self.tasks_ids):
+            raise ValidationError("Task not found")
 
         return super().validate()
@@ -0,0 +1,100 @@
+from django.db.models import Count
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from apps.projects.models.tasks import Task
+from apps.projects.services.module_progress import NO_STATE, change_module_progress, move_task
+from apps.projects.services.task_counters import change_members_counter, change_task_counters
+from apps.workspace.models.workspace import WorkspaceMember
+from apps.workspace.models.workspace_config import TaskState
+
+
+TRACKED_FIELDS = {"is_archive", "module", "module_id", "state", "state_id"}
+
+
+def get_state_type(task: Task) -> int | None:
+    if task.state_id is None:
+        return None
+    if Task.state.is_cached(task):
+        return task.state.type
+    return TaskState.objects.filter(pk=task.state_id).values_list("type", flat=True).first()
+
+
+@receiver(pre_save, sender=Task)
+def remember_counted_fields(sender, instance, update_fields=None, **kwargs):
+    """Remembers the stored values of the counted fields when they can be changed by this save"""
+
+    if instance.pk is None or instance._state.adding:
+        return
+    if update_fields is not None and not TRACKED_FIELDS.intersection(update_fields):
+        return
+
+    instance._stored_counted_fields = (
+        Task._base_manager.filter(pk=instance.pk)
+        .values_list("is_archive", "module_id", "state__type")
+        .first()
+    )
+
+
+@receiver(post_save, sender=Task)
+def count_saved_task(sender, instance, created, **kwargs):
+    if created:
+        change_task_counters(
+            instance.project_id,
+            instance.workspace_id,
+            active=int(not instance.is_archive),
+            archived=int(instance.is_archive),
+        )
+        change_module_progress([(instance.module_id, get_state_type(instance), 1)])
+        return
+
+    stored = instance.__dict__.pop("_stored_counted_fields", None)
+    if stored is None:
+        return
+
+    was_archive, module_id, state_type = stored
+    if was_archive != instance.is_archive:
+        delta = 1 if instance.is_archive else -1
+        change_task_counters(
+            instance.project_id, instance.workspace_id, active=-delta, archived=delta
+        )
+    move_task((module_id, state_type), (instance.module_id, get_state_type(instance)))
+
+
+@receiver(post_delete, sender=Task)
+def count_deleted_task(sender, instance, **kwargs):
+    change_task_counters(
+        instance.project_id,
+        instance.workspace_id,
+        active=-int(not instance.is_archive),
+        archived=-int(instance.is_archive),
+    )
+    change_module_progress([(instance.module_id, get_state_type(instance), -1)])
+
+
+@receiver(pre_delete, sender=TaskState)
+def move_tasks_of_deleted_state(sender, instance, **kwargs):
+    """Tasks of a deleted state lose their state"""
+
+    modules = (
+        Task._base_manager.filter(state=instance, module__isnull=False)
+        .values("module_id")
+        .annotate(total=Count("id"))
+        .order_by()
+    )
+    changes = []
+    for row in modules:
+        changes.append((row["module_id"], instance.type, -row["total"]))
+        changes.append((row["module_id"], NO_STATE, row["total"]))
+    change_module_progress(changes)
+
+
+@receiver(post_save, sender=WorkspaceMember)
+def count_added_member(sender, instance, created, **kwargs):
+    if created:
+        change_members_counter(instance.workspace_id, 1)
+
+
+@receiver(post_delete, sender=WorkspaceMember)
+def count_removed_member(sender, instance, **kwargs):
+    change_members_counter(instance.workspace_id, -1)
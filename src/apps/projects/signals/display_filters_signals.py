@@ -0,0 +1,20 @@
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from apps.projects.models.modules import Module
+from apps.projects.signals.sync_signals import deleted_with
+from apps.workspace.models.workspace import Workspace
+from apps.workspace.models.workspace_config import TaskState
+from apps.workspace.services.display_filters import invalidate_workspace_display_filters
+
+
+@receiver(post_delete, sender=TaskState)
+@receiver(post_delete, sender=Module)
+def invalidate_display_filters_of_deleted(sender, instance, origin=None, **kwargs):
+    """The deleted state or module is removed from the saved filters, not from the cached ones"""
+    if deleted_with(origin, Workspace):
+        return
+
+    workspace_id = instance.workspace_id
+    transaction.on_commit(lambda: invalidate_workspace_display_filters(workspace_id))
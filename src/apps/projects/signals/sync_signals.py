@@ -0,0 +1,45 @@
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from apps.projects.constants import SyncEntityChoice
+from apps.projects.models.modules import Module
+from apps.projects.models.projects import Project
+from apps.projects.models.sync import Tombstone
+from apps.projects.models.tasks import Task
+from apps.workspace.models.workspace import Workspace
+
+
+def deleted_with(origin, *parents) -> bool:
+    """Whether the delete was started on one of the parent models"""
+    if origin is None:
+        return False
+    model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return issubclass(model, parents)
+
+
+@receiver(post_delete, sender=Project)
+@receiver(post_delete, sender=Module)
+@receiver(post_delete, sender=Task)
+def create_tombstone(sender, instance, origin=None, **kwargs):
+    """Tombstone for the delta sync.
+
+    Nothing is recorded when the whole workspace is deleted. Modules and tasks
+    deleted together with their project are covered by the project tombstone.
+    """
+
+    if deleted_with(origin, Workspace):
+        return
+    if sender is not Project and deleted_with(origin, Project):
+        return
+
+    entity_type = {
+        Project: SyncEntityChoice.PROJECT,
+        Module: SyncEntityChoice.MODULE,
+        Task: SyncEntityChoice.TASK,
+    }[sender]
+    Tombstone.objects.create(
+        workspace_id=instance.workspace_id,
+        entity_type=entity_type,
+        entity_id=instance.pk,
+    )
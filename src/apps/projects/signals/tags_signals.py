@@ -0,0 +1,12 @@
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from apps.projects.models.tags import TaskTag
+from apps.projects.services.tag_service import TagService
+
+
+@receiver(post_delete, sender=TaskTag)
+def evict_deleted_tag(sender, instance, **kwargs):
+    """The cached id is dropped after the commit, until then the tag still exists"""
+    transaction.on_commit(lambda: TagService.ids_cache.evict({instance.pk}), robust=True)
@@ -0,0 +1,62 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from core.cache import get_redis_client
+from core.tests.factories import create_project, create_tasks, create_workspace
+from apps.projects.models.tasks import Task
+from apps.projects.services import archive_schedule
+from apps.projects.services.archive_schedule import backfill_schedule
+from apps.projects.services.task_archiver import ArchiveDispatcherService
+
+
+class ArchiveDispatcherTests(TestCase):
+
+    def setUp(self):
+        # Keys of their own, the tests must not touch the schedule of a running app
+        for name in ("SCHEDULE_KEY", "BACKFILL_KEY"):
+            patcher = mock.patch.object(archive_schedule, name, f"test:{getattr(archive_schedule, name)}")
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.redis = get_redis_client()
+        self.redis.delete(archive_schedule.SCHEDULE_KEY, archive_schedule.BACKFILL_KEY)
+        self.addCleanup(self.redis.delete, archive_schedule.SCHEDULE_KEY, archive_schedule.BACKFILL_KEY)
+
+        self.project = create_project(create_workspace())
+        now = timezone.now()
+        # Created with one insert, so they were never written to the schedule
+        self.due, self.later = create_tasks(self.project, 2)
+        Task._base_manager.filter(pk=self.due.pk).update(archive_at=now - timedelta(minutes=1))
+        Task._base_manager.filter(pk=self.later.pk).update(archive_at=now + timedelta(days=1))
+
+    def get_scheduled(self) -> set[int]:
+        return {int(task_id) for task_id in self.redis.zrange(archive_schedule.SCHEDULE_KEY, 0, -1)}
+
+    def test_dispatcher_backfills_and_archives_due_tasks(self):
+        stats = ArchiveDispatcherService()()
+
+        self.assertEqual(stats["archived"], 1)
+        self.assertTrue(Task._base_manager.get(pk=self.due.pk).is_archive)
+        self.assertFalse(Task._base_manager.get(pk=self.later.pk).is_archive)
+        self.assertEqual(self.get_scheduled(), {self.later.pk})
+
+    def test_backfill_runs_once(self):
+        self.assertEqual(backfill_schedule(), 2)
+
+        self.redis.delete(archive_schedule.SCHEDULE_KEY)
+
+        self.assertEqual(backfill_schedule(), 0)
+        self.assertEqual(self.get_scheduled(), set())
+
+    def test_locked_out_task_is_rescheduled(self):
+        backfill_schedule()
+
+        with mock.patch(
+            "apps.projects.services.task_archiver.archive_tasks", return_value=[]
+        ):
+            stats = ArchiveDispatcherService()()
+
+        self.assertEqual(stats, {"archived": 0, "popped": 1})
+        self.assertEqual(self.get_scheduled(), {self.due.pk, self.later.pk})
@@ -0,0 +1,77 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.tests.factories import create_project, create_task, create_workspace
+from apps.projects.models.projects import Project
+from apps.projects.services import delta_sync
+from apps.projects.services.task_service import TaskUpdaterService
+
+
+class DeltaSyncTests(APITestCase):
+
+    def setUp(self):
+        # The rows of the test are read at once
+        patcher = mock.patch.object(delta_sync, "SYNC_LAG", timedelta(0))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.workspace = create_workspace()
+        self.project = create_project(self.workspace)
+        self.task = create_task(self.project)
+        self.client.force_authenticate(self.workspace.owner)
+        self.url = reverse("api:workspace-changes", kwargs={"workspace_id": self.workspace.id})
+        self.cursor = self.sync()["cursor"]
+
+    def sync(self) -> dict:
+        params = {"since": self.cursor} if getattr(self, "cursor", None) else {}
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.cursor = response.data["cursor"]
+        return response.data
+
+    def get_tombstones(self, changes: dict) -> list[tuple[str, int, str]]:
+        return [(item["type"], item["id"], item["reason"]) for item in changes["tombstones"]]
+
+    def test_unchanged_workspace_has_no_changes(self):
+        changes = self.sync()
+
+        self.assertEqual(changes["tasks"], [])
+        self.assertEqual(changes["tombstones"], [])
+
+    def test_deleted_task_has_tombstone(self):
+        task_id = self.task.id
+        self.task.delete()
+
+        changes = self.sync()
+
+        self.assertIn(("task", task_id, "deleted"), self.get_tombstones(changes))
+
+    def test_restored_task_is_sent_after_its_tombstone(self):
+        TaskUpdaterService(self.task, {"is_archive": True, "archive_at": timezone.now(), "state": None})()
+        changes = self.sync()
+        self.assertEqual(self.get_tombstones(changes), [("task", self.task.id, "archived")])
+
+        TaskUpdaterService(self.task, {"is_archive": False, "archive_at": None, "state": None})()
+        changes = self.sync()
+
+        self.assertEqual([task["id"] for task in changes["tasks"]], [self.task.id])
+        self.assertEqual(changes["tombstones"], [])
+
+    def test_new_task_resends_project_counters(self):
+        create_task(self.project)
+
+        changes = self.sync()
+
+        self.assertEqual([project["id"] for project in changes["projects"]], [self.project.id])
+        self.assertEqual(Project.objects.get(pk=self.project.pk).active_tasks_count, 2)
+
+    def test_open_transaction_holds_horizon_back(self):
+        started = timezone.now() - timedelta(minutes=1)
+        with mock.patch.object(delta_sync, "connection") as connection:
+            connection.cursor.return_value.__enter__.return_value.fetchone.return_value = (started,)
+
+            self.assertEqual(delta_sync.get_sync_horizon(), started)
@@ -0,0 +1,63 @@
+from django.test import TestCase
+
+from core.tests.factories import create_module, create_project, create_task, create_workspace
+from apps.projects.models.modules import ModuleStateCounter
+from apps.projects.services.module_progress import NO_STATE
+from apps.workspace.constant import TaskStateChoices
+from apps.workspace.models.workspace_config import TaskState
+
+
+class ModuleProgressTests(TestCase):
+
+    def setUp(self):
+        self.workspace = create_workspace()
+        self.project = create_project(self.workspace)
+        self.module = create_module(self.project)
+        self.in_progress = TaskState.objects.create(
+            workspace=self.workspace, name="In progress", type=TaskStateChoices.IN_PROGRESS
+        )
+        self.completed = TaskState.objects.create(
+            workspace=self.workspace, name="Done", type=TaskStateChoices.COMPLETED
+        )
+
+    def get_progress(self, module=None) -> dict[int, int]:
+        counters = ModuleStateCounter.objects.filter(module=module or self.module, tasks_count__gt=0)
+        return dict(counters.values_list("state_type", "tasks_count"))
+
+    def test_created_tasks_are_counted_per_state_type(self):
+        create_task(self.project, module=self.module, state=self.in_progress)
+        create_task(self.project, module=self.module, state=self.in_progress)
+        create_task(self.project, module=self.module)
+        create_task(self.project)
+
+        self.assertEqual(self.get_progress(), {TaskStateChoices.IN_PROGRESS: 2, NO_STATE: 1})
+
+    def test_state_change_moves_task(self):
+        task = create_task(self.project, module=self.module, state=self.in_progress)
+
+        task.state = self.completed
+        task.save(update_fields=["state"])
+
+        self.assertEqual(self.get_progress(), {TaskStateChoices.COMPLETED: 1})
+
+    def test_module_change_moves_task(self):
+        other = create_module(self.project)
+        task = create_task(self.project, module=self.module, state=self.completed)
+
+        task.module = other
+        task.save(update_fields=["module"])
+
+        self.assertEqual(self.get_progress(), {})
+        self.assertEqual(self.get_progress(other), {TaskStateChoices.COMPLETED: 1})
+
+    def test_deleted_task_is_uncounted(self):
+        create_task(self.project, module=self.module, state=self.completed).delete()
+
+        self.assertEqual(self.get_progress(), {})
+
+    def test_deleted_state_leaves_tasks_without_state(self):
+        create_task(self.project, module=self.module, state=self.in_progress)
+
+        self.in_progress.delete()
+
+        self.assertEqual(self.get_progress(), {NO_STATE: 1})
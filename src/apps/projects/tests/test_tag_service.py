@@ -0,0 +1,44 @@
+from django.test import TestCase
+
+from apps.projects.models.tags import TaskTag
+from apps.projects.services.tag_service import TagIdCache, TagService
+
+
+class TagIdCacheTests(TestCase):
+
+    def setUp(self):
+        TagService.ids_cache.clear()
+        self.addCleanup(TagService.ids_cache.clear)
+
+    def get_tag(self, raw_tag: str) -> TaskTag:
+        # The ids get into the cache after the commit
+        with self.captureOnCommitCallbacks(execute=True):
+            return TagService.get_tags_entity_by_string([raw_tag])[0]
+
+    def test_known_tag_is_taken_from_cache(self):
+        tag = self.get_tag("Backend")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_tag("backend").pk, tag.pk)
+
+    def test_deleted_tag_is_created_again(self):
+        tag = self.get_tag("backend")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            TaskTag.objects.filter(pk=tag.pk).delete()
+        new_tag = self.get_tag("backend")
+
+        self.assertNotEqual(new_tag.pk, tag.pk)
+        self.assertTrue(TaskTag.objects.filter(pk=new_tag.pk, name="backend").exists())
+
+    def test_delete_evicts_entries_of_other_processes(self):
+        tag = self.get_tag("backend")
+        other = TagIdCache(maxsize=10)
+        other.get_many([])
+        other.set_many({"backend": tag.pk})
+        self.assertEqual(other.get_many(["backend"]), {"backend": tag.pk})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tag.delete()
+
+        self.assertEqual(other.get_many(["backend"]), {})
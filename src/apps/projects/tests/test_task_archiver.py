@@ -0,0 +1,64 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from core.tests.factories import create_project, create_tasks, create_workspace
+from apps.projects.models.projects import Project
+from apps.projects.models.tasks import Task
+from apps.projects.services.task_archiver import LOCK_KEY, TaskArchiverService
+
+
+class TaskArchiverTests(TestCase):
+
+    def setUp(self):
+        cache.delete(LOCK_KEY)
+        self.workspace = create_workspace()
+        self.project = create_project(self.workspace)
+        now = timezone.now()
+        self.due, self.later, self.unscheduled = create_tasks(self.project, 3)
+        Task._base_manager.filter(pk=self.due.pk).update(archive_at=now - timedelta(minutes=1))
+        Task._base_manager.filter(pk=self.later.pk).update(archive_at=now + timedelta(days=1))
+
+    def get_archived(self) -> set[int]:
+        return set(Task._base_manager.filter(is_archive=True).values_list("id", flat=True))
+
+    def test_due_tasks_are_archived(self):
+        stats = TaskArchiverService()()
+
+        self.assertEqual(stats["archived"], 1)
+        self.assertEqual(self.get_archived(), {self.due.pk})
+
+    def test_archived_tasks_are_counted(self):
+        # Tasks created with one insert are not counted, the counters start from here
+        Project._base_manager.filter(pk=self.project.pk).update(active_tasks_count=3)
+
+        TaskArchiverService()()
+
+        project = Project._base_manager.get(pk=self.project.pk)
+        self.assertEqual((project.active_tasks_count, project.archived_tasks_count), (2, 1))
+
+    def test_disabled_workspace_is_skipped(self):
+        configuration = self.workspace.configuration
+        configuration.archive_completed_task = False
+        configuration.save()
+
+        TaskArchiverService()()
+
+        self.assertEqual(self.get_archived(), set())
+
+    def test_overlapping_run_is_skipped(self):
+        cache.add(LOCK_KEY, "other run", 60)
+        self.addCleanup(cache.delete, LOCK_KEY)
+
+        self.assertEqual(TaskArchiverService()(), {"skipped": True})
+        self.assertEqual(self.get_archived(), set())
+
+    def test_batches_archive_all_due_tasks(self):
+        Task._base_manager.update(archive_at=timezone.now() - timedelta(minutes=1))
+
+        stats = TaskArchiverService(batch_size=2)()
+
+        self.assertEqual(stats["archived"], 3)
+        self.assertEqual(stats["batches"], 2)
@@ -0,0 +1,74 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.models.outbox import OutboxEvent
+from core.tests.factories import add_member, create_project, create_tasks, create_workspace
+from apps.activitylog.services.task_events import TASKS_BULK_UPDATED
+from apps.projects.models.tasks import Task
+from apps.workspace.constant import RoleChoices
+
+
+class TaskBulkUpdatePermissionTests(APITestCase):
+
+    def setUp(self):
+        self.workspace = create_workspace()
+        self.project = create_project(self.workspace)
+        self.tasks = create_tasks(self.project, 3, priority=1)
+        self.manager = add_member(self.workspace, role=RoleChoices.MANAGER)
+
+    def get_url(self, workspace_id, project_id) -> str:
+        return reverse(
+            "api:project-task-bulk-create",
+            kwargs={"workspace_id": workspace_id, "project_id": project_id},
+        )
+
+    def bulk_update(self, user, url, tasks=None):
+        self.client.force_authenticate(user)
+        data = {"tasks": [task.id for task in tasks or self.tasks], "changes": {"priority": 3}}
+        return self.client.patch(url, data, format="json")
+
+    def get_priorities(self, tasks) -> set[int]:
+        return set(Task.objects.filter(id__in=[task.id for task in tasks]).values_list("priority", flat=True))
+
+    def test_manager_updates_tasks(self):
+        response = self.bulk_update(self.manager, self.get_url(self.workspace.id, self.project.id))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"updated": 3})
+        self.assertEqual(self.get_priorities(self.tasks), {3})
+
+    def test_update_publishes_one_event(self):
+        OutboxEvent.objects.all().delete()
+
+        self.bulk_update(self.manager, self.get_url(self.workspace.id, self.project.id))
+
+        event = OutboxEvent.objects.get(topic=TASKS_BULK_UPDATED)
+        self.assertEqual(event.aggregate_id, f"project:{self.project.id}")
+        self.assertEqual(event.payload["changed_tasks"], 3)
+        self.assertEqual(event.payload["changed_fields"], ["priority"])
+
+    def test_member_is_forbidden(self):
+        member = add_member(self.workspace, role=RoleChoices.MEMBER)
+
+        response = self.bulk_update(member, self.get_url(self.workspace.id, self.project.id))
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(self.get_priorities(self.tasks), {1})
+
+    def test_project_of_another_workspace_is_not_found(self):
+        other_project = create_project(create_workspace())
+        other_tasks = create_tasks(other_project, 2, priority=1)
+
+        # A manager of one workspace targets a project of another one
+        response = self.bulk_update(
+            self.manager, self.get_url(self.workspace.id, other_project.id), other_tasks
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.get_priorities(other_tasks), {1})
+
+    def test_missing_project_is_not_found(self):
+        response = self.bulk_update(self.manager, self.get_url(self.workspace.id, 0))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
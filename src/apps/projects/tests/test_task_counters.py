@@ -0,0 +1,70 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from core.tests.factories import add_member, create_project, create_task, create_workspace
+from apps.projects.models.projects import Project
+from apps.projects.models.tasks import Task
+from apps.workspace.models.workspace import Workspace, WorkspaceMember
+
+
+class TaskCountersTests(TestCase):
+
+    def setUp(self):
+        self.workspace = create_workspace()
+        self.project = create_project(self.workspace)
+
+    def assertCounters(self, active: int, archived: int) -> None:
+        for model, pk in ((Project, self.project.pk), (Workspace, self.workspace.pk)):
+            counters = model._base_manager.values_list("active_tasks_count", "archived_tasks_count").get(pk=pk)
+            self.assertEqual(counters, (active, archived), model.__name__)
+
+    def test_created_tasks_are_counted(self):
+        create_task(self.project)
+        create_task(self.project)
+
+        self.assertCounters(active=2, archived=0)
+
+    def test_archived_task_moves_between_counters(self):
+        task = create_task(self.project)
+
+        task.is_archive = True
+        task.save(update_fields=["is_archive"])
+        self.assertCounters(active=0, archived=1)
+
+        task.is_archive = False
+        task.save(update_fields=["is_archive"])
+        self.assertCounters(active=1, archived=0)
+
+    def test_unrelated_save_keeps_counters(self):
+        task = create_task(self.project)
+
+        task.title = "Edited"
+        task.save(update_fields=["title"])
+
+        self.assertCounters(active=1, archived=0)
+
+    def test_deleted_task_is_uncounted(self):
+        create_task(self.project)
+        create_task(self.project, is_archive=True).delete()
+        create_task(self.project).delete()
+
+        self.assertCounters(active=1, archived=0)
+
+    def test_members_are_counted(self):
+        member = add_member(self.workspace)
+        self.assertEqual(Workspace.objects.get(pk=self.workspace.pk).members_count, 2)
+
+        WorkspaceMember.objects.get(workspace=self.workspace, user=member).delete()
+
+        self.assertEqual(Workspace.objects.get(pk=self.workspace.pk).members_count, 1)
+
+    def test_repair_fixes_drifted_counters(self):
+        create_task(self.project)
+        Project._base_manager.filter(pk=self.project.pk).update(active_tasks_count=7)
+        Task._base_manager.filter(project=self.project).update(is_archive=True)
+
+        call_command("repair_task_counters", stdout=StringIO())
+
+        self.assertCounters(active=0, archived=1)
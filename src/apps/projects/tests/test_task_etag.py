@@ -0,0 +1,80 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.tests.factories import create_project, create_task, create_workspace
+from apps.workspace.models.workspace_config import TaskState
+from apps.workspace.models.workspace_user_config import DisplayFilters
+from apps.workspace.services.display_filters import invalidate_display_filters
+
+
+class TaskListETagTests(APITestCase):
+
+    def setUp(self):
+        self.workspace = create_workspace()
+        self.user = self.workspace.owner
+        self.project = create_project(self.workspace)
+        self.task = create_task(self.project, priority=1)
+        self.client.force_authenticate(self.user)
+        kwargs = {"workspace_id": self.workspace.id, "project_id": self.project.id}
+        self.list_url = reverse("api:project-task-list", kwargs=kwargs)
+        self.detail_url = reverse(
+            "api:project-task-detail", kwargs={**kwargs, "task_id": self.task.id}
+        )
+
+    def get_etag(self, url) -> str:
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response["ETag"]
+
+    def test_unchanged_list_is_not_modified(self):
+        etag = self.get_etag(self.list_url)
+
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_edited_task_changes_list_etag(self):
+        etag = self.get_etag(self.list_url)
+
+        self.client.patch(self.detail_url, {"title": "Edited"}, format="json")
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_edited_task_changes_detail_etag(self):
+        etag = self.get_etag(self.detail_url)
+
+        self.client.patch(self.detail_url, {"deadline": "2030-01-01T00:00:00Z"}, format="json")
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_changed_display_filters_change_etag_with_same_rows(self):
+        etag = self.get_etag(self.list_url)
+
+        # The task has priority 1, so it still matches
+        DisplayFilters.objects.filter(
+            user_workspace_config__user=self.user,
+            user_workspace_config__workspace=self.workspace,
+        ).update(priority={"1": True, "2": True, "3": False})
+        invalidate_display_filters(self.user.id, self.workspace.id)
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(len(response.data["results"]), 1)
+
+    def test_renamed_task_state_changes_list_etag(self):
+        state = TaskState.objects.create(workspace=self.workspace, name="Doing")
+        self.task.state = state
+        self.task.save()
+        etag = self.get_etag(self.list_url)
+
+        TaskState.objects.filter(pk=state.pk).update(name="In progress")
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
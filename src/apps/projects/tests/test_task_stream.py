@@ -0,0 +1,34 @@
+import json
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.tests.factories import create_project, create_tasks, create_workspace
+
+NDJSON = "application/x-ndjson"
+
+
+class TaskStreamTests(APITestCase):
+
+    def setUp(self):
+        self.workspace = create_workspace()
+        self.project = create_project(self.workspace)
+        self.tasks = create_tasks(self.project, 3)
+        self.client.force_authenticate(self.workspace.owner)
+        self.kwargs = {"workspace_id": self.workspace.id, "project_id": self.project.id}
+
+    def test_list_streams_ndjson(self):
+        response = self.client.get(reverse("api:project-task-list", kwargs=self.kwargs), HTTP_ACCEPT=NDJSON)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], NDJSON)
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(sorted(json.loads(line)["id"] for line in lines), sorted(task.id for task in self.tasks))
+
+    def test_retrieve_does_not_accept_ndjson(self):
+        url = reverse("api:project-task-detail", kwargs={**self.kwargs, "task_id": self.tasks[0].id})
+
+        response = self.client.get(url, HTTP_ACCEPT=NDJSON)
+
+        self.assertEqual(response.status_code, status.HTTP_406_NOT_ACCEPTABLE)
@@ -1,7 +1,7 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 
-from apps.projects.views import modules, projects, tasks
+from apps.projects.views import modules, projects, sync, tasks
 
 router = DefaultRouter()
 
@@ -55,4 +55,9 @@ urlpatterns = [
         tasks.UnsubscribeUserToTaskView.as_view(),
         name="unsubscribe-tasks",
     ),
+    path(
+        "workspace/<int:workspace_id>/changes",
+        sync.DeltaSyncView.as_view(),
+        name="workspace-changes",
+    ),
 ]
@@ -1,18 +1,22 @@
+from rest_framework.decorators import action
 from rest_framework.viewsets import GenericViewSet
 from rest_framework.mixins import UpdateModelMixin, CreateModelMixin, DestroyModelMixin
 from rest_framework.response import Response
 from rest_framework import status
-from django.db.models import Count, Case, When, IntegerField
+from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
 
-from apps.projects.models.modules import Module
+from apps.projects.models.modules import Module, ModuleStateCounter
 from apps.projects.serializers import modules
 from apps.projects.schema import module_schema
 from apps.workspace.permissions import workspace_permission_by_role
-from apps.workspace.constant import RoleChoices, TaskStateChoices
+from apps.workspace.constant import RoleChoices
+from core.models.functions import TsTzRange
+from core.serializers.ranges import DateWindowSerializer
+from core.views.mixins import ConditionalGetMixin
 
 
 @module_schema
-class ModuleView(GenericViewSet, UpdateModelMixin, CreateModelMixin, DestroyModelMixin):
+class ModuleView(ConditionalGetMixin, GenericViewSet, UpdateModelMixin, CreateModelMixin, DestroyModelMixin):
     http_method_names = ("get", "post", "patch", "delete")
     lookup_url_kwarg = "module_id"
 
@@ -24,16 +28,24 @@ class ModuleView(GenericViewSet, UpdateModelMixin, CreateModelMixin, DestroyMode
                 "project__state",
                 "project__workspace",
                 "workspace__owner__user_avatar",
-            ).annotate(
-                tasks_count=Count("tasks"),
-                completed_tasks_count=Count(
-                    Case(
-                        When(tasks__state__type=TaskStateChoices.COMPLETED, then=1),
-                        output_field=IntegerField(),
-                    )
-                ),
+            ).prefetch_related(
+                "state_counters",
             )
 
+    def get_version_probe(self):
+        modules_queryset = Module.objects.filter(project_id=self.kwargs["project_id"])
+        if self.action == "retrieve":
+            modules_queryset = modules_queryset.filter(pk=self.kwargs["module_id"])
+
+        modules_rows = list(modules_queryset.order_by("id").values_list("id", "updated_at"))
+        counters = list(
+            ModuleStateCounter.objects.filter(module_id__in=[row[0] for row in modules_rows])
+            .order_by("module_id", "state_type")
+            .values_list("module_id", "state_type", "tasks_count")
+        )
+        last_modified = max((row[1] for row in modules_rows if row[1]), default=None)
+        return (modules_rows, counters), last_modified
+
     def get_serializer(self, *args, **kwargs):
         kwargs["context"] = {
             "workspace_id": self.kwargs.get("workspace_id"),
@@ -42,23 +54,52 @@ class ModuleView(GenericViewSet, UpdateModelMixin, CreateModelMixin, DestroyMode
         return super().get_serializer(*args, **kwargs)
 
     def get_serializer_class(self):
-        if self.action in ["list", "retrieve"]:
+        if self.action in ["list", "retrieve", "timeline"]:
             return modules.ModuleReadOnlySerializer
         if self.action in ["update", "partial_update", "create"]:
             return modules.ModuleUpdateCreateSerializer
     
     @workspace_permission_by_role(RoleChoices.MEMBER)
     def list(self, request, *args, **kwargs):
+        not_modified = self.get_not_modified_response(request)
+        if not_modified is not None:
+            return not_modified
+
         modules_queryset = self.get_queryset()
         serializer = self.get_serializer(modules_queryset, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
     
     @workspace_permission_by_role(RoleChoices.MEMBER)
     def retrieve(self, request, *args, **kwargs):
+        not_modified = self.get_not_modified_response(request)
+        if not_modified is not None:
+            return not_modified
+
         module = self.get_object()
         serializer = self.get_serializer(module)
         return Response(serializer.data, status=status.HTTP_200_OK)
     
+    @action(detail=False, methods=["get"], url_path="timeline")
+    @workspace_permission_by_role(RoleChoices.MEMBER)
+    def timeline(self, request, *args, **kwargs):
+        window = DateWindowSerializer(data=request.query_params)
+        window.is_valid(raise_exception=True)
+
+        # Same expression as the `module_dates_gist` index
+        modules_queryset = (
+            self.get_queryset()
+            .annotate(dates=TsTzRange("date_start", "date_end"))
+            .filter(
+                dates__overlap=DateTimeTZRange(
+                    window.validated_data["from"], window.validated_data["to"], "[)"
+                )
+            )
+            .exclude(date_start__isnull=True, date_end__isnull=True)
+            .order_by("date_start", "id")
+        )
+        serializer = self.get_serializer(modules_queryset, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
     @workspace_permission_by_role(RoleChoices.ADMIN)
     def partial_update(self, request, *args, **kwargs):
         return super().partial_update(request, *args, **kwargs)
@@ -3,7 +3,7 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.filters import SearchFilter, OrderingFilter
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Case, When, Count, Q
+from django.db.models import Case, When
 
 from apps.projects.filters import ProjectFilter
 from apps.projects.models.projects import Project
@@ -12,12 +12,16 @@ from apps.projects.schema import project_schema
 from apps.projects.services.projejct_service import ProjectCreatorService, ProjectUpdateService
 from apps.projects.typing import ProjectData
 from apps.workspace.constant import RoleChoices
+from apps.workspace.models.workspace_config import ProjectState
 from apps.workspace.permissions import workspace_permission_by_role
+from core.pagination import KeysetPagination
+from core.views.mixins import ConditionalGetMixin
 
 @project_schema
-class ProjectView(GenericViewSet):
+class ProjectView(ConditionalGetMixin, GenericViewSet):
     http_method_names = ("get", "post", "patch", "delete")
     lookup_url_kwarg = "project_id"
+    pagination_class = KeysetPagination
 
     filter_backends = (
         DjangoFilterBackend,
@@ -53,15 +57,34 @@ class ProjectView(GenericViewSet):
                     When(manager=user, then=True),
                     default=False,
                 ),
-                total_active_tasks=Count(
-                    "tasks", distinct=True, filter=Q(tasks__is_archive=False)
-                ),
-                total_archived_tasks=Count(
-                    "tasks", distinct=True, filter=Q(tasks__is_archive=True)
-                ),
             )
         )
 
+    def get_version_probe(self):
+        projects_queryset = Project.objects.filter(workspace_id=self.kwargs["workspace_id"])
+        if self.action == "retrieve":
+            projects_queryset = projects_queryset.filter(pk=self.kwargs["project_id"])
+
+        # Counters are changed with `update()` and do not touch `updated_at`
+        version = list(
+            projects_queryset.order_by("id").values_list(
+                "id",
+                "updated_at",
+                "manager_id",
+                "state_id",
+                "active_tasks_count",
+                "archived_tasks_count",
+            )
+        )
+        # A renamed state is embedded into the payload but does not touch the project
+        states = list(
+            ProjectState.objects.filter(workspace_id=self.kwargs["workspace_id"])
+            .order_by("id")
+            .values_list("id", "name", "type")
+        )
+        last_modified = max((row[1] for row in version if row[1]), default=None)
+        return (version, states), last_modified
+
     def get_serializer_class(self):
         if self.action in ["update", "partial_update", "create"]:
             return projects.ProjectCreateUpdateSerializer
@@ -70,14 +93,20 @@ class ProjectView(GenericViewSet):
 
     @workspace_permission_by_role(RoleChoices.MEMBER)
     def list(self, request, *args, **kwargs):
-        projects_queryset = self.get_queryset()
-        if not projects:
-            return Response({"detail": "Projects not found"}, status=status.HTTP_200_OK)
+        not_modified = self.get_not_modified_response(request)
+        if not_modified is not None:
+            return not_modified
+
+        projects_queryset = self.paginate_queryset(self.get_queryset())
         serializer = self.get_serializer(projects_queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return self.get_paginated_response(serializer.data)
     
     @workspace_permission_by_role(RoleChoices.MEMBER)
     def retrieve(self, request, *args, **kwargs):
+        not_modified = self.get_not_modified_response(request)
+        if not_modified is not None:
+            return not_modified
+
         project = self.get_object()
         serializer = self.get_serializer(project)
         return Response(serializer.data, status=status.HTTP_200_OK)
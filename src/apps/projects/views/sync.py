@@ -0,0 +1,33 @@
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.views import APIView
+
+from apps.projects.schema import delta_sync_schema
+from apps.projects.services.delta_sync import DeltaSyncService
+from apps.workspace.constant import RoleChoices
+from apps.workspace.permissions import workspace_permission_by_role
+
+
+@delta_sync_schema
+class DeltaSyncView(APIView):
+    http_method_names = ["get"]
+    default_limit = 500
+    max_limit = 2000
+
+    @workspace_permission_by_role(RoleChoices.MEMBER)
+    def get(self, request, workspace_id):
+        changes = DeltaSyncService(
+            workspace_id=workspace_id,
+            user=request.user,
+            since=request.query_params.get("since"),
+            limit=self.get_limit(request),
+            context={"request": request},
+        )()
+        return Response(changes, status=status.HTTP_200_OK)
+
+    def get_limit(self, request) -> int:
+        try:
+            limit = int(request.query_params["limit"])
+        except (KeyError, ValueError):
+            return self.default_limit
+        return min(max(limit, 1), self.max_limit)
@@ -3,10 +3,11 @@ from rest_framework.generics import (
     DestroyAPIView,
     get_object_or_404 as get_object_or_HTTP404,
 )
+from rest_framework.decorators import action
 from rest_framework.viewsets import GenericViewSet
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.filters import OrderingFilter
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
@@ -15,7 +16,9 @@ from django.db.models import (
     Case,
     When,
     BooleanField,
+    Count,
     Exists,
+    Max,
     OuterRef,
     Prefetch,
     Subquery,
@@ -23,12 +26,26 @@ from django.db.models import (
 
 from apps.projects import filters
 from apps.projects.serializers import tasks as srlzr
+from apps.projects.serializers.tasks_lean import (
+    LeanDashboardTaskSerializer,
+    LeanTaskReadOnlySerializer,
+    url_template,
+)
+from apps.projects.models.modules import Module
+from apps.projects.models.projects import Project
 from apps.projects.models.tasks import Task, TaskSubscriber
-from apps.projects.services.task_service import TaskCreatorService, TaskUpdaterService
+from apps.projects.services.task_service import (
+    TaskBulkCreatorService,
+    TaskBulkUpdaterService,
+    TaskCreatorService,
+    TaskUpdaterService,
+)
 from apps.projects.services.tasks_subscribe import (
     SubscribeUserToTaskService,
     UnsubscribeUserToTaskService,
 )
+from apps.projects.services.task_board import TaskBoardService
+from apps.projects.services.task_search import TaskSearchService
 from apps.projects.services.task_transfer import TransferTasksService
 from apps.projects.schema import (
     dashboard_task,
@@ -44,20 +61,31 @@ from apps.projects.typing import TaskData
 from apps.users.models.users import User
 from apps.workspace.constant import RoleChoices
 from apps.workspace.models.workspace import WorkspaceMember
+from apps.workspace.models.workspace_config import TaskState
+from apps.workspace.models.workspace_user_config import UserWorkspaceConfig
+from apps.workspace.services.display_filters import get_display_filters
 from apps.workspace.permissions import workspace_permission_by_role
+from core.pagination import KeysetPagination
+from core.serializers.ranges import DateWindowSerializer
+from core.views.mixins import ConditionalGetMixin, NDJSONStreamingMixin
 
 
 @task_schema
-class TaskViewSet(GenericViewSet):
+class TaskViewSet(ConditionalGetMixin, NDJSONStreamingMixin, GenericViewSet):
     http_method_names = ["get", "patch", "post", "delete"]
     lookup_url_kwarg = "task_id"
+    pagination_class = KeysetPagination
+    default_limit = 20
+    max_limit = 100
 
     def get_serializer_class(self):
-        if self.action in ["list", "retrieve"]:
+        if self.action in ["list", "retrieve", "board", "calendar"]:
             return srlzr.TaskReadOnlySerializer
         elif self.action == "partial_update":
             return srlzr.TaskUpdateSerializer
-        elif self.action == "create":
+        elif self.action == "bulk_update":
+            return srlzr.TaskBulkUpdateSerializer
+        elif self.action in ["create", "bulk_create"]:
             return srlzr.TaskCreateSerializer
 
     def get_task_manager(self):
@@ -110,12 +138,150 @@ class TaskViewSet(GenericViewSet):
 
     @workspace_permission_by_role(RoleChoices.MEMBER)
     def list(self, request, workspace_id, project_id):
-        tasks = self.get_queryset()
-        serializer = srlzr.TaskReadOnlySerializer(tasks, many=True)
+        not_modified = self.get_not_modified_response(request)
+        if not_modified is not None:
+            return not_modified
+
+        tasks = LeanTaskReadOnlySerializer.values(self.filter_by_display_filters(self.get_queryset()))
+        if self.wants_stream(request):
+            return self.stream_response(tasks, LeanTaskReadOnlySerializer)
+
+        tasks = self.paginate_queryset(tasks)
+        serializer = LeanTaskReadOnlySerializer(tasks, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=False, methods=["get"], url_path="board")
+    @workspace_permission_by_role(RoleChoices.MEMBER)
+    def board(self, request, workspace_id, project_id):
+        config = UserWorkspaceConfig.objects.filter(
+            user=request.user, workspace_id=workspace_id
+        ).first() or UserWorkspaceConfig(user=request.user, workspace_id=workspace_id)
+
+        board = TaskBoardService(
+            queryset=self.filter_by_display_filters(self.get_queryset()),
+            config=config,
+            limit=self.get_limit(request),
+            context={**self.get_serializer_context(), "project_id": int(project_id)},
+        )()
+        return Response(board, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["get"], url_path="search")
+    @workspace_permission_by_role(RoleChoices.MEMBER)
+    def search(self, request, workspace_id, project_id):
+        text = request.query_params.get("q", "").strip()
+        if not text:
+            return Response(data={"results": []}, status=status.HTTP_200_OK)
+
+        results = TaskSearchService(
+            queryset=Task._base_manager.filter(project=project_id),
+            text=text,
+            limit=self.get_limit(request),
+        )()
+        return Response(data={"results": results}, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["get"], url_path="calendar")
+    @workspace_permission_by_role(RoleChoices.MEMBER)
+    def calendar(self, request, workspace_id, project_id):
+        window = DateWindowSerializer(data=request.query_params)
+        window.is_valid(raise_exception=True)
+
+        tasks = (
+            self.filter_by_display_filters(self.get_queryset())
+            .filter(
+                deadline__gte=window.validated_data["from"],
+                deadline__lt=window.validated_data["to"],
+            )
+            .order_by("deadline", "id")
+        )
+        serializer = LeanTaskReadOnlySerializer(
+            LeanTaskReadOnlySerializer.values(tasks), many=True, context=self.get_serializer_context()
+        )
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    def get_version_probe(self):
+        project_id = self.kwargs["project_id"]
+        tasks = self.get_task_manager().filter(project=project_id)
+        display_filters = None
+        if self.action == "retrieve":
+            tasks = tasks.filter(pk=self.kwargs["task_id"])
+        else:
+            display_filters = self.get_active_display_filters()
+            if display_filters is not None:
+                tasks = display_filters.apply(tasks, int(project_id))
+
+        probe = tasks.aggregate(last_modified=Max("updated_at"), total=Count("id"))
+        subscriptions = TaskSubscriber.objects.filter(
+            subscriber=self.request.user, task__project=project_id
+        ).aggregate(total=Count("id"), last=Max("id"))
+        # An edit moves `max(updated_at)`, a changed filter spec may keep the same rows count
+        version = (
+            probe["total"],
+            probe["last_modified"].isoformat() if probe["last_modified"] else None,
+            display_filters.to_cache() if display_filters is not None else None,
+            subscriptions["total"],
+            subscriptions["last"],
+            self.get_related_version(),
+        )
+        return version, probe["last_modified"]
+
+    def get_related_version(self):
+        """
+        Versions of the rows embedded into the task payload, renaming a state, a module
+        or the project, or changing a member role does not touch `Task.updated_at`
+        """
+        workspace_id = self.kwargs["workspace_id"]
+        project_id = self.kwargs["project_id"]
+        # Deleting a module or a state sets the task FK to NULL with `update()`
+        modules = Module.objects.filter(project=project_id).aggregate(
+            last_modified=Max("updated_at"), total=Count("id")
+        )
+        states = list(
+            TaskState.objects.filter(workspace_id=workspace_id)
+            .order_by("id")
+            .values_list("id", "name", "type")
+        )
+        memberships = list(
+            WorkspaceMember.objects.filter(workspace_id=workspace_id)
+            .order_by("id")
+            .values_list("id", "user_id", "role")
+        )
+        project_modified = (
+            Project.objects.filter(pk=project_id).values_list("updated_at", flat=True).first()
+        )
+        return (
+            modules["total"],
+            modules["last_modified"].isoformat() if modules["last_modified"] else None,
+            project_modified.isoformat() if project_modified else None,
+            states,
+            memberships,
+        )
+
+    def get_active_display_filters(self):
+        """The saved display filters of the user, None if `?display_filters=0` disables them"""
+        if self.request.query_params.get("display_filters") in ("0", "false"):
+            return None
+        return get_display_filters(self.request.user.id, int(self.kwargs["workspace_id"]))
+
+    def filter_by_display_filters(self, queryset):
+        """Applies the saved display filters of the user, `?display_filters=0` disables them"""
+        display_filters = self.get_active_display_filters()
+        if display_filters is None:
+            return queryset
+        return display_filters.apply(queryset, int(self.kwargs["project_id"]))
+
+    def get_limit(self, request) -> int:
+        try:
+            limit = int(request.query_params["limit"])
+        except (KeyError, ValueError):
+            return self.default_limit
+        return min(max(limit, 1), self.max_limit)
+
     @workspace_permission_by_role(RoleChoices.MANAGER)
     def retrieve(self, request, workspace_id, project_id, task_id=None):
+        not_modified = self.get_not_modified_response(request)
+        if not_modified is not None:
+            return not_modified
+
         task = self.get_object()
         serializer = srlzr.TaskReadOnlySerializer(task)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -151,6 +317,46 @@ class TaskViewSet(GenericViewSet):
             data={"absolute_url": task_absolute_url}, status=status.HTTP_201_CREATED
         )
 
+    @action(detail=False, methods=["post"], url_path="bulk")
+    @workspace_permission_by_role(RoleChoices.MANAGER)
+    def bulk_create(self, request, workspace_id, project_id):
+        serializer = srlzr.TaskCreateSerializer(
+            data=request.data, many=True, max_length=srlzr.TASK_BULK_CREATE_LIMIT
+        )
+        serializer.is_valid(raise_exception=True)
+
+        tasks = TaskBulkCreatorService(
+            project=project_id,
+            workspace=workspace_id,
+            data=[TaskData(**validated_data) for validated_data in serializer.validated_data],
+        )()
+
+        task_url = url_template(
+            "api:project-task-detail", "workspace_id", "project_id", "task_id"
+        )
+        absolute_urls = [
+            task_url.format(workspace_id=workspace_id, project_id=project_id, task_id=task.id)
+            for task in tasks
+        ]
+        return Response(
+            data={"absolute_urls": absolute_urls}, status=status.HTTP_201_CREATED
+        )
+
+    @bulk_create.mapping.patch
+    @workspace_permission_by_role(RoleChoices.MANAGER)
+    def bulk_update(self, request, workspace_id, project_id):
+        serializer = srlzr.TaskBulkUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        project = get_object_or_HTTP404(Project, pk=project_id, workspace_id=workspace_id)
+        updated = TaskBulkUpdaterService(
+            project=project,
+            workspace_id=workspace_id,
+            tasks_ids=serializer.validated_data["tasks"],
+            data=TaskData(**serializer.validated_data["changes"]),
+        )()
+        return Response(data={"updated": updated}, status=status.HTTP_200_OK)
+
     @workspace_permission_by_role(RoleChoices.MANAGER)
     def destroy(self, request, workspace_id, project_id, task_id):
         task = get_object_or_HTTP404(Task, pk=task_id)
@@ -217,13 +423,9 @@ class DashboardTaskView(GenericViewSet):
     filter_backends = (
         DjangoFilterBackend,
         OrderingFilter,
-        SearchFilter,
+        filters.TaskFullTextSearchFilter,
     )
     filterset_class = filters.DashboardTaskFilter
-    search_fields = [
-        "title",
-        "description",
-    ]
     ordering = ("created_at", "priority")
 
     def get_queryset(self):
@@ -239,7 +441,11 @@ class DashboardTaskView(GenericViewSet):
 
     def list(self, request, *args, **kwargs):
         queryset = self.filter_queryset(self.get_queryset())
-        serializer = self.get_serializer(queryset, many=True)
+        serializer = LeanDashboardTaskSerializer(
+            LeanDashboardTaskSerializer.values(queryset),
+            many=True,
+            context=self.get_serializer_context(),
+        )
 
         return Response(serializer.data)
 
@@ -256,6 +462,7 @@ class TransferTaskBetweenModuleView(CreateAPIView):
         message = TransferTasksService(
             tasks_ids=serializer.validated_data["task"],
             module_id=serializer.validated_data["module"],
+            workspace_id=kwargs["workspace_id"],
         )()
 
         headers = self.get_success_headers(serializer.data)
@@ -1,10 +1,12 @@
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.urls import reverse
 from phonenumber_field.modelfields import PhoneNumberField
 from apps.users.managers import CustomUserManager
 from django.db import models
+from django.db.models.functions import Upper
 
 from apps.users.models.profile import Profile
 from apps.users.models.users_settings import UserSettings
@@ -41,6 +43,9 @@ class User(AbstractUser):
 
 
     class Meta:
+        indexes = [
+            GinIndex(OpClass(Upper("username"), name="gin_trgm_ops"), name="user_username_trgm"),
+        ]
         verbose_name = 'User'
         verbose_name_plural = 'Users'
 
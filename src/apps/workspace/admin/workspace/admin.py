@@ -1,7 +1,7 @@
 from typing import Any
 from django.contrib import admin
 from django.db.models.query import QuerySet
-from django.db.models import Count, Q
+from django.db.models import Count, F
 from django.http import HttpRequest
 
 from apps.offers.admin.admin import OfferInline
@@ -31,6 +31,7 @@ class WorkspaceConfigurationInline(admin.TabularInline):
     fields = (
         "archive_completed_task",
         "archive_after",
+        "logs_retention",
     )
 
 
@@ -98,9 +99,9 @@ class WorkspaceAdmin(admin.ModelAdmin):
 
     def get_queryset(self, request: HttpRequest) -> QuerySet[Any]:
         return workspace.Workspace.objects.annotate(
-                total_members=Count("members", distinct=True),
-                total_active_tasks=Count("tasks", distinct=True, filter=Q(tasks__is_archive=False)),
-                total_archived_tasks=Count("tasks", distinct=True, filter=Q(tasks__is_archive=True)),
+                total_members=F("members_count"),
+                total_active_tasks=F("active_tasks_count"),
+                total_archived_tasks=F("archived_tasks_count"),
                 total_projects = Count("projects", distinct=True),
             ).select_related(
                 "owner",
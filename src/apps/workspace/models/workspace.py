@@ -35,6 +35,9 @@ class Workspace(InfoMixin):
         through="WorkspaceMember",
         blank=True,
     )
+    members_count = models.IntegerField(default=0, editable=False)
+    active_tasks_count = models.IntegerField(default=0, editable=False)
+    archived_tasks_count = models.IntegerField(default=0, editable=False)
 
     class Meta:
         verbose_name = "Workspace"
@@ -79,6 +82,7 @@ class WorkspaceMember(models.Model):
         indexes = [
             models.Index(fields=["workspace", "user"]),
             models.Index(fields=["user"]),
+            models.Index(fields=["workspace", "date_joined", "id"]),
         ]
         verbose_name = "Workspace member"
         verbose_name_plural = "Workspace members"
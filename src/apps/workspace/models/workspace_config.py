@@ -12,6 +12,8 @@ class WorkspaceConfiguration(models.Model):
     )
     archive_completed_task = models.BooleanField(default=True)
     archive_after = models.DurationField(default=timedelta(days=3))
+    # Activity logs older than this are removed, `None` keeps them forever
+    logs_retention = models.DurationField(null=True, blank=True, default=timedelta(days=365))
 
     """Add these fields in the future"""
     # workspace_icon = ...
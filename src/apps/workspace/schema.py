@@ -1,4 +1,4 @@
-from drf_spectacular.utils import extend_schema, extend_schema_view
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
 
 from apps.workspace.serializers.workspace_user_config import (
     UserFavoriteCreateSerializer, 
@@ -185,6 +185,21 @@ workspace_logout_schema = extend_schema(
 )
 
 
+typeahead_schema = extend_schema_view(
+
+    get=extend_schema(
+        tags=["Workspace -> Member"],
+        summary="Typeahead for users and tags",
+        description=(
+            "Ranked lookup of workspace members (`kind=users`) or tags used in the workspace "
+            "(`kind=tags`) by a part of the name in `q`. Prefix matches go first, then the "
+            "most similar names. `complete` is false when the lookup did not fit the latency budget."
+        ),
+        parameters=[OpenApiParameter("q", str, OpenApiParameter.QUERY, required=True)],
+    ),
+)
+
+
 reassign_workspace_owner_schema = extend_schema_view(
 
     post=extend_schema(
@@ -8,9 +8,9 @@ from apps.workspace.serializers.workspace_members import MemberSerializer
 class WorkspaceSerializer(InfoSerializerMixin):
     id = serializers.PrimaryKeyRelatedField(read_only=True)
     owner = UserShortSerializer(read_only=True)
-    total_members = serializers.IntegerField(read_only=True)
-    total_active_tasks = serializers.IntegerField(read_only=True)
-    total_archived_tasks = serializers.IntegerField(read_only=True)
+    total_members = serializers.IntegerField(source="members_count", read_only=True)
+    total_active_tasks = serializers.IntegerField(source="active_tasks_count", read_only=True)
+    total_archived_tasks = serializers.IntegerField(source="archived_tasks_count", read_only=True)
     name = serializers.CharField()
     description = serializers.CharField(required=False)
     slug = serializers.SlugField(read_only=True)
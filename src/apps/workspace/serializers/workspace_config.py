@@ -11,6 +11,7 @@ class WorkspaceConfigurationSerializer(serializers.ModelSerializer):
     workspace = serializers.PrimaryKeyRelatedField(read_only=True)
     archive_completed_task = serializers.BooleanField(required=False)
     archive_after = serializers.DurationField(required=False)
+    logs_retention = serializers.DurationField(required=False, allow_null=True)
 
     class Meta:
         model = ProjectState
@@ -19,6 +20,7 @@ class WorkspaceConfigurationSerializer(serializers.ModelSerializer):
             "workspace",
             "archive_completed_task",
             "archive_after",
+            "logs_retention",
         )
 
 
@@ -5,6 +5,7 @@ from apps.projects.serializers.modules import ModuleShortReadOnlySerializer
 from apps.users.serializers.users import UserShortSerializer
 from apps.workspace.models import workspace_user_config as wpuc
 from apps.workspace.serializers.workspace import WorkspaceShortSerializer
+from apps.workspace.services.display_filters import invalidate_display_filters
 from apps.workspace.serializers.workspace_config import TaskStatesSerializer, TaskStatesSerializerLite
 
 
@@ -73,7 +74,9 @@ class UserWorkspaceConfigSerializer(serializers.ModelSerializer):
                 setattr(instance.properties, key, value)
             instance.properties.save()
 
-        return super().update(instance, validated_data)
+        instance = super().update(instance, validated_data)
+        invalidate_display_filters(instance.user_id, instance.workspace_id)
+        return instance
 
 
 class UserFavoriteCreateSerializer(serializers.Serializer):
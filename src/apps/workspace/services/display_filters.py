@@ -0,0 +1,152 @@
+"""
+Server-side display filters.
+
+A user's `DisplayFilters` is spread over a JSON field and four M2M tables. It is compiled
+once into a compact form (id sets and a priority bitmask), which is kept in the cache and
+applied to task querysets. The cache entry is dropped when the user's config is updated,
+and for the whole workspace when a selected state or module is deleted.
+"""
+from dataclasses import dataclass
+
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef, QuerySet
+
+from apps.workspace.models.workspace_user_config import DisplayFilters, UserWorkspaceConfig
+
+CACHE_KEY = "display_filters:v2:{workspace_id}:{user_id}"
+CACHE_TIMEOUT = 60 * 60
+
+
+@dataclass(frozen=True)
+class CompiledDisplayFilters:
+    """
+    An empty id set means that the selection is not filtered. Modules are selected
+    workspace-wide, `modules_projects` are the projects they belong to
+    """
+
+    priority_mask: int = 0
+    states: frozenset[int] = frozenset()
+    assignees: frozenset[int] = frozenset()
+    modules: frozenset[int] = frozenset()
+    created_by: frozenset[int] = frozenset()
+    modules_projects: frozenset[int] = frozenset()
+
+    ALL_PRIORITIES = (1, 2, 3)
+
+    @classmethod
+    def from_cache(cls, data: dict) -> "CompiledDisplayFilters":
+        return cls(
+            priority_mask=data["p"],
+            states=frozenset(data["s"]),
+            assignees=frozenset(data["a"]),
+            modules=frozenset(data["m"]),
+            created_by=frozenset(data["c"]),
+            modules_projects=frozenset(data["mp"]),
+        )
+
+    def to_cache(self) -> dict:
+        return {
+            "p": self.priority_mask,
+            "s": sorted(self.states),
+            "a": sorted(self.assignees),
+            "m": sorted(self.modules),
+            "c": sorted(self.created_by),
+            "mp": sorted(self.modules_projects),
+        }
+
+    @classmethod
+    def priority_mask_of(cls, priority: dict) -> int:
+        mask = 0
+        for value in cls.ALL_PRIORITIES:
+            if priority.get(str(value), True):
+                mask |= 1 << value
+        return mask
+
+    @property
+    def priorities(self) -> list[int] | None:
+        """Selected priorities or None if all of them are selected"""
+        selected = [value for value in self.ALL_PRIORITIES if self.priority_mask & (1 << value)]
+        return None if len(selected) == len(self.ALL_PRIORITIES) else selected
+
+    def apply(self, queryset: QuerySet, project_id: int | None = None) -> QuerySet:
+        """The module selection is ignored in a project none of the selected modules belong to"""
+        from apps.projects.models.tasks import Task
+
+        priorities = self.priorities
+        if priorities is not None:
+            queryset = queryset.filter(priority__in=priorities)
+        if self.states:
+            queryset = queryset.filter(state_id__in=self.states)
+        if self.modules and (project_id is None or project_id in self.modules_projects):
+            queryset = queryset.filter(module_id__in=self.modules)
+        if self.created_by:
+            queryset = queryset.filter(created_by_id__in=self.created_by)
+        if self.assignees:
+            queryset = queryset.filter(
+                Exists(
+                    Task.assignees.through.objects.filter(
+                        task_id=OuterRef("pk"), user_id__in=self.assignees
+                    )
+                )
+            )
+        return queryset
+
+
+def get_cache_key(user_id: int, workspace_id: int) -> str:
+    return CACHE_KEY.format(workspace_id=workspace_id, user_id=user_id)
+
+
+def compile_display_filters(user_id: int, workspace_id: int) -> CompiledDisplayFilters:
+    display_filters = (
+        DisplayFilters.objects.filter(
+            user_workspace_config__user_id=user_id,
+            user_workspace_config__workspace_id=workspace_id,
+        )
+        .values_list("id", "priority")
+        .first()
+    )
+    if display_filters is None:
+        return CompiledDisplayFilters(
+            priority_mask=CompiledDisplayFilters.priority_mask_of({})
+        )
+
+    filters_id, priority = display_filters
+
+    def related_ids(field: str, related_field: str) -> frozenset[int]:
+        through = getattr(DisplayFilters, field).through
+        return frozenset(
+            through.objects.filter(displayfilters_id=filters_id).values_list(
+                related_field, flat=True
+            )
+        )
+
+    return CompiledDisplayFilters(
+        priority_mask=CompiledDisplayFilters.priority_mask_of(priority or {}),
+        states=related_ids("state", "taskstate_id"),
+        assignees=related_ids("assignee", "user_id"),
+        modules=related_ids("module", "module_id"),
+        created_by=related_ids("created_by", "user_id"),
+        modules_projects=related_ids("module", "module__project_id"),
+    )
+
+
+def get_display_filters(user_id: int, workspace_id: int) -> CompiledDisplayFilters:
+    key = get_cache_key(user_id, workspace_id)
+    cached = cache.get(key)
+    if cached is not None:
+        return CompiledDisplayFilters.from_cache(cached)
+
+    compiled = compile_display_filters(user_id, workspace_id)
+    cache.set(key, compiled.to_cache(), CACHE_TIMEOUT)
+    return compiled
+
+
+def invalidate_display_filters(user_id: int, workspace_id: int) -> None:
+    cache.delete(get_cache_key(user_id, workspace_id))
+
+
+def invalidate_workspace_display_filters(workspace_id: int) -> None:
+    users_ids = UserWorkspaceConfig.objects.filter(workspace_id=workspace_id).values_list(
+        "user_id", flat=True
+    )
+    cache.delete_many([get_cache_key(user_id, workspace_id) for user_id in users_ids])
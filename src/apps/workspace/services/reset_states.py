@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Any, Callable
 from django.db.models import Case, When, Value, QuerySet
+from django.utils import timezone
 from rest_framework.exceptions import ValidationError
 
 from core.services.baseservice import BaseService, GetObjectsByIdService
@@ -38,6 +39,7 @@ class ResetProjectsStatesService(BaseService, GetObjectsByIdService):
         """Replaces old states with new ones and deletes the old states"""
 
         Project.objects.filter(workspace=self.workspace).update(
+            updated_at=timezone.now(),
             state_id=Case(
                 *[
                     When(
@@ -85,6 +87,7 @@ class ResetTasksStatesService(BaseService, GetObjectsByIdService):
         """Replaces old states with new ones and deletes the old states"""
 
         Task.objects.filter(workspace=self.workspace).update(
+            updated_at=timezone.now(),
             state_id=Case(
                 *[
                     When(
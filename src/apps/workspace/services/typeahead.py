@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.core.cache import cache
+from django.db import OperationalError, connection, transaction
+from django.db.models import Case, Exists, IntegerField, OuterRef, Q, QuerySet, Value, When
+from django.db.models.functions import Upper
+
+from apps.projects.models.tags import TaskTag
+from apps.projects.models.tasks import Task
+from apps.users.models.users import User
+from apps.users.serializers.users import UserShortSerializer
+from core.services.baseservice import BaseService
+
+
+@dataclass
+class TypeaheadService(BaseService):
+    """
+    Ranked typeahead for the users and the tags of a workspace.
+
+    - Candidates are matched by substring (`UPPER(col) LIKE`) or trigram word similarity
+      on `UPPER(col)`, both served by the `gin_trgm_ops` indexes on the upper-cased
+      column; prefix matches go first, then the most similar ones
+    - The query runs with `statement_timeout` set to the latency budget, a query over
+      the budget returns an incomplete (empty) result instead of a slow one
+    - The top results are cached per workspace and normalized prefix
+
+    Returns `{"results": [...], "complete": bool}`
+    """
+    workspace_id: int
+    kind: str
+    text: str
+
+    KINDS = ("users", "tags")
+    limit = 10
+    latency_budget_ms = 150
+    cache_timeout = 60
+    max_length = 64
+
+    def execute(self) -> dict:
+        prefix = self.normalize(self.text)
+        if not prefix:
+            return {"results": [], "complete": True}
+
+        key = f"typeahead:{self.kind}:{self.workspace_id}:{prefix}"
+        results = cache.get(key)
+        if results is not None:
+            return {"results": results, "complete": True}
+
+        results = self.run_within_budget(prefix)
+        if results is None:
+            return {"results": [], "complete": False}
+
+        cache.set(key, results, self.cache_timeout)
+        return {"results": results, "complete": True}
+
+    def normalize(self, text: str) -> str:
+        return " ".join(text.split()).lower()[: self.max_length]
+
+    def run_within_budget(self, prefix: str) -> list[dict] | None:
+        try:
+            with transaction.atomic():
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT set_config('statement_timeout', %s, true)",
+                        [str(self.latency_budget_ms)],
+                    )
+                if self.kind == "users":
+                    return self.search_users(prefix)
+                return self.search_tags(prefix)
+        except OperationalError:
+            return None
+
+    def rank(self, queryset: QuerySet, field: str, prefix: str) -> QuerySet:
+        # pg_trgm is case-insensitive, so comparing against the upper-cased column keeps
+        # the similarity unchanged while matching the expression the index is built on
+        return (
+            queryset.alias(upper_field=Upper(field))
+            .filter(
+                Q(**{f"{field}__icontains": prefix})
+                | Q(upper_field__trigram_word_similar=prefix.upper())
+            )
+            .annotate(
+                is_prefix=Case(
+                    When(**{f"{field}__istartswith": prefix}, then=Value(1)),
+                    default=Value(0),
+                    output_field=IntegerField(),
+                ),
+                similarity=TrigramWordSimilarity(prefix, field),
+            )
+            .order_by("-is_prefix", "-similarity", field)[: self.limit]
+        )
+
+    def search_users(self, prefix: str) -> list[dict]:
+        users = self.rank(
+            User.objects.filter(workspace_memberships__workspace_id=self.workspace_id),
+            "username",
+            prefix,
+        ).select_related("user_avatar")
+        return UserShortSerializer(users, many=True).data
+
+    def search_tags(self, prefix: str) -> list[dict]:
+        used_in_workspace = Exists(
+            Task.tags.through.objects.filter(
+                tasktag_id=OuterRef("pk"), task__workspace_id=self.workspace_id
+            )
+        )
+        tags = self.rank(TaskTag.objects.filter(used_in_workspace), "name", prefix)
+        return [{"id": tag.id, "name": tag.name} for tag in tags]
@@ -32,7 +32,8 @@ class WorkspaceMemberService(BaseService):
     users_roles: list[dict[User, int]]
 
     def execute(self) -> Any:
-        self.workspace_set_members_with_roles()
+        with transaction.atomic():
+            self.workspace_set_members_with_roles()
 
     def workspace_set_members_with_roles(self) -> None:
         for user_data in self.users_roles:
@@ -0,0 +1,45 @@
+from django.test import TestCase
+
+from core.tests.factories import create_module, create_project, create_task, create_workspace
+from apps.projects.models.tasks import Task
+from apps.workspace.models.workspace_user_config import DisplayFilters
+from apps.workspace.services.display_filters import get_display_filters, invalidate_display_filters
+
+
+class DisplayFiltersModulesTests(TestCase):
+
+    def setUp(self):
+        self.workspace = create_workspace()
+        self.user = self.workspace.owner
+        self.project = create_project(self.workspace)
+        self.module = create_module(self.project)
+        self.task = create_task(self.project, module=self.module)
+        self.other_task = create_task(create_project(self.workspace))
+        self.select_modules(self.module)
+
+    def select_modules(self, *modules):
+        display_filters = DisplayFilters.objects.get(
+            user_workspace_config__user=self.user,
+            user_workspace_config__workspace=self.workspace,
+        )
+        display_filters.module.set(modules)
+        invalidate_display_filters(self.user.id, self.workspace.id)
+
+    def filter_tasks(self, project) -> list[Task]:
+        display_filters = get_display_filters(self.user.id, self.workspace.id)
+        return list(display_filters.apply(Task.objects.filter(project=project), project.id))
+
+    def test_modules_filter_tasks_of_their_project(self):
+        self.assertEqual(self.filter_tasks(self.project), [self.task])
+
+    def test_modules_of_another_project_are_ignored(self):
+        self.assertEqual(self.filter_tasks(self.other_task.project), [self.other_task])
+
+    def test_deleted_module_is_dropped_from_cached_filters(self):
+        create_task(self.project)
+        self.filter_tasks(self.project)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.module.delete()
+
+        self.assertEqual(len(self.filter_tasks(self.project)), 2)
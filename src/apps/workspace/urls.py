@@ -16,6 +16,7 @@ from apps.workspace.views.workspace_config import (
     WorkspaceConfigTaskView,
     WorkspaceConfigurationView,
 )
+from apps.workspace.views.typeahead import TypeaheadView
 from apps.workspace.views.workspace import ReassignWorkspaceOwnerView, WorkspaceView
 
 router = DefaultRouter()
@@ -74,4 +75,9 @@ urlpatterns = [
         WorkspaceConfigurationView.as_view(),
         name="workspace-configuration",
     ),
+    path(
+        "workspace/<int:workspace_id>/typeahead/<str:kind>",
+        TypeaheadView.as_view(),
+        name="workspace-typeahead",
+    ),
 ]
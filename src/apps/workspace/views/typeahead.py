@@ -0,0 +1,25 @@
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.views import APIView
+
+from apps.workspace.permissions import IsWorkspaceMember
+from apps.workspace.schema import typeahead_schema
+from apps.workspace.services.typeahead import TypeaheadService
+
+
+@typeahead_schema
+class TypeaheadView(APIView):
+    permission_classes = [IsWorkspaceMember]
+    http_method_names = ["get"]
+
+    def get(self, request, workspace_id, kind):
+        if kind not in TypeaheadService.KINDS:
+            raise NotFound()
+
+        data = TypeaheadService(
+            workspace_id=workspace_id,
+            kind=kind,
+            text=request.query_params.get("q", ""),
+        )()
+        return Response(data, status=status.HTTP_200_OK)
@@ -1,5 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
-from django.db.models import Count, Q, Prefetch
+from django.db.models import Prefetch
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
@@ -7,7 +7,7 @@ from rest_framework.views import APIView
 
 from apps.workspace.constant import RoleChoices
 from apps.workspace.schema import reassign_workspace_owner_schema, workspace
-from core.views.mixins import BasePermissionByActionView
+from core.views.mixins import BasePermissionByActionView, ConditionalGetMixin
 from apps.workspace.models.workspace import Workspace, WorkspaceMember
 from apps.workspace.serializers import workspace as wp
 from apps.workspace.permissions import IsWorkspaceMember, IsWorkspaceAdmin, IsWorkspaceOwner, workspace_permission_by_role
@@ -18,7 +18,7 @@ from apps.workspace.services.workspace_creator import (
 
 
 @workspace
-class WorkspaceView(BasePermissionByActionView, ModelViewSet):
+class WorkspaceView(ConditionalGetMixin, BasePermissionByActionView, ModelViewSet):
     permission_classes_by_action = {
         "list": [IsAuthenticated],
         "create": [IsAuthenticated],
@@ -33,15 +33,7 @@ class WorkspaceView(BasePermissionByActionView, ModelViewSet):
 
     def get_queryset(self):
         user = self.request.user
-        return Workspace.objects.annotate(
-            total_members=Count("members", distinct=True),
-            total_active_tasks=Count(
-                "tasks", distinct=True, filter=Q(tasks__is_archive=False)
-            ),
-            total_archived_tasks=Count(
-                "tasks", distinct=True, filter=Q(tasks__is_archive=True)
-            ),
-            ).filter(
+        return Workspace.objects.filter(
                 members=user
             ).select_related(
                 "owner__user_avatar",
@@ -53,6 +45,41 @@ class WorkspaceView(BasePermissionByActionView, ModelViewSet):
                 )
             )
 
+    def get_version_probe(self):
+        workspaces = Workspace.objects.filter(members=self.request.user)
+        if self.action == "retrieve":
+            workspaces = workspaces.filter(pk=self.kwargs["workspace_id"])
+
+        workspaces_rows = list(
+            workspaces.order_by("id").values_list(
+                "id",
+                "updated_at",
+                "owner_id",
+                "members_count",
+                "active_tasks_count",
+                "archived_tasks_count",
+            )
+        )
+        memberships = list(
+            WorkspaceMember.objects.filter(workspace_id__in=[row[0] for row in workspaces_rows])
+            .order_by("id")
+            .values_list("id", "user_id", "role")
+        )
+        last_modified = max((row[1] for row in workspaces_rows if row[1]), default=None)
+        return (workspaces_rows, memberships), last_modified
+
+    def list(self, request, *args, **kwargs):
+        not_modified = self.get_not_modified_response(request)
+        if not_modified is not None:
+            return not_modified
+        return super().list(request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        not_modified = self.get_not_modified_response(request)
+        if not_modified is not None:
+            return not_modified
+        return super().retrieve(request, *args, **kwargs)
+
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -11,6 +11,7 @@ from apps.workspace.models.workspace import Workspace, WorkspaceMember
 from apps.workspace.permissions import IsWorkspaceAdmin, IsWorkspaceMember
 from apps.workspace.serializers.workspace_members import MemberSerializer
 from apps.workspace.services.workspace_member import MemberKickService, MemberLogoutService, WorkspaceMemberService
+from core.pagination import KeysetPagination
 
 
 
@@ -23,6 +24,8 @@ class WorkspaceMembersView(BasePermissionByActionView, ModelViewSet):
         "destroy": [IsWorkspaceAdmin],
     }
     serializer_class = MemberSerializer
+    pagination_class = KeysetPagination
+    pagination_ordering = "date_joined"
 
     http_method_names = ("get", "patch", "delete")
 
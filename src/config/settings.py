@@ -21,6 +21,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 ]
 # packages
 INSTALLED_APPS += [
@@ -288,3 +289,10 @@ CACHES = {
         "LOCATION": env.str('CACHE_LOCATION'),
     }
 }
+
+
+"""
+    ===ACTIVITY LOG SETTINGS===
+"""
+# Changes of one field of a task by one user within this many seconds are kept as one log entry
+ACTIVITY_LOG_COALESCE_WINDOW = env.int('ACTIVITY_LOG_COALESCE_WINDOW', default=300)
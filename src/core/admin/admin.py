@@ -1,6 +1,7 @@
 from django.contrib import admin
 
 from core.models.image_keeper import ImageKeeper
+from core.models.outbox import OutboxEvent
 
 
 @admin.register(ImageKeeper)
@@ -21,3 +22,25 @@ class ImageKeeperAdmin(admin.ModelAdmin):
         "updated_at",
         "created_at",
     )
+
+
+@admin.register(OutboxEvent)
+class OutboxEventAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "topic",
+        "aggregate_id",
+        "created_at",
+        "available_at",
+        "attempts",
+    )
+    list_filter = ("topic",)
+    search_fields = ("aggregate_id",)
+    readonly_fields = (
+        "topic",
+        "aggregate_id",
+        "payload",
+        "created_at",
+        "attempts",
+        "last_error",
+    )
@@ -1,6 +1,13 @@
 from django.apps import AppConfig
+from django.db.models.signals import pre_migrate
 
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self) -> None:
+        from core.signals import create_postgres_extensions
+
+        pre_migrate.connect(create_postgres_extensions, sender=self)
+        return super().ready()
@@ -3,7 +3,7 @@
 # See the LICENSE file or visit https://www.gnu.org/licenses/agpl-3.0.html for more information.
 
 # Python imports
-from functools import wraps
+from functools import lru_cache, wraps
 
 # Django imports
 from django.conf import settings
@@ -98,3 +98,11 @@ def invalidate_cache(path=None, url_params=False, user=True, multiple=False):
         return _wrapped_view
 
     return decorator
+
+
+@lru_cache
+def get_redis_client():
+    """Client for the Redis data structures that the cache API does not cover"""
+    from redis import Redis
+
+    return Redis.from_url(settings.CACHES["default"]["LOCATION"])
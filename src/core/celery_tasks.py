@@ -17,4 +17,26 @@ def trace_last_user_request(user_id):
     except User.DoesNotExist:
         pass
 
-    
\ No newline at end of file
+    
+
+"""Management"""
+def create_task_to_relay_outbox_events():
+    from django.utils import timezone
+    from django_celery_beat.models import IntervalSchedule, PeriodicTask
+
+    PeriodicTask.objects.get_or_create(
+        name="Relay_outbox_events",
+        defaults={
+            "task": "relay_outbox_events",
+            "interval": IntervalSchedule.objects.get_or_create(every=2, period="seconds")[0],
+            "start_time": timezone.now(),
+        },
+    )
+
+
+@shared_task(name="relay_outbox_events")
+def relay_outbox_events():
+    """Dispatching the committed domain events to their consumers"""
+    from core.services.outbox import OutboxRelayService
+
+    return OutboxRelayService()()
@@ -0,0 +1,26 @@
+"""Management"""
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core.services.outbox import OutboxRelayService, wait_for_batch
+
+
+class Command(BaseCommand):
+    help = (
+        "Relays the outbox events in a loop. A batch is taken when it holds `--batch-size` "
+        "events or its oldest event is `--max-wait-ms` old."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=200)
+        parser.add_argument("--max-wait-ms", type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        max_wait = options["max_wait_ms"] / 1000
+        while True:
+            wait_for_batch(batch_size, max_wait)
+            stats = OutboxRelayService(batch_size=batch_size, max_batches=1)()
+            if stats["failed"]:
+                self.stderr.write(f"{stats['failed']} outbox events failed")
+            close_old_connections()
@@ -1 +1 @@
-from . import image_keeper
\ No newline at end of file
+from . import image_keeper, outbox
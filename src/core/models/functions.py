@@ -0,0 +1,12 @@
+from django.contrib.postgres.fields import DateTimeRangeField, RangeBoundary
+from django.db.models import Func
+
+
+class TsTzRange(Func):
+    """`tstzrange(lower, upper, '[]')`, a NULL bound makes the range unbounded on that side"""
+
+    function = "TSTZRANGE"
+    output_field = DateTimeRangeField()
+
+    def __init__(self, lower, upper, **extra):
+        super().__init__(lower, upper, RangeBoundary(inclusive_upper=True), **extra)
@@ -0,0 +1,27 @@
+from django.db import models
+from django.utils import timezone
+
+
+class OutboxEvent(models.Model):
+    """Domain event written in the transaction of the change, see `core/services/outbox.py`"""
+
+    topic = models.CharField(max_length=100)
+    # Events of one aggregate, e.g. "task:42", are dispatched in order
+    aggregate_id = models.CharField(max_length=100, blank=True, default="")
+    payload = models.JSONField()
+    created_at = models.DateTimeField(default=timezone.now)
+    available_at = models.DateTimeField(default=timezone.now)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+
+    class Meta:
+        verbose_name = "Outbox event"
+        verbose_name_plural = "Outbox events"
+        ordering = ("id",)
+        indexes = [
+            models.Index(fields=["available_at", "id"]),
+            models.Index(fields=["aggregate_id", "id"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.topic} {self.pk}"
@@ -0,0 +1,154 @@
+import base64
+import json
+from collections import OrderedDict
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """Keyset (cursor) pagination over a stable `(ordering, id)` key.
+
+    - The position of a page is encoded in an opaque cursor: the ordering value
+      and the primary key of the boundary row
+    - A page is fetched with `WHERE (key, id) < (value, pk) ORDER BY key, id LIMIT n`,
+      so every page costs the same as the first one and no COUNT(*) is executed
+    - NULL ordering values are treated as the largest ones, which matches the
+      PostgreSQL default ordering and keeps composite indexes usable
+
+    A view can change the ordering field with the `pagination_ordering` attribute,
+    e.g. `pagination_ordering = "-timestamp"`. The queryset model should have an index
+    on `(<filter fields>, <ordering field>, id)`.
+    """
+
+    ordering = "-created_at"
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+
+        ordering = getattr(view, "pagination_ordering", self.ordering)
+        self.field = ordering.lstrip("-")
+        self.descending = ordering.startswith("-")
+
+        position, reverse = self.decode_cursor(request, queryset.model)
+
+        if position is not None:
+            queryset = queryset.filter(self.get_position_filter(position, reverse))
+        queryset = queryset.order_by(*self.get_ordering(reverse))
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    def get_ordering(self, reverse: bool) -> list[str]:
+        prefix = "-" if self.descending != reverse else ""
+        return [f"{prefix}{self.field}", f"{prefix}pk"]
+
+    def get_position_filter(self, position: tuple, reverse: bool) -> Q:
+        """Rows that go strictly after `position` in the walking direction"""
+        value, pk = position
+        lookup = "lt" if self.descending != reverse else "gt"
+
+        if value is None:
+            equal = Q(**{f"{self.field}__isnull": True})
+            beyond = Q(**{f"{self.field}__isnull": False}) if lookup == "lt" else Q(pk__in=[])
+        else:
+            equal = Q(**{self.field: value})
+            beyond = Q(**{f"{self.field}__{lookup}": value})
+            if lookup == "gt":
+                beyond |= Q(**{f"{self.field}__isnull": True})
+
+        return beyond | (equal & Q(**{f"pk__{lookup}": pk}))
+
+    def get_next_link(self) -> str | None:
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self) -> str | None:
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_key(self, instance) -> tuple:
+        """Supports both model instances and `values()` rows (the row must contain `id`)"""
+        if isinstance(instance, dict):
+            return instance[self.field], instance["id"]
+        return getattr(instance, self.field), instance.pk
+
+    def encode_cursor(self, instance, reverse: bool) -> str:
+        value, pk = self.get_key(instance)
+        if hasattr(value, "isoformat"):
+            value = value.isoformat()
+        payload = json.dumps({"v": value, "pk": pk, "r": int(reverse)})
+        cursor = base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request, model) -> tuple[tuple | None, bool]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None, False
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            field = model._meta.get_field(self.field)
+            value = payload["v"]
+            value = None if value is None else field.to_python(value)
+            pk = model._meta.pk.to_python(payload["pk"])
+            reverse = bool(payload.get("r"))
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+
+        return (value, pk), reverse
@@ -0,0 +1,23 @@
+import json
+
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class NDJSONRenderer(BaseRenderer):
+    """Renders a list as newline-delimited JSON, one object per line"""
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = None
+    encoder_class = JSONEncoder
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        items = data if isinstance(data, list) else [data]
+        return "".join(self.render_line(item) for item in items).encode("utf-8")
+
+    @classmethod
+    def render_line(cls, item) -> str:
+        return json.dumps(item, cls=cls.encoder_class, ensure_ascii=False) + "\n"
@@ -0,0 +1,25 @@
+from datetime import timedelta
+
+from rest_framework import serializers
+
+
+class DateWindowSerializer(serializers.Serializer):
+    """Half-open `[from, to)` window of the calendar and timeline queries"""
+
+    max_window = timedelta(days=93)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        # `from` is a keyword, so the fields are declared here
+        fields["from"] = serializers.DateTimeField()
+        fields["to"] = serializers.DateTimeField()
+        return fields
+
+    def validate(self, attrs):
+        if attrs["to"] <= attrs["from"]:
+            raise serializers.ValidationError({"to": "Must be later than `from`"})
+        if attrs["to"] - attrs["from"] > self.max_window:
+            raise serializers.ValidationError(
+                {"to": f"The window must not be longer than {self.max_window.days} days"}
+            )
+        return attrs
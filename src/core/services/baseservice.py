@@ -1,7 +1,7 @@
 from abc import ABCMeta, abstractmethod
 from collections.abc import Callable
 from typing import Any, get_origin, get_args, get_type_hints
-from django.db import models
+from django.db import models, transaction
 from dataclasses import fields
 from django.db.models import Model
 
@@ -42,12 +42,14 @@ class BaseUpdateService(BaseService):
                 setattr(instance, attr, value)
                 update_fields.append(attr)
 
-        instance.save(update_fields=update_fields)
+        # Rows written by the signals, e.g. outbox events, are committed with the change
+        with transaction.atomic():
+            instance.save(update_fields=update_fields)
 
-        for attr, value in m2m_fields:
-            # if value:
-            field = getattr(instance, attr)
-            field.set(value)
+            for attr, value in m2m_fields:
+                # if value:
+                field = getattr(instance, attr)
+                field.set(value)
 
         return instance
 
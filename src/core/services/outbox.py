@@ -0,0 +1,231 @@
+"""
+Transactional outbox of domain events.
+
+`publish` writes the event into the `OutboxEvent` table in the transaction of the change,
+so an event exists only if the change was committed and a request never waits for the
+broker. The `relay_outbox_events` periodic task drains the table with
+`OutboxRelayService`:
+
+- Events are taken in `id` order, in batches locked with `SELECT ... FOR UPDATE SKIP LOCKED`,
+  so several relays can run side by side without taking the same events
+- Events of one aggregate, e.g. of one task, are dispatched in `id` order. An event waits
+  while an earlier event of its aggregate is pending: retried, locked by another relay or
+  of another topic in the same batch. Events parked after `MAX_ATTEMPTS` do not block
+- Each event is passed to the consumer of its topic in a savepoint. Topics with a batch
+  consumer get all their events of the batch in one call, if the call fails its events
+  are passed one by one to find the failing ones. Dispatched events are deleted in the
+  transaction of the batch, failed ones are retried with a growing delay up to
+  `MAX_ATTEMPTS` times
+- Dispatch contexts are entered around every savepoint and batch contexts around the whole
+  batch, e.g. to keep the rows written by the consumers apart until their savepoint is
+  released and to write them in the transaction of the batch
+
+Consumers are registered with `register_consumer` or `register_batch_consumer` in the
+`ready` method of their app. The `relay_outbox` command runs a relay in a loop, it waits
+for `batch_size` events or until the oldest event is `max_wait` seconds old.
+Delivery is at least once, a consumer may see an event again after a relay crash.
+"""
+import logging
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager, ExitStack
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Exists, Min, OuterRef
+from django.utils import timezone
+
+from core.models.outbox import OutboxEvent
+from core.services.baseservice import BaseService
+
+logger = logging.getLogger(__name__)
+
+consumers: dict[str, Callable[[dict], None]] = {}
+batch_consumers: dict[str, Callable[[list[dict]], None]] = {}
+dispatch_contexts: list[Callable[[], AbstractContextManager]] = []
+batch_contexts: list[Callable[[], AbstractContextManager]] = []
+
+MAX_RETRY_DELAY = timedelta(hours=1)
+# Events failed this many times stay in the table for inspection and are not retried
+MAX_ATTEMPTS = 15
+
+
+def register_consumer(topic: str, consumer: Callable[[dict], None]) -> None:
+    consumers[topic] = consumer
+
+
+def register_batch_consumer(topic: str, consumer: Callable[[list[dict]], None]) -> None:
+    batch_consumers[topic] = consumer
+
+
+def register_dispatch_context(factory: Callable[[], AbstractContextManager]) -> None:
+    if factory not in dispatch_contexts:
+        dispatch_contexts.append(factory)
+
+
+def register_batch_context(factory: Callable[[], AbstractContextManager]) -> None:
+    if factory not in batch_contexts:
+        batch_contexts.append(factory)
+
+
+def publish(topic: str, payload: dict, aggregate_id: str = "") -> OutboxEvent:
+    """Writes the event, must be called in the transaction of the change it describes"""
+    return OutboxEvent.objects.create(topic=topic, payload=payload, aggregate_id=aggregate_id)
+
+
+def get_retry_delay(attempts: int) -> timedelta:
+    return min(timedelta(seconds=2**attempts), MAX_RETRY_DELAY)
+
+
+def get_pending_events():
+    return OutboxEvent.objects.filter(attempts__lt=MAX_ATTEMPTS)
+
+
+def get_due_events():
+    now = timezone.now()
+    # An earlier event of the aggregate waiting for its retry holds the later ones back
+    waiting = (
+        get_pending_events()
+        .filter(aggregate_id=OuterRef("aggregate_id"), id__lt=OuterRef("id"), available_at__gt=now)
+        .exclude(aggregate_id="")
+    )
+    return get_pending_events().filter(~Exists(waiting), available_at__lte=now)
+
+
+def wait_for_batch(batch_size: int, max_wait: float, poll_interval: float = 0.05) -> None:
+    """Waits for `batch_size` due events or until the oldest one is `max_wait` seconds old"""
+    while True:
+        created = list(
+            get_due_events().order_by("id").values_list("created_at", flat=True)[:batch_size]
+        )
+        if len(created) >= batch_size:
+            return
+        if created:
+            remaining = max_wait - (timezone.now() - min(created)).total_seconds()
+            if remaining <= 0:
+                return
+            time.sleep(min(remaining, poll_interval))
+        else:
+            time.sleep(poll_interval)
+
+
+@dataclass
+class OutboxRelayService(BaseService):
+    batch_size: int = 200
+    max_batches: int = 50
+
+    def execute(self) -> dict:
+        stats = {"dispatched": 0, "failed": 0, "batches": 0}
+        while stats["batches"] < self.max_batches:
+            dispatched, failed = self.relay_batch()
+            if not dispatched and not failed:
+                break
+            stats["dispatched"] += dispatched
+            stats["failed"] += failed
+            stats["batches"] += 1
+            if dispatched + failed < self.batch_size:
+                break
+        return stats
+
+    def relay_batch(self) -> tuple[int, int]:
+        now = timezone.now()
+        with transaction.atomic(), ExitStack() as batch:
+            events = list(
+                get_due_events().select_for_update(skip_locked=True).order_by("id")[: self.batch_size]
+            )
+            events = self.get_ready_events(events)
+            if not events:
+                return 0, 0
+            for factory in batch_contexts:
+                batch.enter_context(factory())
+
+            dispatched, failed = [], []
+            singles = []
+            for topic, topic_events in self.group_by_topic(events).items():
+                if topic in batch_consumers and self.dispatch_batch(topic, topic_events):
+                    dispatched += [event.pk for event in topic_events]
+                else:
+                    singles += topic_events
+
+            # The later events of an aggregate wait for its failed event
+            failed_aggregates = set()
+            for event in sorted(singles, key=lambda event: (event.aggregate_id, event.pk)):
+                if event.aggregate_id and event.aggregate_id in failed_aggregates:
+                    continue
+                try:
+                    self.run_dispatch(self.dispatch, event)
+                except Exception as error:
+                    logger.exception("Outbox event %s (%s) failed", event.pk, event.topic)
+                    event.attempts += 1
+                    event.available_at = now + get_retry_delay(event.attempts)
+                    event.last_error = repr(error)
+                    failed.append(event)
+                    failed_aggregates.add(event.aggregate_id)
+                else:
+                    dispatched.append(event.pk)
+
+            OutboxEvent.objects.filter(pk__in=dispatched).delete()
+            OutboxEvent.objects.bulk_update(failed, ["attempts", "available_at", "last_error"])
+        return len(dispatched), len(failed)
+
+    def get_ready_events(self, events: list[OutboxEvent]) -> list[OutboxEvent]:
+        """Events with no earlier pending event of their aggregate outside of the batch"""
+        aggregates = {event.aggregate_id for event in events if event.aggregate_id}
+        if not aggregates:
+            return events
+
+        # Earlier events locked by another relay are not in the batch but still pending
+        first_pending = dict(
+            get_pending_events()
+            .filter(aggregate_id__in=aggregates, id__lt=max(event.pk for event in events))
+            .exclude(pk__in=[event.pk for event in events])
+            .values("aggregate_id")
+            .annotate(first_id=Min("id"))
+            .values_list("aggregate_id", "first_id")
+        )
+        ready, topics, blocked = [], {}, set()
+        for event in events:
+            aggregate = event.aggregate_id
+            if aggregate:
+                if aggregate in blocked or event.pk > first_pending.get(aggregate, event.pk):
+                    continue
+                # Topics are dispatched apart, so an aggregate takes the events of one topic
+                if topics.setdefault(aggregate, event.topic) != event.topic:
+                    blocked.add(aggregate)
+                    continue
+            ready.append(event)
+        return ready
+
+    def group_by_topic(self, events: list[OutboxEvent]) -> dict[str, list[OutboxEvent]]:
+        groups = {}
+        for event in sorted(events, key=lambda event: (event.aggregate_id, event.pk)):
+            groups.setdefault(event.topic, []).append(event)
+        return groups
+
+    def run_dispatch(self, function: Callable, *args) -> None:
+        """Runs the function in a savepoint, inside the registered dispatch contexts"""
+        with ExitStack() as stack:
+            for factory in dispatch_contexts:
+                stack.enter_context(factory())
+            # The contexts are left after the savepoint, so they see whether it was released
+            with transaction.atomic():
+                function(*args)
+
+    def dispatch_batch(self, topic: str, events: list[OutboxEvent]) -> bool:
+        """Returns False if the batch failed and its events must be dispatched one by one"""
+        try:
+            self.run_dispatch(batch_consumers[topic], [event.payload for event in events])
+        except Exception:
+            logger.exception("Outbox batch of %s %s events failed", len(events), topic)
+            return False
+        return True
+
+    def dispatch(self, event: OutboxEvent) -> None:
+        if event.topic in batch_consumers:
+            batch_consumers[event.topic]([event.payload])
+            return
+        consumer = consumers.get(event.topic)
+        if consumer is None:
+            raise LookupError(f"No consumer for the topic {event.topic}")
+        consumer(event.payload)
@@ -0,0 +1,16 @@
+from django.db import connections
+
+# PostgreSQL extensions required by model indexes and lookups
+POSTGRES_EXTENSIONS = ("pg_trgm", "btree_gist")
+
+
+def create_postgres_extensions(sender, using="default", **kwargs):
+    """Creates the extensions before migrations create indexes that depend on them"""
+
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return
+
+    with connection.cursor() as cursor:
+        for extension in POSTGRES_EXTENSIONS:
+            cursor.execute(f"CREATE EXTENSION IF NOT EXISTS {extension}")
@@ -0,0 +1,67 @@
+"""Objects shared by the tests of the apps"""
+import itertools
+
+from django.utils import timezone
+
+from apps.projects.models.modules import Module
+from apps.projects.models.projects import Project
+from apps.projects.models.tasks import Task
+from apps.users.models.users import User
+from apps.workspace.constant import RoleChoices
+from apps.workspace.models.workspace import Workspace
+from apps.workspace.services.workspace_creator import WorkspaceCreator
+from apps.workspace.services.workspace_member import WorkspaceMemberService
+
+sequence = itertools.count()
+
+
+def create_user(**fields) -> User:
+    number = next(sequence)
+    fields.setdefault("username", f"user_{number}")
+    fields.setdefault("email", f"user_{number}@test.local")
+    return User.objects.create_user(**fields)
+
+
+def create_workspace(owner: User | None = None, **fields) -> Workspace:
+    fields.setdefault("name", f"Workspace {next(sequence)}")
+    return WorkspaceCreator(owner=owner or create_user(), **fields)()
+
+
+def add_member(workspace: Workspace, user: User | None = None, role: int = RoleChoices.MEMBER) -> User:
+    user = user or create_user()
+    WorkspaceMemberService(workspace, [{"user": user, "role": role}])()
+    return user
+
+
+def create_project(workspace: Workspace, **fields) -> Project:
+    fields.setdefault("name", f"Project {next(sequence)}")
+    fields.setdefault("manager", workspace.owner)
+    return Project.objects.create(workspace=workspace, **fields)
+
+
+def create_module(project: Project, **fields) -> Module:
+    fields.setdefault("name", f"Module {next(sequence)}")
+    return Module.objects.create(workspace=project.workspace, project=project, **fields)
+
+
+def create_task(project: Project, **fields) -> Task:
+    fields.setdefault("title", f"Task {next(sequence)}")
+    return Task.objects.create(workspace=project.workspace, project=project, **fields)
+
+
+def create_tasks(project: Project, count: int, **fields) -> list[Task]:
+    """Tasks created with one insert, the post_save signals are not sent"""
+    now = timezone.now()
+    return Task.objects.bulk_create(
+        [
+            Task(
+                workspace=project.workspace,
+                project=project,
+                title=f"Task {next(sequence)}",
+                created_at=now,
+                updated_at=now,
+                **fields,
+            )
+            for _ in range(count)
+        ]
+    )
@@ -0,0 +1,83 @@
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from core.models.outbox import OutboxEvent
+from core.services import outbox
+from core.services.outbox import OutboxRelayService, publish
+
+TOPIC = "test.event"
+
+
+class OutboxRelayTests(TestCase):
+
+    def setUp(self):
+        self.received = []
+        patcher = mock.patch.dict(outbox.consumers, {TOPIC: self.consume})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def consume(self, payload: dict) -> None:
+        if payload.get("fail"):
+            raise ValueError("Consumer failed")
+        self.received.append(payload["n"])
+
+    def test_dispatched_events_are_deleted(self):
+        publish(TOPIC, {"n": 1})
+        publish(TOPIC, {"n": 2})
+
+        stats = OutboxRelayService()()
+
+        self.assertEqual(stats["dispatched"], 2)
+        self.assertEqual(self.received, [1, 2])
+        self.assertFalse(OutboxEvent.objects.exists())
+
+    def test_failed_event_is_retried_later(self):
+        event = publish(TOPIC, {"n": 1, "fail": True})
+
+        stats = OutboxRelayService()()
+
+        self.assertEqual(stats["failed"], 1)
+        event.refresh_from_db()
+        self.assertEqual(event.attempts, 1)
+        self.assertGreater(event.available_at, timezone.now())
+        self.assertIn("Consumer failed", event.last_error)
+        # Not due before its retry delay
+        self.assertEqual(OutboxRelayService()(), {"dispatched": 0, "failed": 0, "batches": 0})
+
+    def test_event_is_dispatched_once(self):
+        publish(TOPIC, {"n": 1})
+
+        OutboxRelayService()()
+        OutboxRelayService()()
+
+        self.assertEqual(self.received, [1])
+
+    def test_later_events_of_aggregate_wait_for_failed_one(self):
+        failed = publish(TOPIC, {"n": 1, "fail": True}, aggregate_id="task:1")
+        publish(TOPIC, {"n": 2}, aggregate_id="task:1")
+        publish(TOPIC, {"n": 3}, aggregate_id="task:2")
+
+        OutboxRelayService()()
+
+        self.assertEqual(self.received, [3])
+        self.assertEqual(OutboxEvent.objects.filter(aggregate_id="task:1").count(), 2)
+
+        # The retried event goes first, then the held back one
+        OutboxEvent.objects.filter(pk=failed.pk).update(
+            available_at=timezone.now(), payload={"n": 1}
+        )
+        OutboxRelayService()()
+
+        self.assertEqual(self.received, [3, 1, 2])
+        self.assertFalse(OutboxEvent.objects.exists())
+
+    def test_parked_event_does_not_block_aggregate(self):
+        publish(TOPIC, {"n": 1}, aggregate_id="task:1")
+        OutboxEvent.objects.update(attempts=outbox.MAX_ATTEMPTS)
+        publish(TOPIC, {"n": 2}, aggregate_id="task:1")
+
+        OutboxRelayService()()
+
+        self.assertEqual(self.received, [2])
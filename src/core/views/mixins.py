@@ -1,4 +1,12 @@
 # Description: Custom mixins for views.
+import hashlib
+
+from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from core.renderers import NDJSONRenderer
+
 
 class BasePermissionByActionView:
     """This mixin allows you to set different permissions for different actions in a view."""
@@ -45,4 +53,94 @@ class BasePermissionByHTTPMethod:
             ]
 
         # Use default permission_classes if conditions are not met
-        return [permission() for permission in getattr(self, "permission_classes", [])]
\ No newline at end of file
+        return [permission() for permission in getattr(self, "permission_classes", [])]
+
+
+class NDJSONStreamingMixin:
+    """This mixin allows a list view to stream its queryset as newline-delimited JSON.
+
+    - Enabled by `?stream=1`, `?format=ndjson` or the `Accept: application/x-ndjson` header
+    - Only the actions in `stream_actions` offer the NDJSON renderer, the other ones answer
+      an NDJSON request with 406 Not Acceptable
+    - The queryset is read with a server-side cursor and serialized chunk by chunk,
+      so the worker memory does not depend on the size of the queryset
+    """
+
+    stream_query_param = "stream"
+    stream_chunk_size = 500
+    stream_actions = ("list",)
+
+    def get_renderers(self):
+        renderers = super().get_renderers()
+        if getattr(self, "action", None) in self.stream_actions:
+            renderers.append(NDJSONRenderer())
+        return renderers
+
+    def wants_stream(self, request) -> bool:
+        if request.query_params.get(self.stream_query_param) in ("1", "true"):
+            return True
+        renderer = getattr(request, "accepted_renderer", None)
+        return isinstance(renderer, NDJSONRenderer)
+
+    def stream_response(self, queryset, serializer_class, **serializer_kwargs) -> StreamingHttpResponse:
+        return StreamingHttpResponse(
+            self.iter_ndjson(queryset, serializer_class, **serializer_kwargs),
+            content_type=NDJSONRenderer.media_type,
+        )
+
+    def iter_ndjson(self, queryset, serializer_class, **serializer_kwargs):
+        chunk = []
+        for instance in queryset.iterator(chunk_size=self.stream_chunk_size):
+            chunk.append(instance)
+            if len(chunk) >= self.stream_chunk_size:
+                yield self.render_chunk(chunk, serializer_class, **serializer_kwargs)
+                chunk = []
+        if chunk:
+            yield self.render_chunk(chunk, serializer_class, **serializer_kwargs)
+
+    @staticmethod
+    def render_chunk(chunk, serializer_class, **serializer_kwargs) -> str:
+        data = serializer_class(chunk, many=True, **serializer_kwargs).data
+        return "".join(NDJSONRenderer.render_line(item) for item in data)
+
+
+class ConditionalGetMixin:
+    """This mixin answers conditional GET requests without running the heavy queryset.
+
+    - The view implements `get_version_probe()`, a cheap query that returns a version
+      of the data read by the action and its last modification time,
+      e.g. `max(updated_at)` and the row count
+    - The strong `ETag` is a hash of the probe, the user, the full path and the `Accept` header
+    - An action calls `get_not_modified_response()` first and returns its result if it is not None
+    """
+
+    etag = None
+    last_modified = None
+
+    def get_version_probe(self):
+        raise NotImplementedError("Please implement in the view class")
+
+    def get_not_modified_response(self, request):
+        version, last_modified = self.get_version_probe()
+        payload = repr(
+            (
+                self.__class__.__name__,
+                self.action,
+                request.user.id,
+                request.get_full_path(),
+                request.META.get("HTTP_ACCEPT", ""),
+                version,
+            )
+        )
+        self.etag = quote_etag(hashlib.blake2b(payload.encode(), digest_size=16).hexdigest())
+        self.last_modified = int(last_modified.timestamp()) if last_modified else None
+        # Only the ETag decides: a deleted row changes the version but not `max(updated_at)`
+        return get_conditional_response(request, etag=self.etag)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if self.etag and response.status_code in (200, 304):
+            response["ETag"] = self.etag
+            if self.last_modified:
+                response["Last-Modified"] = http_date(self.last_modified)
+        return response